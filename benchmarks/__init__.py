@@ -0,0 +1,13 @@
+"""
+Benchmarks de performance da API.
+
+Cada módulo pode ser executado diretamente, por exemplo:
+
+    python -m benchmarks.auth_token
+"""
+import os
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'educa.settings.test')
+django.setup()
@@ -0,0 +1,79 @@
+"""
+Compara o custo de autenticação por requisição com e sem o cache de tokens
+verificados. As requisições seguem uma distribuição de Zipf sobre os tokens,
+simulando poucos clientes muito ativos reutilizando o mesmo token.
+
+    python -m benchmarks.auth_token
+"""
+import random
+from time import perf_counter
+
+from django.http import HttpRequest
+from django.test import override_settings
+
+from educa.apps.core.cache import LRUCache
+from educa.apps.user.auth import token as auth_token
+from educa.apps.user.auth.token import AuthBearer, create_jwt_access_token
+from educa.apps.user.models import User
+
+USERS = 1000
+REQUESTS = 20000
+ZIPF_EXPONENT = 1.1
+
+
+def build_workload(seed=42):
+    users = [
+        User(id=index, email=f'user{index}@educa.com', name=f'user {index}')
+        for index in range(1, USERS + 1)
+    ]
+    for user in users:
+        auth_token.user_cache.set(
+            user.id, (auth_token.get_user_stamp(user.id), user), ttl=3600
+        )
+
+    tokens = [create_jwt_access_token(user) for user in users]
+    weights = [1 / rank**ZIPF_EXPONENT for rank in range(1, USERS + 1)]
+    return random.Random(seed).choices(tokens, weights, k=REQUESTS)
+
+
+def run(workload, token_cache):
+    auth_token.token_cache = token_cache
+    auth = AuthBearer()
+
+    start = perf_counter()
+    for token in workload:
+        auth.authenticate(HttpRequest(), token)
+    return perf_counter() - start
+
+
+# O carimbo de cada usuário fica no cache do Django, o limite padrão do
+# LocMemCache (300 entradas) descartaria os carimbos durante o benchmark.
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': USERS * 2},
+        }
+    }
+)
+def main():
+    workload = build_workload()
+    distinct = len(set(workload))
+
+    without_cache = run(workload, LRUCache(maxsize=0))
+    with_cache = run(workload, LRUCache(maxsize=auth_token.TOKEN_CACHE_SIZE))
+
+    print(f'{REQUESTS} requests, {distinct} distinct tokens')
+    for name, elapsed in (
+        ('without cache', without_cache),
+        ('with cache', with_cache),
+    ):
+        print(
+            f'{name:>14}: {elapsed:.3f}s '
+            f'({elapsed / REQUESTS * 1_000_000:.1f}us/request)'
+        )
+    print(f'       speedup: {without_cache / with_cache:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
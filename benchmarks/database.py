@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.test.utils import setup_databases, teardown_databases
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Executa o benchmark no banco de testes dentro de uma transação que é
+    desfeita ao final, assim os dados gerados nunca são persistidos.
+    """
+    old_config = setup_databases(verbosity=0, interactive=False, keepdb=True)
+    try:
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+    finally:
+        teardown_databases(old_config, verbosity=0, keepdb=True)
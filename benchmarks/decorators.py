@@ -0,0 +1,80 @@
+"""
+Mede o custo por requisição dos decoradores permission_object_required e
+validate_generic_model, descontando o tempo do próprio endpoint. A busca do
+objeto no banco é substituída por um objeto já carregado para isolar o
+custo dos decoradores.
+
+    python -m benchmarks.decorators
+"""
+from time import perf_counter
+from unittest import mock
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from ninja import Schema
+
+from educa.apps.core.permissions import (
+    PermissionObjectBase,
+    is_authenticated,
+    permission_object_required,
+)
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.generic.decorator import validate_generic_model
+from educa.apps.lesson.sub_apps.question.models import Question
+from educa.apps.user.models import User
+
+CALLS = 20000
+
+
+class allow(PermissionObjectBase):
+    pass
+
+
+class GenericIn(Schema):
+    object_model: str
+    object_id: int
+
+
+def endpoint(request, rating_id: int = None, data: GenericIn = None):
+    return request
+
+
+SCENARIOS = {
+    'permission_object_required': (
+        permission_object_required(Rating, [allow])(endpoint),
+        {'rating_id': 1},
+    ),
+    'validate_generic_model': (
+        validate_generic_model(
+            [Rating, Question],
+            {Rating: [is_authenticated, allow], Question: [allow]},
+        )(endpoint),
+        {'data': GenericIn(object_model='rating', object_id=1)},
+    ),
+}
+
+
+def run(view, kwargs):
+    request = HttpRequest()
+    request.user = User(id=1)
+    start = perf_counter()
+    for _ in range(CALLS):
+        view(request, **kwargs)
+    return perf_counter() - start
+
+
+def main():
+    with mock.patch.object(QuerySet, 'first', return_value=Rating(id=1)):
+        bare = run(endpoint, SCENARIOS['permission_object_required'][1])
+        results = {
+            name: run(view, kwargs) - bare
+            for name, (view, kwargs) in SCENARIOS.items()
+        }
+
+    print(f'{CALLS} calls per decorator')
+    for name, overhead in results.items():
+        print(f'{name:>26}: {overhead / CALLS * 1_000_000:.1f}us/request')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Compara as estratégias de permissão EXISTS e MEMBERSHIP na listagem de aulas
+de um usuário matriculado em poucos cursos de um catálogo grande, medindo a
+primeira página da listagem como feito pela paginação por cursor.
+
+    python -m benchmarks.permissions
+"""
+from time import perf_counter
+
+from django.db import connection
+from django.http import HttpRequest
+
+from benchmarks.database import benchmark_database
+from educa.apps.core.pagination import get_keyset_ordering
+from educa.apps.core.permissions import (
+    EXISTS,
+    MEMBERSHIP,
+    is_enrolled,
+    permission_object_required,
+)
+from educa.apps.course.models import Course, CourseRelation
+from educa.apps.lesson.models import Lesson
+from educa.apps.module.models import Module
+from educa.apps.user.models import User
+
+COURSES = 500
+LESSONS_PER_COURSE = 100
+STUDENTS = 200
+ENROLLED_COURSES = 3
+REQUESTS = 200
+PAGE_SIZE = 20
+
+
+def build_dataset():
+    users = User.objects.bulk_create(
+        User(email=f'user{index}@educa.com', name=f'user {index}')
+        for index in range(STUDENTS)
+    )
+    courses = Course.objects.bulk_create(
+        Course(title=f'course {index}', slug=f'course-{index}')
+        for index in range(COURSES)
+    )
+    modules = Module.objects.bulk_create(
+        Module(title='module', course=course, order=0) for course in courses
+    )
+    Lesson.objects.bulk_create(
+        Lesson(
+            title='lesson',
+            video='https://youtu.be/0b_dELYuf_I',
+            video_duration_in_seconds=60,
+            course=course,
+            module=module,
+            order=order,
+        )
+        for course, module in zip(courses, modules)
+        for order in range(LESSONS_PER_COURSE)
+    )
+    CourseRelation.objects.bulk_create(
+        CourseRelation(creator=user, course=courses[index * 7 % COURSES])
+        for index, user in enumerate(users[1:])
+    )
+
+    user = users[0]
+    CourseRelation.objects.bulk_create(
+        CourseRelation(creator=user, course=course)
+        for course in courses[-ENROLLED_COURSES:]
+    )
+    courses[-ENROLLED_COURSES - 1].instructors.add(user)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return user
+
+
+def make_view(strategy):
+    @permission_object_required(
+        Lesson, [is_enrolled], many=True, strategy=strategy
+    )
+    def list_lessons(request):
+        query = request.get_lesson_query()
+        return list(
+            query.order_by(*get_keyset_ordering(query))[: PAGE_SIZE + 1]
+        )
+
+    return list_lessons
+
+
+def run(user, strategy):
+    view = make_view(strategy)
+    start = perf_counter()
+    for _ in range(REQUESTS):
+        request = HttpRequest()
+        request.user = user
+        lessons = view(request)
+    return perf_counter() - start, lessons
+
+
+def main():
+    with benchmark_database():
+        user = build_dataset()
+        run(user, EXISTS)
+
+        results = {
+            strategy: run(user, strategy) for strategy in (EXISTS, MEMBERSHIP)
+        }
+
+    exists_lessons = [lesson.id for lesson in results[EXISTS][1]]
+    membership_lessons = [lesson.id for lesson in results[MEMBERSHIP][1]]
+    assert exists_lessons == membership_lessons
+
+    print(
+        f'{COURSES * LESSONS_PER_COURSE} lessons, user in '
+        f'{ENROLLED_COURSES + 1} of {COURSES} courses, {REQUESTS} requests'
+    )
+    for strategy, (elapsed, _) in results.items():
+        print(
+            f'{strategy:>11}: {elapsed:.3f}s '
+            f'({elapsed / REQUESTS * 1000:.2f}ms/request)'
+        )
+    print(f'    speedup: {results[EXISTS][0] / results[MEMBERSHIP][0]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
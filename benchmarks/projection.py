@@ -0,0 +1,102 @@
+"""
+Compara a busca completa da aula feita pelo permission_object_required com a
+busca restrita por only, medindo o tamanho das linhas retornadas pelo banco e
+o tempo das requisições que só precisam do curso da aula.
+
+    python -m benchmarks.projection
+"""
+from secrets import token_hex
+from time import perf_counter
+
+from django.db import connection
+from django.http import HttpRequest
+
+from benchmarks.database import benchmark_database
+from educa.apps.core.permissions import is_enrolled, permission_object_required
+from educa.apps.course.models import Course, CourseRelation
+from educa.apps.lesson.models import Lesson
+from educa.apps.module.models import Module
+from educa.apps.user.models import User
+
+LESSONS = 200
+DESCRIPTION_SIZE = 8000
+REQUESTS = 2000
+
+
+def build_dataset():
+    user = User.objects.create(email='user@educa.com', name='user')
+    course = Course.objects.create(title='course', slug='course')
+    module = Module.objects.create(title='module', course=course)
+    lessons = Lesson.objects.bulk_create(
+        Lesson(
+            title=f'lesson {order}',
+            description=token_hex(DESCRIPTION_SIZE // 2),
+            video='https://youtu.be/0b_dELYuf_I',
+            video_duration_in_seconds=60,
+            course=course,
+            module=module,
+            order=order,
+        )
+        for order in range(LESSONS)
+    )
+    CourseRelation.objects.create(creator=user, course=course)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return user, [lesson.id for lesson in lessons]
+
+
+def make_view(only):
+    @permission_object_required(Lesson, [is_enrolled], only=only)
+    def create_note(request, lesson_id: int):
+        return request.get_lesson().course_id
+
+    return create_note
+
+
+def row_size(query):
+    sql, params = query.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT avg(pg_column_size(sub.*)) FROM ({sql}) sub', params
+        )
+        return cursor.fetchone()[0]
+
+
+def run(user, lesson_ids, only):
+    view = make_view(only)
+    start = perf_counter()
+    for index in range(REQUESTS):
+        request = HttpRequest()
+        request.user = user
+        view(request, lesson_id=lesson_ids[index % len(lesson_ids)])
+    return perf_counter() - start
+
+
+def main():
+    with benchmark_database():
+        user, lesson_ids = build_dataset()
+        run(user, lesson_ids, None)
+
+        sizes = {
+            'full': row_size(Lesson.objects.all()),
+            'only': row_size(Lesson.objects.only('id', 'course', 'order')),
+        }
+        results = {
+            'full': run(user, lesson_ids, None),
+            'only': run(user, lesson_ids, []),
+        }
+
+    print(
+        f'{LESSONS} lessons with {DESCRIPTION_SIZE}-char descriptions, '
+        f'{REQUESTS} requests'
+    )
+    for name, elapsed in results.items():
+        print(
+            f'{name:>5}: {sizes[name]:.0f} bytes/row, {elapsed:.3f}s '
+            f'({elapsed / REQUESTS * 1000:.3f}ms/request)'
+        )
+    print(f'speedup: {results["full"] / results["only"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Compara o filtro por trecho do texto com icontains, que gera
+UPPER(coluna) LIKE e não consegue utilizar índices, com o lookup
+trigram_icontains usado pelo QuestionFilter e NoteFilter, que gera
+coluna ILIKE e utiliza os índices GIN gin_trgm_ops, medindo a primeira página
+da listagem como feito pela paginação por cursor.
+
+    python -m benchmarks.trigram
+
+Com 1.000.000 de perguntas e anotações, Postgres 16.2, 20 requisições:
+
+    question icontains: 1455.98ms/requisição, trigram: 10.27ms (141.8x)
+        note icontains: 1284.62ms/requisição, trigram:  8.51ms (151.0x)
+"""
+from hashlib import md5
+from time import perf_counter
+
+from django.db import connection
+
+from benchmarks.database import benchmark_database
+from educa.apps.core.pagination import get_keyset_ordering
+from educa.apps.course.models import Course
+from educa.apps.lesson.models import Lesson
+from educa.apps.lesson.sub_apps.note.models import Note
+from educa.apps.lesson.sub_apps.note.schema import NoteFilter
+from educa.apps.lesson.sub_apps.question.models import Question
+from educa.apps.lesson.sub_apps.question.schema import QuestionFilter
+from educa.apps.module.models import Module
+from educa.apps.user.models import User
+
+ROWS = 1_000_000
+REQUESTS = 20
+PAGE_SIZE = 20
+# Trecho presente em poucas linhas, o pior caso para a leitura sequencial
+# que precisa percorrer a tabela inteira para preencher a página.
+TERM = md5(str(ROWS // 2).encode()).hexdigest()[4:14].upper()
+
+
+def build_dataset():
+    user = User.objects.create(email='user@educa.com', name='user')
+    course = Course.objects.create(title='course', slug='course')
+    module = Module.objects.create(title='module', course=course)
+    lesson = Lesson.objects.create(
+        title='lesson',
+        video='https://youtu.be/0b_dELYuf_I',
+        video_duration_in_seconds=60,
+        course=course,
+        module=module,
+    )
+    params = [user.id, lesson.id, course.id, ROWS]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {Question._meta.db_table} (
+                created, modified, creator_id, lesson_id, course_id,
+                title, content, answer_count, like_count, dislike_count
+            )
+            SELECT
+                now(), now(), %s, %s, %s,
+                md5(i::text) || ' ' || md5((i * 7)::text), 'content', 0, 0, 0
+            FROM generate_series(1, %s) AS i
+            """,
+            params,
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {Note._meta.db_table} (
+                created, modified, creator_id, lesson_id, course_id,
+                time, note
+            )
+            SELECT
+                now(), now(), %s, %s, %s,
+                '00:01:00', md5(i::text) || ' ' || md5((i * 7)::text)
+            FROM generate_series(1, %s) AS i
+            """,
+            params,
+        )
+        cursor.execute('ANALYZE')
+    return user, course
+
+
+def run(queryset):
+    queryset = queryset.order_by(*get_keyset_ordering(queryset))
+    start = perf_counter()
+    for _ in range(REQUESTS):
+        items = list(queryset[: PAGE_SIZE + 1])
+    return perf_counter() - start, items
+
+
+def main():
+    with benchmark_database():
+        user, course = build_dataset()
+        questions = Question.objects.filter(course=course)
+        notes = Note.objects.filter(creator=user)
+
+        results = {
+            ('question', 'icontains'): run(
+                questions.filter(title__icontains=TERM)
+            ),
+            ('question', 'trigram'): run(
+                QuestionFilter(title=TERM).filter(questions)
+            ),
+            ('note', 'icontains'): run(notes.filter(note__icontains=TERM)),
+            ('note', 'trigram'): run(NoteFilter(note=TERM).filter(notes)),
+        }
+
+    print(f'{ROWS} questions and notes, term {TERM!r}, {REQUESTS} requests')
+    for model in ('question', 'note'):
+        before, items = results[(model, 'icontains')]
+        after, trigram_items = results[(model, 'trigram')]
+        assert items == trigram_items
+        for name, elapsed in (('icontains', before), ('trigram', after)):
+            print(
+                f'{model:>8} {name:>9}: {elapsed:.3f}s '
+                f'({elapsed / REQUESTS * 1000:.2f}ms/request, '
+                f'{len(items)} rows)'
+            )
+        print(f'{model:>8}   speedup: {before / after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
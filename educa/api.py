@@ -7,6 +7,7 @@ from educa.apps.course.sub_apps.rating.api import rating_router
 from educa.apps.generic.api import generic_router
 from educa.apps.lesson.api import lesson_router
 from educa.apps.module.api import module_router
+from educa.apps.search.api import search_router
 from educa.apps.user.api import user_router
 from educa.apps.user.auth.api import auth_router
 from educa.apps.user.auth.expection import InvalidToken
@@ -55,3 +56,4 @@ api.add_router('/lesson/', lesson_router)
 api.add_router('/generic/', generic_router)
 api.add_router('/auth/', auth_router)
 api.add_router('/user/', user_router)
+api.add_router('/search/', search_router)
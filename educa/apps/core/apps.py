@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'educa.apps.core'
+
+    def ready(self):
+        from educa.apps.core import lookups  # noqa: F401
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LRUCache:
+    """
+    Cache em memória do processo limitado a maxsize entradas. Quando cheio
+    remove a entrada utilizada há mais tempo e, caso ttl seja definido, as
+    entradas expiram após ttl segundos.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                return default
+            if expires is not None and expires <= monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float | None = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
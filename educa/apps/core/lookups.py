@@ -0,0 +1,20 @@
+from django.db.models import CharField, TextField
+from django.db.models.lookups import IContains
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramIContains(IContains):
+    """
+    Equivalente ao icontains, mas no Postgres compara a própria coluna com
+    ILIKE ao invés de UPPER(coluna) LIKE, assim a busca por trecho do texto
+    pode utilizar os índices GIN gin_trgm_ops da coluna.
+    """
+
+    lookup_name = 'trigram_icontains'
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        params.extend(rhs_params)
+        return f'{lhs_sql} ILIKE {rhs_sql}', params
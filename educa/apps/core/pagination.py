@@ -0,0 +1,143 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date, datetime, time
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from ninja import Field, Schema
+from ninja.errors import ConfigError, HttpError
+from ninja.pagination import PaginationBase
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _serialize_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f'{value.__class__.__name__} is not cursor serializable')
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, default=_serialize_value, separators=(',', ':'))
+    return urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> list:
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        values = json.loads(urlsafe_b64decode(cursor + padding))
+    except (BinasciiError, UnicodeDecodeError, ValueError):
+        raise HttpError(message='invalid cursor.', status_code=400)
+    if not isinstance(values, list):
+        raise HttpError(message='invalid cursor.', status_code=400)
+    return values
+
+
+def get_keyset_ordering(queryset: QuerySet) -> list[str]:
+    """
+    Retorna a ordenação utilizada para paginar o queryset, sempre terminando
+    com a chave primária para garantir uma ordem total entre os objetos.
+    """
+    query = queryset.query
+    if query.order_by:
+        ordering = list(query.order_by)
+    elif query.default_ordering:
+        ordering = list(query.get_meta().ordering)
+    else:
+        ordering = []
+
+    for field in ordering:
+        if not isinstance(field, str) or '__' in field or field == '?':
+            raise ConfigError(
+                f'keyset pagination does not support ordering by {field!r}.'
+            )
+
+    if not {'pk', 'id', '-pk', '-id'} & set(ordering):
+        ordering.append('pk')
+    return ordering
+
+
+def keyset_filter(ordering: list[str], values: list) -> Q:
+    """
+    Monta a condição que retorna apenas os objetos posteriores ao cursor,
+    equivalente a comparação de tuplas (a, b) > (x, y).
+    """
+    query = Q()
+    for index, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        previous = {
+            previous_field.lstrip('-'): value
+            for previous_field, value in zip(ordering[:index], values)
+        }
+        query |= Q(**previous, **{f'{name}__{lookup}': values[index]})
+    return query
+
+
+def clean_cursor_values(
+    queryset: QuerySet, ordering: list[str], values: list
+) -> list:
+    """
+    Converte os valores do cursor com o to_python do campo de ordenação e
+    aplica os validadores do campo, como o limite dos inteiros do banco,
+    assim um cursor inválido é rejeitado antes de executar a consulta.
+    """
+    meta = queryset.model._meta
+    cleaned = []
+    for field_name, value in zip(ordering, values):
+        name = field_name.lstrip('-')
+        field = meta.pk if name == 'pk' else meta.get_field(name)
+        value = field.to_python(value)
+        if value is not None:
+            field.run_validators(value)
+        cleaned.append(value)
+    return cleaned
+
+
+class CursorPagination(PaginationBase):
+    """
+    Paginação por cursor (keyset) baseada na ordenação do queryset.
+
+    O cursor é opaco para o cliente e guarda os valores dos campos de
+    ordenação do último objeto da página, assim a próxima página é obtida
+    com um filtro indexável ao invés de OFFSET e nenhuma página executa
+    COUNT(*).
+    """
+
+    class Input(Schema):
+        cursor: str | None = None
+        limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+    class Output(Schema):
+        items: list[Any]
+        next: str | None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, pagination: Input, **params: Any
+    ) -> Any:
+        ordering = get_keyset_ordering(queryset)
+        queryset = queryset.order_by(*ordering)
+
+        if pagination.cursor is not None:
+            values = decode_cursor(pagination.cursor)
+            if len(values) != len(ordering):
+                raise HttpError(message='invalid cursor.', status_code=400)
+            try:
+                values = clean_cursor_values(queryset, ordering, values)
+                queryset = queryset.filter(keyset_filter(ordering, values))
+            except (TypeError, ValueError, ValidationError):
+                raise HttpError(message='invalid cursor.', status_code=400)
+
+        items = list(queryset[: pagination.limit + 1])
+        next_cursor = None
+        if len(items) > pagination.limit:
+            items = items[: pagination.limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, field.lstrip('-')) for field in ordering]
+            )
+
+        return {'items': items, 'next': next_cursor}
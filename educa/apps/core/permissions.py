@@ -2,11 +2,11 @@ from functools import wraps
 from typing import Callable
 
 from django.core.exceptions import PermissionDenied
-from django.db.models import Exists, Model, OuterRef, Q
+from django.db.models import Exists, Model, OuterRef, Q, Value
 from django.http import Http404
 
-from educa.apps.core.utils import get_attribute_from_endpoint
-from educa.apps.course.models import Course
+from educa.apps.core.utils import compile_attribute_getter
+from educa.apps.course.models import Course, CourseRelation
 from educa.apps.user.auth.expection import InvalidToken
 
 
@@ -23,7 +23,93 @@ def permission_required(permissions: list[Callable]):
     return wrapper
 
 
+EXISTS = 'exists'
+MEMBERSHIP = 'membership'
+
+ROLE_ANNOTATIONS = {
+    'instructor': 'user_is_instructor',
+    'student': 'user_is_enrolled',
+}
+
+
+def get_course_membership(request) -> dict[str, set[int]]:
+    """
+    Retorna os ids dos cursos em que o usuário é instrutor e dos cursos em
+    que está matriculado. Os ids são buscados com uma única consulta e
+    guardados na requisição.
+    """
+    membership = getattr(request, '_course_membership', None)
+    if membership is None:
+        user_id = request.user.id
+        instructor = (
+            Course.instructors.through.objects.filter(user_id=user_id)
+            .annotate(role=Value('instructor'))
+            .values_list('course_id', 'role')
+        )
+        student = (
+            CourseRelation.objects.filter(creator_id=user_id)
+            .annotate(role=Value('student'))
+            .values_list('course_id', 'role')
+        )
+        membership = {'instructor': set(), 'student': set()}
+        for course_id, role in instructor.union(student, all=True):
+            membership[role].add(course_id)
+        setattr(request, '_course_membership', membership)
+    return membership
+
+
+def get_cached_course_roles(request) -> dict[int, dict[str, bool]]:
+    """
+    Cache da requisição com os papéis do usuário já verificados em cada
+    curso, no formato {id do curso: {'instructor': bool, 'student': bool}}.
+    """
+    roles = getattr(request, '_course_roles', None)
+    if roles is None:
+        roles = {}
+        setattr(request, '_course_roles', roles)
+    return roles
+
+
+def has_course_role(request, course_id: int, role: str) -> bool:
+    """
+    Verifica se o usuário tem o papel no curso consultando primeiro os dados
+    já carregados na requisição, o banco só é consultado uma vez por curso.
+    """
+    membership = getattr(request, '_course_membership', None)
+    if membership is not None:
+        return course_id in membership[role]
+
+    roles = get_cached_course_roles(request).setdefault(course_id, {})
+    if role not in roles:
+        user = request.user
+        roles.update(
+            Course.objects.filter(id=course_id)
+            .annotate(
+                instructor=Exists(
+                    user.instructors_courses.filter(id=OuterRef('id'))
+                ),
+                student=Exists(
+                    user.enrolled_courses.filter(id=OuterRef('id'))
+                ),
+            )
+            .values('instructor', 'student')
+            .first()
+            or {'instructor': False, 'student': False}
+        )
+    return roles[role]
+
+
 class PermissionObjectBase:
+    """
+    Base das permissões de objeto.
+
+    A estratégia EXISTS verifica a permissão com subconsultas na própria
+    consulta do objeto, enquanto MEMBERSHIP busca uma vez por requisição os
+    cursos do usuário e verifica a permissão pelos ids do curso.
+    """
+
+    strategy = EXISTS
+
     def __init__(self, request, endpoint, many, model, *args, **kwargs):
         self.request = request
         self.endpoint = endpoint
@@ -32,6 +118,14 @@ class PermissionObjectBase:
         self.args = args
         self.kwargs = kwargs
 
+    @classmethod
+    def get_required_fields(cls, model: type[Model]) -> list[str]:
+        """
+        Campos do objeto utilizados pela permissão, sempre carregados quando
+        o endpoint restringe os campos buscados com only.
+        """
+        return []
+
     def compose_query(self, query):
         return query
 
@@ -46,29 +140,58 @@ def permission_object_required(
     id_kwarg: str = None,
     many: bool = False,
     extra_query: Callable = None,
+    strategy: str = EXISTS,
+    only: list[str] = None,
 ):
+    """
+    Busca o objeto (ou o queryset quando many é verdadeiro) do endpoint e
+    verifica as permissões, disponibilizando o resultado em
+    request.get_<modelo>() ou request.get_<modelo>_query().
+
+    Endpoints que utilizam poucos campos do objeto podem informar only com
+    os campos necessários, assim apenas eles, o id e os campos exigidos
+    pelas permissões são buscados no banco.
+    """
+    object_name = model._meta.object_name.lower()
+    id_kwarg = id_kwarg if id_kwarg else f'{object_name}_id'
+    getter_name = f'get_{object_name}_query' if many else f'get_{object_name}'
+    not_found_message = 'No %s matches the given query.' % object_name
+    if only is not None:
+        # OrderedModel lê os campos de order_with_respect_to ao instanciar o
+        # objeto, caso estejam adiados cada instância faria uma nova consulta.
+        only = {
+            'id',
+            *only,
+            *getattr(model, 'get_order_with_respect_to', tuple)(),
+        }
+        for permission in permissions:
+            only.update(permission.get_required_fields(model))
+
     def wrapper(func):
+        get_object_id = compile_attribute_getter(func, id_kwarg)
+
         @wraps(func)
         def inner(request, *args, **kwargs):
-            nonlocal id_kwarg
-            object_name = model._meta.object_name.lower()
-            id_kwarg = id_kwarg if id_kwarg else f'{object_name}_id'
-
             permissions_init = [
                 permission(
                     request, func, many, model, id_kwarg, *args, **kwargs
                 )
                 for permission in permissions
             ]
+            for permission in permissions_init:
+                permission.strategy = strategy
 
             if many:
                 query = model.objects.all()
             else:
-                object_id = get_attribute_from_endpoint(kwargs, id_kwarg)
+                object_id = get_object_id(kwargs)
                 if object_id is None:
                     return func(request, *args, **kwargs)
                 query = model.objects.filter(id=object_id)
 
+            if only is not None:
+                query = query.only(*only)
+
             for permission in permissions_init:
                 query = permission.compose_query(query)
 
@@ -78,13 +201,12 @@ def permission_object_required(
             if not many:
                 obj = query.first()
                 if obj is None:
-                    raise Http404(
-                        'No %s matches the given query.' % object_name
-                    )
-                [permission.check(obj) for permission in permissions_init]
-                setattr(request, f'get_{object_name}', lambda: obj)
+                    raise Http404(not_found_message)
+                for permission in permissions_init:
+                    permission.check(obj)
+                setattr(request, getter_name, lambda: obj)
             else:
-                setattr(request, f'get_{object_name}_query', lambda: query)
+                setattr(request, getter_name, lambda: query)
 
             return func(request, *args, **kwargs)
 
@@ -104,37 +226,88 @@ def is_authenticated(request, *args, **kwargs):
 
 
 class is_course_instructor(PermissionObjectBase):
+    @classmethod
+    def get_required_fields(cls, model):
+        return ['id'] if model == Course else ['course']
+
+    @property
+    def ref_name(self):
+        return 'id' if self.model == Course else 'course_id'
+
     def annotate(self, query):
-        ref_name = 'id' if self.model == Course else 'course_id'
         query = query.annotate(
             user_is_instructor=Exists(
                 self.request.user.instructors_courses.filter(
-                    id=OuterRef(ref_name)
+                    id=OuterRef(self.ref_name)
                 )
             )
         )
         return query
 
+    def get_course_ids(self):
+        return get_course_membership(self.request)['instructor']
+
+    def use_cached_roles(self):
+        """
+        Quando outro decorador da requisição já verificou os papéis do
+        usuário, o objeto é buscado sem as subconsultas e a verificação
+        utiliza o cache da requisição.
+        """
+        return not self.many and bool(
+            getattr(self.request, '_course_roles', None)
+        )
+
     def compose_query(self, query):
+        if self.strategy == MEMBERSHIP:
+            if self.many:
+                query = query.filter(
+                    **{f'{self.ref_name}__in': self.get_course_ids()}
+                )
+            return query
+
+        if self.use_cached_roles():
+            return query
+
         query = self.annotate(query)
         if self.many:
             query = query.filter(user_is_instructor=True)
         return query
 
+    def has_role(self, obj, role):
+        course_id = getattr(obj, self.ref_name)
+        if self.strategy == MEMBERSHIP:
+            get_course_membership(self.request)
+        else:
+            roles = get_cached_course_roles(self.request)
+            for cached_role, annotation in ROLE_ANNOTATIONS.items():
+                if hasattr(obj, annotation):
+                    roles.setdefault(course_id, {})[cached_role] = getattr(
+                        obj, annotation
+                    )
+        return has_course_role(self.request, course_id, role)
+
+    def is_instructor(self, obj):
+        return self.has_role(obj, 'instructor')
+
     def check(self, obj):
-        is_instructor = getattr(obj, 'user_is_instructor', False)
-        if not is_instructor:
+        if not self.is_instructor(obj):
             raise PermissionDenied
 
 
 class is_enrolled(is_course_instructor):
+    def get_course_ids(self):
+        membership = get_course_membership(self.request)
+        return membership['instructor'] | membership['student']
+
     def compose_query(self, query):
-        ref_name = 'id' if self.model == Course else 'course_id'
+        if self.strategy == MEMBERSHIP or self.use_cached_roles():
+            return super().compose_query(query)
+
         query = self.annotate(query)
         query = query.annotate(
             user_is_enrolled=Exists(
                 self.request.user.enrolled_courses.filter(
-                    id=OuterRef(ref_name)
+                    id=OuterRef(self.ref_name)
                 )
             )
         )
@@ -144,14 +317,19 @@ class is_enrolled(is_course_instructor):
             )
         return query
 
+    def is_student(self, obj):
+        return self.has_role(obj, 'student')
+
     def check(self, obj):
-        is_student = getattr(obj, 'user_is_enrolled', False)
-        is_instructor = getattr(obj, 'user_is_instructor', False)
-        if not is_student and not is_instructor:
+        if not self.is_student(obj) and not self.is_instructor(obj):
             raise PermissionDenied
 
 
 class is_creator_object(PermissionObjectBase):
+    @classmethod
+    def get_required_fields(cls, model):
+        return ['creator']
+
     def compose_query(self, query):
         if self.many:
             query = query.filter(creator=self.request.user)
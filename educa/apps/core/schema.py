@@ -33,3 +33,7 @@ class PermissionDeniedObjectCreator(Schema):
 
 class InvalidGenericModel(Schema):
     detail: str = 'invalid generic model.'
+
+
+class InvalidCursor(Schema):
+    detail: str = 'invalid cursor.'
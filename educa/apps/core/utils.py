@@ -1,3 +1,7 @@
+import inspect
+from functools import partial
+from typing import Any, Callable
+
 from ninja import FilterSchema, Schema
 
 
@@ -14,3 +18,41 @@ def get_attribute_from_endpoint(endpoint_kwargs, attribute_name):
         data = get_data_from_endpoint(endpoint_kwargs)
         object_id = getattr(data, attribute_name, None)
     return object_id
+
+
+def compile_attribute_getter(
+    func: Callable, attribute_name: str
+) -> Callable[[dict], Any]:
+    """
+    Equivalente a get_attribute_from_endpoint, mas resolve uma única vez pela
+    assinatura do endpoint onde o atributo é recebido, evitando percorrer os
+    argumentos a cada requisição.
+    """
+    parameters = inspect.signature(func).parameters
+    schema_name = next(
+        (
+            name
+            for name, parameter in parameters.items()
+            if inspect.isclass(parameter.annotation)
+            and issubclass(parameter.annotation, Schema)
+            and not issubclass(parameter.annotation, FilterSchema)
+        ),
+        None,
+    )
+
+    if schema_name is None:
+        if attribute_name in parameters:
+            return lambda endpoint_kwargs: endpoint_kwargs.get(attribute_name)
+        return partial(
+            get_attribute_from_endpoint, attribute_name=attribute_name
+        )
+
+    def getter(endpoint_kwargs):
+        value = endpoint_kwargs.get(attribute_name)
+        if value is None:
+            value = getattr(
+                endpoint_kwargs.get(schema_name), attribute_name, None
+            )
+        return value
+
+    return getter
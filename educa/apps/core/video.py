@@ -1,7 +1,16 @@
 from django.core.exceptions import ValidationError
-from pytube import YouTube
+from pytube import YouTube, extract
 from pytube.exceptions import RegexMatchError
 
+STUB_VIDEO_LENGTH = 300
+
+
+def get_video_id(video_url):
+    try:
+        return extract.video_id(video_url)
+    except (TypeError, RegexMatchError):
+        raise ValidationError('invalid youtube video')
+
 
 def get_video_length(video_url):
     try:
@@ -9,3 +18,12 @@ def get_video_length(video_url):
         return video.length
     except (TypeError, RegexMatchError):
         raise ValidationError('invalid youtube video')
+
+
+def get_stub_video_length(video_url):
+    """
+    Resolvedor utilizado nos testes que não realiza nenhuma requisição,
+    retornando sempre STUB_VIDEO_LENGTH para urls válidas.
+    """
+    get_video_id(video_url)
+    return STUB_VIDEO_LENGTH
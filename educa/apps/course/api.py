@@ -1,16 +1,20 @@
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
 from ninja.errors import HttpError
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
     is_course_instructor,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedInstructor,
 )
+from educa.apps.course.api_progress import course_progress_router
 from educa.apps.course.api_relation import course_relation_router
 from educa.apps.course.models import Course
 from educa.apps.course.schema import (
@@ -32,6 +36,7 @@ course_router.add_router('/rating/', rating_router)
 course_router.add_router('/category/', category_router)
 course_router.add_router('/message/', message_router)
 course_router.add_router('/relation/', course_relation_router)
+course_router.add_router('/progress/', course_progress_router)
 
 
 def _validate_instructors_and_categories(data):
@@ -71,7 +76,7 @@ def create_course(request, data: CourseIn):
     course = Course.objects.create(**course_data)
     course.instructors.add(*[request.user.id, *instructors])
     course.categories.add(*categories)
-    return course
+    return Course.objects.for_listing().get(id=course.id)
 
 
 @course_router.get(
@@ -85,18 +90,22 @@ def create_course(request, data: CourseIn):
     },
 )
 def get_course(request, course_id: int):
-    return get_object_or_404(Course, id=course_id)
+    return get_object_or_404(Course.objects.for_listing(), id=course_id)
 
 
 @course_router.get(
     '',
-    response=list[CourseOut],
+    response={
+        200: list[CourseOut],
+        400: InvalidCursor,
+    },
     tags=['Curso'],
     summary='Lista todos os cursos',
     description='Endpoint que retorna uma lista de todos os cursos disponíveis. Os filtros devem ser passados separados por virgulas caso haja mais de um valor.',
 )
+@paginate(CursorPagination)
 def list_courses(request, filters: CourseFilter = Query(...)):
-    return filters.filter(Course.objects.all()).distinct()
+    return filters.filter(Course.objects.for_listing()).distinct()
 
 
 @course_router.delete(
@@ -132,7 +141,11 @@ def delete_course(request, course_id: int):
         403: PermissionDeniedInstructor,
     },
 )
-@permission_object_required(Course, [is_course_instructor])
+@permission_object_required(
+    model=Course,
+    permissions=[is_course_instructor],
+    extra_query=lambda query: query.for_listing(),
+)
 def update_course(request, course_id: int, data: CourseUpdate):
     course = request.get_course()
 
@@ -150,4 +163,7 @@ def update_course(request, course_id: int, data: CourseUpdate):
     ).items():
         setattr(course, key, value)
     course.save()
+
+    if categories is not None or instructors is not None:
+        return Course.objects.for_listing().get(id=course.id)
     return course
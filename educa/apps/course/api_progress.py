@@ -0,0 +1,70 @@
+from ninja import Router
+
+from educa.apps.core.permissions import is_enrolled, permission_object_required
+from educa.apps.core.schema import (
+    NotAuthenticated,
+    NotFound,
+    PermissionDeniedEnrolled,
+)
+from educa.apps.course.models import Course, CourseProgress, CourseRelation
+from educa.apps.course.progress import get_courses_progress
+from educa.apps.course.schema import (
+    CourseProgressOut,
+    CourseProgressSummaryOut,
+)
+from educa.apps.user.auth.token import AuthBearer
+
+course_progress_router = Router(auth=AuthBearer())
+
+
+@course_progress_router.get(
+    'summary',
+    tags=['Progresso Curso'],
+    summary='Listar o resumo do progresso nos cursos',
+    description='Endpoint para listar a porcentagem de conclusão do usuário em cada curso a partir do progresso materializado, sem detalhar os módulos.',
+    response={
+        200: list[CourseProgressSummaryOut],
+        401: NotAuthenticated,
+    },
+)
+def list_course_progress_summary(request):
+    return CourseProgress.objects.filter(user=request.user).order_by(
+        'course_id'
+    )
+
+
+@course_progress_router.get(
+    '{int:course_id}',
+    tags=['Progresso Curso'],
+    summary='Retornar o progresso em um curso',
+    description='Endpoint para retornar o progresso do usuário nas aulas e questionários de um curso e de cada um dos seus módulos.',
+    response={
+        200: CourseProgressOut,
+        401: NotAuthenticated,
+        403: PermissionDeniedEnrolled,
+        404: NotFound,
+    },
+)
+@permission_object_required(Course, [is_enrolled])
+def get_course_progress(request, course_id: int):
+    [progress] = get_courses_progress(request.user, [course_id])
+    return progress
+
+
+@course_progress_router.get(
+    '',
+    tags=['Progresso Curso'],
+    summary='Listar o progresso em todos os cursos',
+    description='Endpoint para listar o progresso do usuário em todos os cursos em que está matriculado.',
+    response={
+        200: list[CourseProgressOut],
+        401: NotAuthenticated,
+    },
+)
+def list_course_progress(request):
+    course_ids = list(
+        CourseRelation.objects.filter(creator=request.user)
+        .order_by('course_id')
+        .values_list('course_id', flat=True)
+    )
+    return get_courses_progress(request.user, course_ids)
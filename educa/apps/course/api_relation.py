@@ -1,7 +1,14 @@
 from django.shortcuts import get_object_or_404
 from ninja import Router
+from ninja.pagination import paginate
 
-from educa.apps.core.schema import DuplicatedObject, NotAuthenticated, NotFound
+from educa.apps.core.pagination import CursorPagination
+from educa.apps.core.schema import (
+    DuplicatedObject,
+    InvalidCursor,
+    NotAuthenticated,
+    NotFound,
+)
 from educa.apps.course.models import Course, CourseRelation
 from educa.apps.course.schema import (
     CourseRelationIn,
@@ -54,9 +61,11 @@ def get_course_relation(request, course_id: int):
     description='Endpoint para listar todos os relacionamentos do usuários com cursos.',
     response={
         200: list[CourseRelationOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
+@paginate(CursorPagination)
 def list_course_relations(request):
     return CourseRelation.objects.filter(creator=request.user)
 
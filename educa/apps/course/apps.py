@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CourseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'educa.apps.course'
+
+    def ready(self):
+        from educa.apps.course import signals  # noqa: F401
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from educa.apps.course.models import Course
+from educa.apps.course.stats import rebuild_course_stats
+
+
+class Command(BaseCommand):
+    help = 'Recalcula do zero as estatísticas de todos os cursos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        course_ids = Course.objects.order_by('id').values_list('id', flat=True)
+
+        rebuilt, last_id = 0, 0
+        while batch := list(course_ids.filter(id__gt=last_id)[:batch_size]):
+            with transaction.atomic():
+                rebuild_course_stats(batch)
+            rebuilt += len(batch)
+            last_id = batch[-1]
+
+        self.stdout.write(f'{rebuilt} course stats rebuilt.')
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from educa.apps.course.models import CourseRelation
+from educa.apps.course.progress import rebuild_course_progress
+
+
+class Command(BaseCommand):
+    help = 'Recalcula o progresso de todos os usuários em seus cursos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        relations = CourseRelation.objects.exclude(creator=None).order_by('id')
+
+        reconciled, last_id = 0, 0
+        while batch := list(
+            relations.filter(id__gt=last_id).values_list(
+                'id', 'creator_id', 'course_id'
+            )[:batch_size]
+        ):
+            with transaction.atomic():
+                rebuild_course_progress(
+                    [(user_id, course_id) for _, user_id, course_id in batch]
+                )
+            reconciled += len(batch)
+            last_id = batch[-1][0]
+
+        self.stdout.write(f'{reconciled} course progress reconciled.')
@@ -0,0 +1,77 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_course_stats(apps, schema_editor):
+    """
+    Calcula as estatísticas dos cursos já existentes com as mesmas
+    agregações de educa.apps.course.stats.rebuild_course_stats. A
+    quantidade de quizzes é preenchida em 0005_courseprogress, que adiciona
+    o campo.
+    """
+    Course = apps.get_model('course', 'Course')
+    CourseRelation = apps.get_model('course', 'CourseRelation')
+    CourseStats = apps.get_model('course', 'CourseStats')
+    Rating = apps.get_model('rating', 'Rating')
+    Lesson = apps.get_model('lesson', 'Lesson')
+
+    stats = {
+        course_id: CourseStats(course_id=course_id)
+        for course_id in Course.objects.values_list('id', flat=True)
+    }
+    ratings = Rating.objects.values('course_id').annotate(
+        rating_count=Count('id'), rating_sum=Sum('rating')
+    )
+    students = CourseRelation.objects.values('course_id').annotate(
+        student_count=Count('id')
+    )
+    lessons = Lesson.objects.values('course_id').annotate(
+        lesson_count=Count('id'),
+        total_video_duration=Coalesce(Sum('video_duration_in_seconds'), 0),
+    )
+    for row in [*ratings, *students, *lessons]:
+        course_stats = stats[row.pop('course_id')]
+        for field, value in row.items():
+            setattr(course_stats, field, value)
+
+    CourseStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0003_courserelation_done'),
+        ('lesson', '0004_alter_lesson_video_duration_in_seconds'),
+        ('rating', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseStats',
+            fields=[
+                (
+                    'course',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='stats',
+                        serialize=False,
+                        to='course.course',
+                    ),
+                ),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.FloatField(default=0)),
+                ('student_count', models.PositiveIntegerField(default=0)),
+                ('lesson_count', models.PositiveIntegerField(default=0)),
+                (
+                    'total_video_duration',
+                    models.PositiveIntegerField(default=0),
+                ),
+            ],
+        ),
+        migrations.RunPython(fill_course_stats, migrations.RunPython.noop),
+    ]
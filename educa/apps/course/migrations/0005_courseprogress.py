@@ -0,0 +1,81 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_quiz_count(apps, schema_editor):
+    """
+    Preenche a quantidade de quizzes das estatísticas criadas em
+    0004_coursestats.
+    """
+    CourseStats = apps.get_model('course', 'CourseStats')
+    Quiz = apps.get_model('quiz', 'Quiz')
+    quizzes = (
+        Quiz.objects.filter(course_id=OuterRef('course_id'))
+        .order_by()
+        .values('course_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    CourseStats.objects.update(quiz_count=Coalesce(Subquery(quizzes), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('course', '0004_coursestats'),
+        ('quiz', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursestats',
+            name='quiz_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_quiz_count, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='CourseProgress',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('lessons_done', models.PositiveIntegerField(default=0)),
+                ('quizzes_done', models.PositiveIntegerField(default=0)),
+                ('percent', models.FloatField(default=0)),
+                (
+                    'course',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='users_progress',
+                        to='course.course',
+                    ),
+                ),
+                (
+                    'user',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='courses_progress',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='courseprogress',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'course'), name='unique course progress'
+            ),
+        ),
+    ]
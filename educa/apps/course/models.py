@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -6,6 +8,63 @@ from educa.apps.course.sub_apps.category.models import Category
 from educa.apps.user.models import User
 
 
+class CourseQuerySet(models.QuerySet):
+    # Relações muitos para muitos cujos ids são carregados por for_listing,
+    # com o atributo em que a lista de ids é guardada.
+    LISTING_RELATIONS = {
+        'categories': 'category_ids',
+        'instructors': 'instructor_ids',
+    }
+    _load_relation_ids = False
+
+    def for_listing(self):
+        """
+        Pré-carrega as estatísticas e apenas os ids das categorias e
+        instrutores utilizados na serialização do curso, lidos direto das
+        tabelas intermediárias, sem juntar as tabelas de categorias e
+        usuários e sem uma consulta por curso.
+        """
+        clone = self.select_related('stats')
+        clone._load_relation_ids = True
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._load_relation_ids = self._load_relation_ids
+        return clone
+
+    def _fetch_all(self):
+        loaded = self._result_cache is not None
+        super()._fetch_all()
+        if (
+            not loaded
+            and self._load_relation_ids
+            and self._iterable_class is models.query.ModelIterable
+        ):
+            self._prefetch_relation_ids(self._result_cache)
+
+    def _prefetch_relation_ids(self, courses):
+        if not courses:
+            return
+        course_ids = [course.id for course in courses]
+        for name, attname in self.LISTING_RELATIONS.items():
+            field = self.model._meta.get_field(name)
+            source = f'{field.m2m_field_name()}_id'
+            target = f'{field.m2m_reverse_field_name()}_id'
+            rows = (
+                field.remote_field.through.objects.filter(
+                    **{f'{source}__in': course_ids}
+                )
+                .order_by(target)
+                .values_list(source, target)
+            )
+            related_ids = {course_id: [] for course_id in course_ids}
+            for course_id, related_id in rows:
+                related_ids[course_id].append(related_id)
+            for course in courses:
+                setattr(course, attname, related_ids[course.id])
+
+
 class Course(ContentBase, TimeStampedBase):
     """
     Este modelo representa as inforamções do curso.
@@ -29,12 +88,18 @@ class Course(ContentBase, TimeStampedBase):
         Category,
         related_name='categories_courses',
     )
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = CourseQuerySet.as_manager()
 
     def __str__(self):
         return f'Course({self.title})'
 
     class Meta:
         ordering = ['id']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='course_search_vector_idx')
+        ]
 
 
 class CourseRelation(CreatorBase, TimeStampedBase):
@@ -51,3 +116,67 @@ class CourseRelation(CreatorBase, TimeStampedBase):
                 fields=('creator', 'course'), name='unique course relation'
             )
         ]
+
+
+class CourseStats(models.Model):
+    """
+    Estatísticas agregadas do curso, mantidas de forma incremental a cada
+    alteração de avaliações, matrículas e aulas do curso.
+
+    Fields:
+        rating_sum: soma das notas, utilizada para calcular a média.
+        total_video_duration: soma da duração dos vídeos das aulas em
+        segundos.
+    """
+
+    course = models.OneToOneField(
+        Course,
+        related_name='stats',
+        on_delete=models.CASCADE,
+        primary_key=True,
+    )
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.FloatField(default=0)
+    student_count = models.PositiveIntegerField(default=0)
+    lesson_count = models.PositiveIntegerField(default=0)
+    quiz_count = models.PositiveIntegerField(default=0)
+    total_video_duration = models.PositiveIntegerField(default=0)
+
+    @property
+    def rating_average(self):
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 2)
+
+    def __str__(self):
+        return f'CourseStats({self.course_id})'
+
+
+class CourseProgress(models.Model):
+    """
+    Progresso materializado do usuário no curso, atualizado de forma
+    incremental sempre que uma aula ou questionário muda de estado.
+
+    Fields:
+        percent: porcentagem de aulas e questionários concluídos.
+    """
+
+    user = models.ForeignKey(
+        User, related_name='courses_progress', on_delete=models.CASCADE
+    )
+    course = models.ForeignKey(
+        Course, related_name='users_progress', on_delete=models.CASCADE
+    )
+    lessons_done = models.PositiveIntegerField(default=0)
+    quizzes_done = models.PositiveIntegerField(default=0)
+    percent = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=('user', 'course'), name='unique course progress'
+            )
+        ]
+
+    def __str__(self):
+        return f'CourseProgress({self.user_id}) - Course({self.course_id})'
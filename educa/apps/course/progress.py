@@ -0,0 +1,275 @@
+from django.db import transaction
+from django.db.models import (
+    Count,
+    Exists,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from educa.apps.course.models import (
+    CourseProgress,
+    CourseRelation,
+    CourseStats,
+)
+from educa.apps.course.stats import rebuild_course_stats
+from educa.apps.lesson.models import Lesson, LessonRelation
+from educa.apps.module.models import Module
+from educa.apps.module.sub_apps.quiz.models import Quiz, QuizRelation
+from educa.apps.user.models import User
+
+PROGRESS_FIELDS = [
+    'lessons_total',
+    'lessons_done',
+    'quizzes_total',
+    'quizzes_done',
+]
+
+
+def _count(queryset):
+    """
+    Subconsulta que conta os objetos do módulo externo, retornando 0 quando
+    o módulo não possui nenhum.
+    """
+    count = (
+        queryset.filter(module_id=OuterRef('id'))
+        .order_by()
+        .values('module_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    return Coalesce(Subquery(count, output_field=IntegerField()), 0)
+
+
+def get_percent(done: int, total: int) -> float:
+    if not total:
+        return 0
+    return round(min(done, total) / total * 100, 2)
+
+
+def get_courses_progress(user: User, course_ids: list[int]) -> list[dict]:
+    """
+    Calcula o progresso do usuário nas aulas e questionários de cada módulo
+    dos cursos com uma única consulta anotada sobre os módulos, o progresso do
+    curso é a soma do progresso dos seus módulos.
+
+    Returns:
+        lista com o progresso de cada curso, na ordem de course_ids.
+    """
+    lessons_done = Lesson.objects.filter(
+        Exists(
+            LessonRelation.objects.filter(
+                lesson_id=OuterRef('id'), creator=user, done=True
+            )
+        )
+    )
+    quizzes_done = Quiz.objects.filter(
+        Exists(
+            QuizRelation.objects.filter(
+                quiz_id=OuterRef('id'), creator=user, done=True
+            )
+        )
+    )
+    modules = (
+        Module.objects.filter(course_id__in=course_ids)
+        .annotate(
+            lessons_total=_count(Lesson.objects.all()),
+            lessons_done=_count(lessons_done),
+            quizzes_total=_count(Quiz.objects.all()),
+            quizzes_done=_count(quizzes_done),
+        )
+        .order_by('course_id', 'order')
+        .values('id', 'course_id', *PROGRESS_FIELDS)
+    )
+
+    progress = {
+        course_id: {
+            'course_id': course_id,
+            **dict.fromkeys(PROGRESS_FIELDS, 0),
+            'modules': [],
+        }
+        for course_id in course_ids
+    }
+    for module in modules:
+        course_progress = progress[module['course_id']]
+        for field in PROGRESS_FIELDS:
+            course_progress[field] += module[field]
+        course_progress['modules'].append(
+            {
+                'module_id': module['id'],
+                **{field: module[field] for field in PROGRESS_FIELDS},
+                'percent': get_percent(
+                    module['lessons_done'] + module['quizzes_done'],
+                    module['lessons_total'] + module['quizzes_total'],
+                ),
+            }
+        )
+
+    for course_progress in progress.values():
+        course_progress['percent'] = get_percent(
+            course_progress['lessons_done'] + course_progress['quizzes_done'],
+            course_progress['lessons_total']
+            + course_progress['quizzes_total'],
+        )
+    return list(progress.values())
+
+
+def get_courses_total(course_ids) -> dict[int, tuple[int, int]]:
+    """
+    Retorna o total de aulas e questionários de cada curso a partir das
+    estatísticas, calculando as estatísticas dos cursos que ainda não as
+    possuem.
+    """
+    course_ids = set(course_ids)
+    stats = CourseStats.objects.filter(course_id__in=course_ids).values_list(
+        'course_id', 'lesson_count', 'quiz_count'
+    )
+    totals = {
+        course_id: (lesson_count, quiz_count)
+        for course_id, lesson_count, quiz_count in stats
+    }
+    missing = course_ids - totals.keys()
+    if missing:
+        rebuild_course_stats(list(missing))
+        totals.update(
+            (course_id, (lesson_count, quiz_count))
+            for course_id, lesson_count, quiz_count in stats.filter(
+                course_id__in=missing
+            )
+        )
+    return totals
+
+
+def _update_courses_done(progress: list[CourseProgress]):
+    """
+    Marca como concluídos os cursos com 100% de progresso e desmarca os que
+    deixaram de ter, por exemplo quando uma aula é adicionada ao curso.
+    """
+    done, not_done = Q(), Q()
+    for obj in progress:
+        query = Q(creator_id=obj.user_id, course_id=obj.course_id)
+        if obj.percent >= 100:
+            done |= query
+        else:
+            not_done |= query
+    if done:
+        CourseRelation.objects.filter(done, done=False).update(done=True)
+    if not_done:
+        CourseRelation.objects.filter(not_done, done=True).update(done=False)
+
+
+def rebuild_course_progress(pairs: list[tuple[int, int]]):
+    """
+    Recalcula do zero o progresso dos pares (usuário, curso) informados com
+    uma consulta agregada para aulas, uma para questionários e uma para os
+    totais de cada curso.
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return
+    user_ids = {user_id for user_id, _ in pairs}
+    course_ids = {course_id for _, course_id in pairs}
+
+    lessons_done = (
+        LessonRelation.objects.filter(
+            done=True,
+            creator_id__in=user_ids,
+            lesson__course_id__in=course_ids,
+        )
+        .values_list('creator_id', 'lesson__course_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    quizzes_done = (
+        QuizRelation.objects.filter(
+            done=True,
+            creator_id__in=user_ids,
+            quiz__course_id__in=course_ids,
+        )
+        .values_list('creator_id', 'quiz__course_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    lessons = {
+        (user_id, course_id): count
+        for user_id, course_id, count in lessons_done
+    }
+    quizzes = {
+        (user_id, course_id): count
+        for user_id, course_id, count in quizzes_done
+    }
+    totals = get_courses_total(course_ids)
+
+    progress = []
+    for user_id, course_id in pairs:
+        done = lessons.get((user_id, course_id), 0)
+        done += quizzes.get((user_id, course_id), 0)
+        progress.append(
+            CourseProgress(
+                user_id=user_id,
+                course_id=course_id,
+                lessons_done=lessons.get((user_id, course_id), 0),
+                quizzes_done=quizzes.get((user_id, course_id), 0),
+                percent=get_percent(done, sum(totals.get(course_id, (0, 0)))),
+            )
+        )
+
+    CourseProgress.objects.bulk_create(
+        progress,
+        update_conflicts=True,
+        unique_fields=['user', 'course'],
+        update_fields=['lessons_done', 'quizzes_done', 'percent'],
+    )
+    _update_courses_done(progress)
+
+
+def rebuild_course_users_progress(course_id: int):
+    """
+    Recalcula o progresso já materializado de todos os usuários do curso,
+    utilizado quando o total de aulas ou questionários do curso muda.
+    """
+    rebuild_course_progress(
+        CourseProgress.objects.filter(course_id=course_id).values_list(
+            'user_id', 'course_id'
+        )
+    )
+
+
+def update_course_progress(
+    user_id: int, course_id: int, lessons_done: int = 0, quizzes_done: int = 0
+):
+    """
+    Soma as aulas e questionários concluídos ao progresso do usuário no curso
+    e recalcula a porcentagem, marcando o curso como concluído ao chegar em
+    100% e desmarcando abaixo disso. Os valores ficam entre 0 e o total do curso mesmo que estejam
+    desatualizados. Caso o progresso ainda não exista ele é calculado a
+    partir do banco.
+    """
+    if not lessons_done and not quizzes_done:
+        return
+
+    with transaction.atomic():
+        progress = (
+            CourseProgress.objects.select_for_update()
+            .filter(user_id=user_id, course_id=course_id)
+            .first()
+        )
+        if progress is None:
+            rebuild_course_progress([(user_id, course_id)])
+            return
+
+        lesson_count, quiz_count = get_courses_total([course_id])[course_id]
+        progress.lessons_done = min(
+            max(progress.lessons_done + lessons_done, 0), lesson_count
+        )
+        progress.quizzes_done = min(
+            max(progress.quizzes_done + quizzes_done, 0), quiz_count
+        )
+        progress.percent = get_percent(
+            progress.lessons_done + progress.quizzes_done,
+            lesson_count + quiz_count,
+        )
+        progress.save()
+        _update_courses_done([progress])
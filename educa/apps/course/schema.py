@@ -17,6 +17,15 @@ class CourseIn(Schema):
     is_published: bool = False
 
 
+class CourseStatsOut(Schema):
+    rating_average: float | None
+    rating_count: int
+    student_count: int
+    lesson_count: int
+    quiz_count: int
+    total_video_duration: int
+
+
 class CourseOut(Schema):
     id: int
     title: str
@@ -29,6 +38,7 @@ class CourseOut(Schema):
     categories: list[int]
     instructors: list[int]
     is_published: bool = False
+    stats: CourseStatsOut | None
     created: datetime
     modified: datetime
 
@@ -36,13 +46,21 @@ class CourseOut(Schema):
     def convert_datetime(cls, value: datetime):
         return value.isoformat()
 
+    @staticmethod
+    def resolve_stats(obj):
+        return getattr(obj, 'stats', None)
+
     @staticmethod
     def resolve_categories(obj):
-        return [category.id for category in obj.categories.all()]
+        if hasattr(obj, 'category_ids'):
+            return obj.category_ids
+        return obj.categories.order_by('id').values_list('id', flat=True)
 
     @staticmethod
     def resolve_instructors(obj):
-        return [instructor.id for instructor in obj.instructors.all()]
+        if hasattr(obj, 'instructor_ids'):
+            return obj.instructor_ids
+        return obj.instructors.order_by('id').values_list('id', flat=True)
 
 
 class CourseFilter(FilterSchema):
@@ -91,3 +109,29 @@ class CourseRelationOut(Schema):
 
 class CourseRelationUpdate(Schema):
     done: bool
+
+
+class ModuleProgressOut(Schema):
+    module_id: int
+    lessons_total: int
+    lessons_done: int
+    quizzes_total: int
+    quizzes_done: int
+    percent: float
+
+
+class CourseProgressOut(Schema):
+    course_id: int
+    lessons_total: int
+    lessons_done: int
+    quizzes_total: int
+    quizzes_done: int
+    percent: float
+    modules: list[ModuleProgressOut]
+
+
+class CourseProgressSummaryOut(Schema):
+    course_id: int
+    lessons_done: int
+    quizzes_done: int
+    percent: float
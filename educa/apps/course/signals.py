@@ -0,0 +1,176 @@
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from educa.apps.course.models import Course, CourseRelation, CourseStats
+from educa.apps.course.progress import rebuild_course_users_progress
+from educa.apps.course.stats import (
+    STATS_CONTRIBUTION_FIELDS,
+    get_stats_contribution,
+    update_course_stats,
+)
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.lesson.models import Lesson
+from educa.apps.module.sub_apps.quiz.models import Quiz
+
+STATS_SENDERS = [Rating, CourseRelation, Lesson, Quiz]
+
+
+@receiver(post_save, sender=Course)
+def create_course_stats(sender, instance, created, **kwargs):
+    if created:
+        CourseStats.objects.create(course=instance)
+
+
+def load_previous_stats(sender, instance, **kwargs):
+    """
+    Guarda a contribuição anterior do objeto para que a atualização aplique
+    apenas a diferença nas estatísticas do curso.
+    """
+    instance._previous_stats = None
+    if instance._state.adding:
+        return
+    # OrderedModel lê os campos de order_with_respect_to ao instanciar o
+    # objeto, por isso eles também são carregados.
+    query = (
+        sender.objects.filter(pk=instance.pk)
+        .order_by()
+        .only(
+            'course',
+            *STATS_CONTRIBUTION_FIELDS[sender],
+            *getattr(sender, 'get_order_with_respect_to', tuple)(),
+        )
+    )
+    previous = next(iter(query), None)
+    if previous is not None:
+        instance._previous_stats = (
+            previous.course_id,
+            get_stats_contribution(previous),
+        )
+
+
+def apply_stats(sender, instance, **kwargs):
+    previous = getattr(instance, '_previous_stats', None)
+    current = get_stats_contribution(instance)
+
+    if previous is None:
+        update_course_stats(instance.course_id, **current)
+        return
+
+    course_id, contribution = previous
+    if course_id == instance.course_id:
+        update_course_stats(
+            course_id,
+            **{
+                field: value - contribution[field]
+                for field, value in current.items()
+            },
+        )
+    else:
+        update_course_stats(
+            course_id,
+            create=False,
+            **{field: -value for field, value in contribution.items()},
+        )
+        update_course_stats(instance.course_id, **current)
+
+
+def remove_stats(sender, instance, **kwargs):
+    update_course_stats(
+        instance.course_id,
+        create=False,
+        **{
+            field: -value
+            for field, value in get_stats_contribution(instance).items()
+        },
+    )
+
+
+@receiver(m2m_changed, sender=Course.students.through)
+def add_students_stats(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Matrículas feitas com Course.students.add são criadas com bulk_create,
+    sem disparar o post_save de CourseRelation. As remoções não precisam
+    ser tratadas pois disparam o post_delete de cada relação.
+    """
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        for course_id in pk_set:
+            update_course_stats(course_id, student_count=1)
+    else:
+        update_course_stats(instance.id, student_count=len(pk_set))
+
+
+class ProgressRebuild:
+    """
+    Recalcula, após o commit, o progresso dos usuários dos cursos
+    acumulados durante a transação, assim cada curso é recalculado uma única
+    vez mesmo que várias aulas ou questionários sejam alterados.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.course_ids = set()
+
+    def __call__(self):
+        if getattr(self.connection, 'progress_rebuild', None) is self:
+            self.connection.progress_rebuild = None
+        for course_id in sorted(self.course_ids):
+            rebuild_course_users_progress(course_id)
+
+
+def schedule_progress_rebuild(course_id: int):
+    """
+    Agenda o recálculo do progresso do curso, reaproveitando o recálculo
+    guardado na conexão enquanto ele estiver registrado na transação atual.
+    Quando a transação é desfeita ele deixa de estar registrado e um novo
+    recálculo é criado.
+    """
+    connection = transaction.get_connection()
+    rebuild = getattr(connection, 'progress_rebuild', None)
+    if rebuild is not None and any(
+        func is rebuild for _, func, *_ in connection.run_on_commit
+    ):
+        rebuild.course_ids.add(course_id)
+        return
+
+    rebuild = connection.progress_rebuild = ProgressRebuild(connection)
+    rebuild.course_ids.add(course_id)
+    transaction.on_commit(rebuild)
+
+
+def rebuild_created_progress(sender, instance, created, **kwargs):
+    """
+    Criar aulas e questionários altera o total do curso, por isso o
+    progresso dos usuários do curso é recalculado após o commit, quando as
+    estatísticas do curso já foram atualizadas.
+    """
+    if created:
+        schedule_progress_rebuild(instance.course_id)
+
+
+def rebuild_deleted_progress(sender, instance, origin=None, **kwargs):
+    """
+    As relações removidas em cascata não passam pelos endpoints, por isso o
+    progresso dos usuários do curso é recalculado após o commit. Quando o
+    próprio curso está sendo removido o progresso é removido junto com ele.
+    """
+    if isinstance(origin, Course) or getattr(origin, 'model', None) is Course:
+        return
+    schedule_progress_rebuild(instance.course_id)
+
+
+for model in STATS_SENDERS:
+    pre_save.connect(load_previous_stats, sender=model)
+    post_save.connect(apply_stats, sender=model)
+    post_delete.connect(remove_stats, sender=model)
+
+for model in (Lesson, Quiz):
+    post_save.connect(rebuild_created_progress, sender=model)
+    post_delete.connect(rebuild_deleted_progress, sender=model)
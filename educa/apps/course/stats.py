@@ -0,0 +1,104 @@
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+from educa.apps.course.models import CourseRelation, CourseStats
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.lesson.models import Lesson
+from educa.apps.module.sub_apps.quiz.models import Quiz
+
+STATS_FIELDS = [
+    'rating_count',
+    'rating_sum',
+    'student_count',
+    'lesson_count',
+    'quiz_count',
+    'total_video_duration',
+]
+
+# Campos lidos por get_stats_contribution além do curso.
+STATS_CONTRIBUTION_FIELDS = {
+    Rating: ['rating'],
+    CourseRelation: [],
+    Lesson: ['video_duration_in_seconds'],
+    Quiz: [],
+}
+
+
+def get_stats_contribution(instance) -> dict:
+    """
+    Retorna quanto o objeto contribui para as estatísticas do seu curso.
+    """
+    if isinstance(instance, Rating):
+        return {'rating_count': 1, 'rating_sum': instance.rating}
+    if isinstance(instance, CourseRelation):
+        return {'student_count': 1}
+    if isinstance(instance, Lesson):
+        return {
+            'lesson_count': 1,
+            'total_video_duration': instance.video_duration_in_seconds or 0,
+        }
+    if isinstance(instance, Quiz):
+        return {'quiz_count': 1}
+    raise TypeError(f'{instance.__class__.__name__} has no course stats')
+
+
+def update_course_stats(course_id: int, create: bool = True, **deltas):
+    """
+    Soma os valores informados às estatísticas do curso em uma única
+    consulta. Caso o curso ainda não tenha estatísticas e create seja
+    verdadeiro, elas são calculadas a partir do banco.
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    updated = CourseStats.objects.filter(course_id=course_id).update(
+        **{field: F(field) + value for field, value in deltas.items()}
+    )
+    if not updated and create:
+        rebuild_course_stats([course_id])
+
+
+def rebuild_course_stats(course_ids: list[int]):
+    """
+    Recalcula do zero as estatísticas dos cursos informados utilizando uma
+    consulta agregada por tabela.
+    """
+    stats = {
+        course_id: CourseStats(course_id=course_id) for course_id in course_ids
+    }
+
+    ratings = (
+        Rating.objects.filter(course_id__in=course_ids)
+        .values('course_id')
+        .annotate(rating_count=Count('id'), rating_sum=Sum('rating'))
+    )
+    students = (
+        CourseRelation.objects.filter(course_id__in=course_ids)
+        .values('course_id')
+        .annotate(student_count=Count('id'))
+    )
+    lessons = (
+        Lesson.objects.filter(course_id__in=course_ids)
+        .values('course_id')
+        .annotate(
+            lesson_count=Count('id'),
+            total_video_duration=Coalesce(Sum('video_duration_in_seconds'), 0),
+        )
+    )
+    quizzes = (
+        Quiz.objects.filter(course_id__in=course_ids)
+        .values('course_id')
+        .annotate(quiz_count=Count('id'))
+    )
+    for row in [*ratings, *students, *lessons, *quizzes]:
+        course_stats = stats[row.pop('course_id')]
+        for field, value in row.items():
+            setattr(course_stats, field, value)
+
+    CourseStats.objects.bulk_create(
+        stats.values(),
+        update_conflicts=True,
+        unique_fields=['course'],
+        update_fields=STATS_FIELDS,
+    )
@@ -1,8 +1,11 @@
 from django.shortcuts import get_object_or_404
 from ninja import Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import is_admin, permission_required
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedIsAdmin,
@@ -54,8 +57,12 @@ def get_category(request, category_id: int):
     tags=['Categoria'],
     summary='Listar todas categorias',
     description='Endpoint para listar todos as categorias.',
-    response=list[CategoryOut],
+    response={
+        200: list[CategoryOut],
+        400: InvalidCursor,
+    },
 )
+@paginate(CursorPagination)
 def list_categories(request):
     return Category.objects.all()
 
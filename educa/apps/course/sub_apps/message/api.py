@@ -1,11 +1,15 @@
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     is_course_instructor,
     is_enrolled,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
@@ -65,10 +69,14 @@ def get_message(request, message_id: int):
     description='Endpoint para retornar todos os avisos de um curso ou por título.',
     response={
         200: list[MessageOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
-@permission_object_required(Message, [is_enrolled], many=True)
+@paginate(CursorPagination)
+@permission_object_required(
+    Message, [is_enrolled], many=True, strategy=MEMBERSHIP
+)
 def list_messages(request, filters: MessageFilter = Query(...)):
     query = request.get_message_query()
     return filters.filter(query)
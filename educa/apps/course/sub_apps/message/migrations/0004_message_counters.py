@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:50
+
+from django.db import migrations, models
+
+from educa.apps.generic.backfill import fill_counters
+
+
+def fill_message_counters(apps, schema_editor):
+    fill_counters(apps, apps.get_model('message', 'Message'), actions=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('message', '0003_alter_message_options'),
+        (
+            'answer',
+            '0006_answer_level_answer_lft_answer_parent_answer_rght_and_more',
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='answer_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_message_counters, migrations.RunPython.noop),
+    ]
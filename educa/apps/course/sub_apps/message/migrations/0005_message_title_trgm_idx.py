@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:03
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_trigram_extension'),
+        ('message', '0004_message_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['title'],
+                name='message_title_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxLengthValidator
 from django.db import models
 from django.urls import reverse
@@ -6,9 +7,10 @@ from django.urls import reverse
 from educa.apps.core.models import CreatorBase, TimeStampedBase
 from educa.apps.course.models import Course
 from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.models import AnswerCounterBase
 
 
-class Message(CreatorBase, TimeStampedBase):
+class Message(CreatorBase, TimeStampedBase, AnswerCounterBase):
     """
     Este modelo representa as mensagens de aviso feitas pelo instrutor do curso para seus alunos.
     """
@@ -24,6 +26,13 @@ class Message(CreatorBase, TimeStampedBase):
 
     class Meta:
         ordering = ['created']
+        indexes = [
+            GinIndex(
+                fields=['title'],
+                opclasses=['gin_trgm_ops'],
+                name='message_title_trgm_idx',
+            ),
+        ]
 
     def get_absolute_url(self):
         return reverse('api-1.0.0:get_message', kwargs={'message_id': self.id})
@@ -14,6 +14,7 @@ class MessageOut(Schema):
     id: int
     title: str
     content: str
+    answer_count: int
     course_id: int
     creator_id: int
     created: datetime
@@ -26,7 +27,7 @@ class MessageOut(Schema):
 
 class MessageFilter(FilterSchema):
     course_id: int | None
-    title: str | None = Field(q='title__icontains')
+    title: str | None = Field(q='title__trigram_icontains')
 
 
 class MessageUpdate(Schema):
@@ -1,6 +1,9 @@
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import is_enrolled, permission_object_required
 from educa.apps.core.schema import (
     DuplicatedObject,
@@ -16,7 +19,9 @@ from educa.apps.course.sub_apps.rating.schema import (
     RatingFilter,
     RatingIn,
     RatingOut,
+    RatingSummaryOut,
 )
+from educa.apps.course.sub_apps.rating.summary import load_rating_summary
 from educa.apps.user.auth.token import AuthBearer
 
 rating_router = Router()
@@ -56,6 +61,26 @@ def get_rating(request, rating_id: int):
     return get_object_or_404(Rating, id=rating_id)
 
 
+@rating_router.get(
+    'summary/{int:course_id}',
+    tags=['Avaliação'],
+    summary='Resumo das avaliações',
+    description='Endpoint para obter a quantidade, a média e a distribuição por estrelas das avaliações de um curso.',
+    response={
+        200: RatingSummaryOut,
+        404: NotFound,
+    },
+)
+def get_rating_summary(request, course_id: int):
+    summary = load_rating_summary(course_id)
+    if (
+        not summary['count']
+        and not Course.objects.filter(id=course_id).exists()
+    ):
+        raise Http404
+    return summary
+
+
 @rating_router.get(
     '',
     tags=['Avaliação'],
@@ -66,5 +91,6 @@ def get_rating(request, rating_id: int):
         400: InvalidFilterRating,
     },
 )
+@paginate(CursorPagination)
 def list_ratings(request, filters: RatingFilter = Query(...)):
     return filters.filter(Rating.objects.all())
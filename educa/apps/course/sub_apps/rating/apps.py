@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RatingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'educa.apps.course.sub_apps.rating'
+
+    def ready(self):
+        from educa.apps.course.sub_apps.rating import signals  # noqa: F401
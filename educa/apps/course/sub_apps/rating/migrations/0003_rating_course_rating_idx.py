@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rating', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(
+                fields=['course', 'rating'], name='rating_course_rating_idx'
+            ),
+        ),
+    ]
@@ -9,9 +9,12 @@ from educa.apps.core.models import CreatorBase, TimeStampedBase
 from educa.apps.course.models import Course
 from educa.apps.generic.action.models import Action
 from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.models import ActionCounterBase, AnswerCounterBase
 
 
-class Rating(CreatorBase, TimeStampedBase):
+class Rating(
+    CreatorBase, TimeStampedBase, AnswerCounterBase, ActionCounterBase
+):
     """
     Este modelo representa a avaliação feita de um usuário sobre um curso.
     """
@@ -31,6 +34,11 @@ class Rating(CreatorBase, TimeStampedBase):
 
     class Meta:
         ordering = ['created']
+        indexes = [
+            models.Index(
+                fields=('course', 'rating'), name='rating_course_rating_idx'
+            )
+        ]
         constraints = [
             UniqueConstraint(
                 fields=('creator', 'course'),
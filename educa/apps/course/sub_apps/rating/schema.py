@@ -31,6 +31,9 @@ class RatingOut(Schema):
     course_id: int
     rating: float
     comment: str
+    answer_count: int
+    like_count: int
+    dislike_count: int
     creator_id: int
     created: datetime
     modified: datetime
@@ -40,6 +43,13 @@ class RatingOut(Schema):
         return value.isoformat()
 
 
+class RatingSummaryOut(Schema):
+    course_id: int
+    count: int
+    mean: float | None
+    histogram: dict[int, int]
+
+
 class RatingFilter(FilterSchema):
     course_id: int | None = Field(q='course_id')
     comment: str | None = Field(q='comment__icontains')
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.course.sub_apps.rating.summary import (
+    invalidate_rating_summary,
+)
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def invalidate_rating_summary_cache(sender, instance, **kwargs):
+    invalidate_rating_summary(instance.course_id)
@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.db.models.functions import Floor
+
+from educa.apps.course.sub_apps.rating.models import Rating
+
+RATING_SUMMARY_CACHE_TIMEOUT = 60 * 10
+RATING_STARS = range(1, 6)
+
+
+def _rating_summary_cache_key(course_id: int) -> str:
+    return f'course:{course_id}:rating_summary'
+
+
+def load_rating_summary(course_id: int) -> dict:
+    """
+    Retorna o resumo das avaliações do curso a partir do cache, calculando no
+    banco com uma única consulta agrupada pela nota arredondada para baixo.
+    Resumos sem avaliações não são guardados, assim ids de cursos que não
+    existem não ocupam o cache.
+
+    Returns:
+        count (int): quantidade de avaliações.
+        mean (float | None): média das avaliações.
+        histogram (dict[int, int]): {estrela: quantidade de avaliações}.
+    """
+    key = _rating_summary_cache_key(course_id)
+    summary = cache.get(key)
+    if summary is None:
+        buckets = (
+            Rating.objects.filter(course_id=course_id)
+            .annotate(star=Floor('rating'))
+            .values('star')
+            .annotate(count=Count('id'), total=Sum('rating'))
+            .order_by()
+        )
+
+        histogram = dict.fromkeys(RATING_STARS, 0)
+        count, total = 0, 0
+        for bucket in buckets:
+            histogram[int(bucket['star'])] += bucket['count']
+            count += bucket['count']
+            total += bucket['total']
+
+        summary = {
+            'course_id': course_id,
+            'count': count,
+            'mean': round(total / count, 2) if count else None,
+            'histogram': histogram,
+        }
+        if count:
+            cache.set(key, summary, RATING_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+def invalidate_rating_summary(course_id: int):
+    cache.delete(_rating_summary_cache_key(course_id))
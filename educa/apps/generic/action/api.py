@@ -1,4 +1,6 @@
-from django.shortcuts import get_object_or_404
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.http import Http404
 from ninja import Router
 
 from educa.apps.core.permissions import (
@@ -17,6 +19,7 @@ from educa.apps.course.sub_apps.rating.models import Rating
 from educa.apps.generic.action.models import Action
 from educa.apps.generic.action.schema import ActionIn, ActionOut
 from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.counters import update_action_counters
 from educa.apps.generic.decorator import validate_generic_model
 from educa.apps.lesson.sub_apps.question.models import Question
 
@@ -46,26 +49,24 @@ action_router = Router()
 )
 @permission_object_required(Course, [is_enrolled])
 def create_action(request, data: ActionIn):
-    action_data = data.dict()
-
-    object_model = action_data.pop('object_model')
-    object_id = action_data.pop('object_id')
-    generic_object = getattr(request, f'get_{object_model.lower()}')()
-
-    action = Action.objects.filter(
-        creator=request.user,
-        object_id=object_id,
-        content_type__model=object_model.lower(),
-    ).first()
-    if action is not None:
-        action.action = data.action
-        action.save()
-        return action
-
-    return Action.objects.create(
-        **action_data,
-        content_object=generic_object,
+    content_type = ContentType.objects.get_for_model(
+        request.get_generic_model()
     )
+    with transaction.atomic():
+        action = Action.objects.upsert(
+            creator_id=request.user.id,
+            course_id=data.course_id,
+            content_type_id=content_type.id,
+            object_id=data.object_id,
+            action=data.action,
+        )
+        update_action_counters(
+            action.content_type_id,
+            action.object_id,
+            action.previous_action,
+            action.action,
+        )
+    return action
 
 
 @action_router.delete(
@@ -82,11 +83,14 @@ def create_action(request, data: ActionIn):
 )
 @validate_generic_model([Answer, Rating, Question])
 def delete_action(request, object_model: str, object_id: int):
-    action = get_object_or_404(
-        Action,
-        creator=request.user,
-        content_type__model=object_model.lower(),
-        object_id=object_id,
+    content_type = ContentType.objects.get_for_model(
+        request.get_generic_model()
     )
-    action.delete()
+    with transaction.atomic():
+        previous = Action.objects.remove(
+            request.user.id, content_type.id, object_id
+        )
+        if previous is None:
+            raise Http404('No Action matches the given query.')
+        update_action_counters(content_type.id, object_id, previous=previous)
     return 204, None
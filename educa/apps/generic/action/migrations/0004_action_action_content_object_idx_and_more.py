@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(
+                fields=['content_type', 'object_id'],
+                name='action_content_object_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='action',
+            index=models.Index(
+                fields=['creator', 'content_type', 'object_id'],
+                name='action_creator_object_idx',
+            ),
+        ),
+    ]
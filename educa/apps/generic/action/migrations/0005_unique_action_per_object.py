@@ -0,0 +1,75 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:54
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Max
+
+from educa.apps.generic.backfill import fill_counters
+
+
+def delete_duplicated_actions(apps, schema_editor):
+    """
+    A restrição anterior permitia uma ação de cada tipo por objeto, apenas a
+    mais recente de cada usuário é mantida e os contadores de curtidas dos
+    objetos afetados são recalculados.
+    """
+    Action = apps.get_model('action', 'Action')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    latest = (
+        Action.objects.values('creator', 'content_type', 'object_id')
+        .annotate(latest_id=Max('id'))
+        .values('latest_id')
+    )
+    duplicated = Action.objects.filter(creator__isnull=False).exclude(
+        id__in=latest
+    )
+
+    affected = defaultdict(set)
+    for content_type_id, object_id in duplicated.values_list(
+        'content_type_id', 'object_id'
+    ).distinct():
+        affected[content_type_id].add(object_id)
+    duplicated.delete()
+
+    for content_type in ContentType.objects.filter(id__in=affected):
+        model = apps.get_model(content_type.app_label, content_type.model)
+        if not hasattr(model, 'like_count'):
+            continue
+        fill_counters(
+            apps,
+            model,
+            answers=False,
+            object_ids=list(affected[content_type.id]),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action', '0004_action_action_content_object_idx_and_more'),
+        ('answer', '0007_answer_counters'),
+        ('question', '0003_question_counters'),
+        ('rating', '0004_rating_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='action',
+            name='unique action',
+        ),
+        migrations.RemoveIndex(
+            model_name='action',
+            name='action_creator_object_idx',
+        ),
+        migrations.RunPython(
+            delete_duplicated_actions, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='action',
+            constraint=models.UniqueConstraint(
+                fields=('creator', 'content_type', 'object_id'),
+                name='unique action',
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import connection, models
+from django.utils import timezone
 
 from educa.apps.core.models import CreatorBase, TimeStampedBase
 from educa.apps.course.models import Course
@@ -11,6 +12,108 @@ class ActionName(models.IntegerChoices):
     DISLIKE = 2
 
 
+class ActionQuerySet(models.QuerySet):
+    def upsert(
+        self,
+        creator_id: int,
+        course_id: int,
+        content_type_id: int,
+        object_id: int,
+        action: str,
+    ) -> 'Action':
+        """
+        Cria ou altera a ação do usuário sobre o objeto com um único
+        INSERT ... ON CONFLICT, sem lock.
+
+        Em um conflito o Postgres espera o clique simultâneo terminar e
+        avalia o DO UPDATE sobre a versão mais recente da linha, por isso a
+        ação anterior é deduzida da própria linha retornada: xmax = 0 indica
+        que ela foi criada e modified só recebe o horário do comando quando a
+        ação muda, como existem apenas duas ações a anterior é a outra.
+
+        Returns:
+            a ação salva, com a ação anterior em previous_action ou None
+            caso ela tenha sido criada.
+        """
+        table = self.model._meta.db_table
+        sql = f"""
+            INSERT INTO {table} AS action (
+                created,
+                modified,
+                creator_id,
+                course_id,
+                content_type_id,
+                object_id,
+                action
+            )
+            VALUES (
+                %(now)s,
+                %(now)s,
+                %(creator_id)s,
+                %(course_id)s,
+                %(content_type_id)s,
+                %(object_id)s,
+                %(action)s
+            )
+            ON CONFLICT (creator_id, content_type_id, object_id)
+            DO UPDATE SET
+                action = EXCLUDED.action,
+                modified = CASE
+                    WHEN action.action = EXCLUDED.action THEN action.modified
+                    ELSE EXCLUDED.modified
+                END
+            RETURNING
+                *,
+                xmax = 0 AS inserted,
+                modified = %(now)s AS changed
+        """
+        params = {
+            'now': timezone.now(),
+            'creator_id': creator_id,
+            'course_id': course_id,
+            'content_type_id': content_type_id,
+            'object_id': object_id,
+            'action': str(action),
+        }
+        saved = next(iter(self.raw(sql, params)))
+        if saved.inserted:
+            saved.previous_action = None
+        elif saved.changed:
+            saved.previous_action = next(
+                str(value)
+                for value in ActionName.values
+                if str(value) != saved.action
+            )
+        else:
+            saved.previous_action = saved.action
+        return saved
+
+    def remove(
+        self, creator_id: int, content_type_id: int, object_id: int
+    ) -> str | None:
+        """
+        Remove a ação do usuário sobre o objeto com um único DELETE ...
+        RETURNING, assim a ação removida é a da linha apagada mesmo que ela
+        tenha sido alterada por um clique simultâneo.
+
+        Returns:
+            a ação removida ou None caso ela não exista.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                DELETE FROM {self.model._meta.db_table}
+                WHERE creator_id = %s
+                AND content_type_id = %s
+                AND object_id = %s
+                RETURNING action
+                """,
+                [creator_id, content_type_id, object_id],
+            )
+            row = cursor.fetchone()
+        return row[0] if row is not None else None
+
+
 class Action(CreatorBase, TimeStampedBase):
     """
     Modelo genérico que representa uma ação do usuário relacionado ao modelo
@@ -23,16 +126,18 @@ class Action(CreatorBase, TimeStampedBase):
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey()
 
+    objects = ActionQuerySet.as_manager()
+
     class Meta:
+        indexes = [
+            models.Index(
+                fields=('content_type', 'object_id'),
+                name='action_content_object_idx',
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
-                fields=(
-                    'creator',
-                    'content_type',
-                    'object_id',
-                    'action',
-                    'course',
-                ),
+                fields=('creator', 'content_type', 'object_id'),
                 name='unique action',
             )
         ]
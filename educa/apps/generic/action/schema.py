@@ -1,5 +1,7 @@
 from ninja import Schema
 
+from educa.apps.generic.utils import get_content_type, get_object_url
+
 
 class ActionIn(Schema):
     object_id: int
@@ -18,8 +20,8 @@ class ActionOut(Schema):
 
     @staticmethod
     def resolve_object_model(obj):
-        return obj.content_type.model
+        return get_content_type(obj.content_type_id).model
 
     @staticmethod
     def resolve_object_url(obj):
-        return obj.content_object.get_absolute_url()
+        return get_object_url(obj.content_type_id, obj.object_id)
@@ -1,7 +1,11 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from ninja import Query, Router
 from ninja.errors import HttpError
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
     is_authenticated,
     is_creator_object,
@@ -9,6 +13,7 @@ from educa.apps.core.permissions import (
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     InvalidGenericModel,
     NotAuthenticated,
     NotFound,
@@ -19,7 +24,20 @@ from educa.apps.course.models import Course
 from educa.apps.course.sub_apps.message.models import Message
 from educa.apps.course.sub_apps.rating.models import Rating
 from educa.apps.generic.answer.models import Answer
-from educa.apps.generic.answer.schema import AnswerIn, AnswerOut, AnswerUpdate
+from educa.apps.generic.answer.schema import (
+    AnswerIn,
+    AnswerOut,
+    AnswerThreadOut,
+    AnswerUpdate,
+)
+from educa.apps.generic.answer.thread import (
+    AnswerThreadPagination,
+    load_answer_threads,
+)
+from educa.apps.generic.counters import (
+    add_answer_counters,
+    remove_answer_counters,
+)
 from educa.apps.generic.decorator import validate_generic_model
 from educa.apps.lesson.sub_apps.question.models import Question
 from educa.apps.user.auth.token import AuthBearer
@@ -67,10 +85,13 @@ def create_answer(request, data: AnswerIn):
                 status_code=400,
             )
 
-    return Answer.objects.create(
-        **answer_data,
-        content_object=generic_object,
-    )
+    with transaction.atomic():
+        answer = Answer.objects.create(
+            **answer_data,
+            content_object=generic_object,
+        )
+        add_answer_counters(answer)
+    return answer
 
 
 @answer_router.get(
@@ -94,14 +115,60 @@ def get_answer(request, answer_id: int):
     description='Endpoint retornar as respostas de uma resposta.',
     response={
         200: list[AnswerOut],
+        400: InvalidCursor,
         404: NotFound,
     },
 )
+@paginate(CursorPagination)
 def list_answer_children(request, answer_id: int):
     answer = get_object_or_404(Answer, id=answer_id)
     return answer.get_children()
 
 
+@answer_router.get(
+    '{int:answer_id}/thread',
+    tags=['Resposta'],
+    summary='Retornar discussão',
+    description='Endpoint para retornar uma resposta com todas as respostas abaixo dela, limitadas a depth níveis quando informado.',
+    response={
+        200: AnswerThreadOut,
+        404: NotFound,
+    },
+)
+def get_answer_thread(
+    request, answer_id: int, depth: int | None = Query(None, ge=0)
+):
+    answer = get_object_or_404(Answer, id=answer_id)
+    return load_answer_threads([answer], depth)[0]
+
+
+@answer_router.get(
+    '{str:object_model}/{int:object_id}/thread',
+    tags=['Resposta'],
+    summary='Listar discussões',
+    description='Endpoint para retornar as respostas de um modelo com as respostas abaixo de cada uma, a paginação é feita pelas respostas diretas ao modelo.',
+    response={
+        200: list[AnswerThreadOut],
+        400: InvalidGenericModel,
+    },
+)
+@paginate(AnswerThreadPagination)
+@validate_generic_model([Message, Rating, Question])
+def list_answer_thread(
+    request,
+    object_model: str,
+    object_id: int,
+    depth: int | None = Query(None, ge=0),
+):
+    return Answer.objects.filter(
+        content_type=ContentType.objects.get_for_model(
+            request.get_generic_model()
+        ),
+        object_id=object_id,
+        parent__isnull=True,
+    )
+
+
 @answer_router.get(
     '{str:object_model}/{int:object_id}',
     tags=['Resposta'],
@@ -112,10 +179,14 @@ def list_answer_children(request, answer_id: int):
         400: InvalidGenericModel,
     },
 )
+@paginate(CursorPagination)
 @validate_generic_model([Message, Rating, Question])
 def list_answer(request, object_model: str, object_id: int):
     return Answer.objects.filter(
-        content_type__model=object_model.lower(), object_id=object_id
+        content_type=ContentType.objects.get_for_model(
+            request.get_generic_model()
+        ),
+        object_id=object_id,
     )
 
 
@@ -135,7 +206,9 @@ def list_answer(request, object_model: str, object_id: int):
 @permission_object_required(Answer, [is_creator_object])
 def delete_answer(request, answer_id: int):
     answer = request.get_answer()
-    answer.delete()
+    with transaction.atomic():
+        remove_answer_counters(answer)
+        answer.delete()
     return 204, None
 
 
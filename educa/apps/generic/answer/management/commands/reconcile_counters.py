@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from educa.apps.course.sub_apps.message.models import Message
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.counters import reconcile_counters
+from educa.apps.lesson.sub_apps.question.models import Question
+
+COUNTER_MODELS = [Question, Rating, Message, Answer]
+
+
+class Command(BaseCommand):
+    help = 'Recalcula do zero os contadores de respostas e ações.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        for model in COUNTER_MODELS:
+            object_ids = model.objects.order_by('id').values_list(
+                'id', flat=True
+            )
+            reconciled, last_id = 0, 0
+            while batch := list(
+                object_ids.filter(id__gt=last_id)[:batch_size]
+            ):
+                with transaction.atomic():
+                    reconcile_counters(model, batch)
+                reconciled += len(batch)
+                last_id = batch[-1]
+
+            self.stdout.write(
+                f'{reconciled} {model._meta.verbose_name_plural} reconciled.'
+            )
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:50
+
+from django.db import migrations, models
+
+from educa.apps.generic.backfill import fill_counters
+
+
+def fill_answer_counters(apps, schema_editor):
+    fill_counters(apps, apps.get_model('answer', 'Answer'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            'answer',
+            '0006_answer_level_answer_lft_answer_parent_answer_rght_and_more',
+        ),
+        ('action', '0004_action_action_content_object_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='answer_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_answer_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answer', '0007_answer_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(
+                fields=['content_type', 'object_id'],
+                name='answer_content_object_idx',
+            ),
+        ),
+    ]
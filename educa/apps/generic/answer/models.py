@@ -12,9 +12,16 @@ from mptt.models import MPTTModel
 from educa.apps.core.models import CreatorBase, TimeStampedBase
 from educa.apps.course.models import Course
 from educa.apps.generic.action.models import Action
+from educa.apps.generic.models import ActionCounterBase, AnswerCounterBase
 
 
-class Answer(MPTTModel, CreatorBase, TimeStampedBase):
+class Answer(
+    MPTTModel,
+    CreatorBase,
+    TimeStampedBase,
+    AnswerCounterBase,
+    ActionCounterBase,
+):
     """
     Modelo genérico que representa uma resposta do usuário a algum objeto relacionado
     com o modelo Curso.
@@ -40,5 +47,13 @@ class Answer(MPTTModel, CreatorBase, TimeStampedBase):
     )
     actions = GenericRelation(Action)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=('content_type', 'object_id'),
+                name='answer_content_object_idx',
+            )
+        ]
+
     def get_absolute_url(self):
         return reverse('api-1.0.0:get_answer', kwargs={'answer_id': self.id})
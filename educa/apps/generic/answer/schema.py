@@ -1,5 +1,7 @@
 from ninja import Schema
 
+from educa.apps.generic.utils import get_content_type, get_object_url
+
 
 class AnswerIn(Schema):
     object_id: int
@@ -16,14 +18,24 @@ class AnswerOut(Schema):
     object_url: str
     course_id: int
     content: str
+    answer_count: int
+    like_count: int
+    dislike_count: int
 
     @staticmethod
     def resolve_object_model(obj):
-        return obj.content_type.model
+        return get_content_type(obj.content_type_id).model
 
     @staticmethod
     def resolve_object_url(obj):
-        return obj.content_object.get_absolute_url()
+        return get_object_url(obj.content_type_id, obj.object_id)
+
+
+class AnswerThreadOut(AnswerOut):
+    replies: list['AnswerThreadOut']
+
+
+AnswerThreadOut.update_forward_refs()
 
 
 class AnswerUpdate(Schema):
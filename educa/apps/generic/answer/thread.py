@@ -0,0 +1,56 @@
+from typing import Any
+
+from django.db.models import Q
+
+from educa.apps.core.pagination import CursorPagination
+from educa.apps.generic.answer.models import Answer
+
+
+def load_answer_threads(
+    roots: list[Answer], depth: int | None = None
+) -> list[Answer]:
+    """
+    Carrega as respostas abaixo de cada raiz com uma única consulta pelos
+    intervalos tree_id/lft das árvores e monta a discussão em memória, cada
+    resposta recebe em replies as suas respostas na ordem da árvore.
+
+    Args:
+        roots: respostas a partir das quais as discussões são montadas.
+        depth: quantidade de níveis abaixo das raízes, None carrega todos.
+    """
+    nodes = {}
+    query = Q()
+    for root in roots:
+        root.replies = []
+        nodes[root.id] = root
+        if root.is_leaf_node() or depth == 0:
+            continue
+        subtree = Q(tree_id=root.tree_id, lft__gt=root.lft, rght__lt=root.rght)
+        if depth is not None:
+            subtree &= Q(level__lte=root.level + depth)
+        query |= subtree
+
+    if not query:
+        return roots
+
+    # A ordenação por tree_id e lft garante que o pai é visto antes dos
+    # filhos, assim a discussão é montada em uma única passagem.
+    for answer in Answer.objects.filter(query).order_by('tree_id', 'lft'):
+        answer.replies = []
+        nodes[answer.id] = answer
+        nodes[answer.parent_id].replies.append(answer)
+    return roots
+
+
+class AnswerThreadPagination(CursorPagination):
+    """
+    Paginação por cursor das respostas raiz, carregando a discussão abaixo
+    de cada resposta da página até o depth informado no endpoint.
+    """
+
+    def paginate_queryset(self, queryset, pagination, **params: Any):
+        result = super().paginate_queryset(queryset, pagination, **params)
+        result['items'] = load_answer_threads(
+            result['items'], params.get('depth')
+        )
+        return result
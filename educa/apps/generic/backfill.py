@@ -0,0 +1,70 @@
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from educa.apps.generic.counters import ACTION_COUNT_FIELDS
+
+
+def _count(queryset, field: str):
+    """
+    Subconsulta que conta os objetos cujo field aponta para o objeto
+    externo, retornando 0 quando ele não possui nenhum.
+    """
+    count = (
+        queryset.filter(**{field: OuterRef('id')})
+        .order_by()
+        .values(field)
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    return Coalesce(Subquery(count, output_field=IntegerField()), 0)
+
+
+def fill_counters(
+    apps,
+    model,
+    answers: bool = True,
+    actions: bool = True,
+    object_ids: list[int] | None = None,
+):
+    """
+    Preenche nas migrações os contadores dos objetos já existentes, ou apenas
+    dos objetos informados, com uma única consulta, utilizando os modelos
+    históricos e as mesmas regras de
+    educa.apps.generic.counters.reconcile_counters.
+    """
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Answer = apps.get_model('answer', 'Answer')
+    Action = apps.get_model('action', 'Action')
+
+    content_type = ContentType.objects.filter(
+        app_label=model._meta.app_label, model=model._meta.model_name
+    ).first()
+    counters = {}
+
+    if answers:
+        if model._meta.label == 'answer.Answer':
+            counters['answer_count'] = _count(Answer.objects, 'parent_id')
+        elif content_type is not None:
+            counters['answer_count'] = _count(
+                Answer.objects.filter(content_type_id=content_type.id),
+                'object_id',
+            )
+        else:
+            counters['answer_count'] = 0
+
+    if actions:
+        for action, field in ACTION_COUNT_FIELDS.items():
+            if content_type is None:
+                counters[field] = 0
+                continue
+            counters[field] = _count(
+                Action.objects.filter(
+                    content_type_id=content_type.id, action=action
+                ),
+                'object_id',
+            )
+
+    queryset = model.objects.all()
+    if object_ids is not None:
+        queryset = queryset.filter(id__in=object_ids)
+    queryset.update(**counters)
@@ -0,0 +1,122 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F, Model
+
+from educa.apps.generic.action.models import Action, ActionName
+from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.models import ActionCounterBase, AnswerCounterBase
+from educa.apps.generic.utils import get_content_type
+
+ACTION_COUNT_FIELDS = {
+    str(ActionName.LIKE.value): 'like_count',
+    str(ActionName.DISLIKE.value): 'dislike_count',
+}
+
+
+def update_counters(model: type[Model], object_id: int, **deltas):
+    """
+    Soma os valores informados aos contadores do objeto em uma única
+    consulta, os campos são atualizados com F() para não perder incrementos
+    concorrentes. Os contadores dos objetos já existentes são preenchidos nas
+    migrações e podem ser recalculados com o comando reconcile_counters.
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    model.objects.filter(id=object_id).update(
+        **{field: F(field) + value for field, value in deltas.items()}
+    )
+
+
+def add_answer_counters(answer: Answer):
+    model = get_content_type(answer.content_type_id).model_class()
+    update_counters(model, answer.object_id, answer_count=1)
+    if answer.parent_id is not None:
+        update_counters(Answer, answer.parent_id, answer_count=1)
+
+
+def remove_answer_counters(answer: Answer):
+    """
+    Remove a resposta e as respostas abaixo dela, que são apagadas junto,
+    dos contadores do objeto. A quantidade de descendentes é obtida pelos
+    campos da árvore, sem consultar o banco.
+    """
+    model = get_content_type(answer.content_type_id).model_class()
+    update_counters(
+        model,
+        answer.object_id,
+        answer_count=-1 - answer.get_descendant_count(),
+    )
+    if answer.parent_id is not None:
+        update_counters(Answer, answer.parent_id, answer_count=-1)
+
+
+def update_action_counters(
+    content_type_id: int,
+    object_id: int,
+    previous: str | None = None,
+    current: str | None = None,
+):
+    """
+    Atualiza os contadores do objeto quando a ação do usuário muda de
+    previous para current, None indica que a ação não existe.
+    """
+    if previous == current:
+        return
+    deltas = {}
+    if previous in ACTION_COUNT_FIELDS:
+        deltas[ACTION_COUNT_FIELDS[previous]] = -1
+    if current in ACTION_COUNT_FIELDS:
+        deltas[ACTION_COUNT_FIELDS[current]] = 1
+    model = get_content_type(content_type_id).model_class()
+    update_counters(model, object_id, **deltas)
+
+
+def reconcile_counters(model: type[Model], object_ids: list[int]):
+    """
+    Recalcula do zero os contadores dos objetos informados com uma consulta
+    agregada para as respostas e uma para as ações.
+    """
+    counters = {
+        object_id: {
+            'answer_count': 0,
+            **dict.fromkeys(ACTION_COUNT_FIELDS.values(), 0),
+        }
+        for object_id in object_ids
+    }
+    content_type = ContentType.objects.get_for_model(model)
+    fields = []
+
+    if issubclass(model, AnswerCounterBase):
+        fields.append('answer_count')
+        if model is Answer:
+            answers = Answer.objects.filter(
+                parent_id__in=object_ids
+            ).values_list('parent_id')
+        else:
+            answers = Answer.objects.filter(
+                content_type=content_type, object_id__in=object_ids
+            ).values_list('object_id')
+        for object_id, count in answers.annotate(count=Count('id')).order_by():
+            counters[object_id]['answer_count'] = count
+
+    if issubclass(model, ActionCounterBase):
+        fields.extend(ACTION_COUNT_FIELDS.values())
+        actions = (
+            Action.objects.filter(
+                content_type=content_type, object_id__in=object_ids
+            )
+            .values_list('object_id', 'action')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for object_id, action, count in actions:
+            if action in ACTION_COUNT_FIELDS:
+                counters[object_id][ACTION_COUNT_FIELDS[action]] = count
+
+    model.objects.bulk_update(
+        [
+            model(id=object_id, **{field: values[field] for field in fields})
+            for object_id, values in counters.items()
+        ],
+        fields,
+    )
@@ -9,7 +9,7 @@ from educa.apps.core.permissions import (
     PermissionObjectBase,
     permission_object_required,
 )
-from educa.apps.core.utils import get_attribute_from_endpoint
+from educa.apps.core.utils import compile_attribute_getter
 
 
 def validate_generic_model(
@@ -23,51 +23,69 @@ def validate_generic_model(
         models_permissions = {}
 
     def wrapper(func):
+        get_object_model = compile_attribute_getter(func, 'object_model')
+        get_object_id = compile_attribute_getter(func, 'object_id')
+
+        # Para cada modelo o endpoint já é montado com as permissões de
+        # objeto, restando apenas as permissões de função a cada requisição.
+        plans = {}
+        for generic_model in valid_models.values():
+            permissions = models_permissions.get(generic_model) or []
+            object_permissions = [
+                permission
+                for permission in permissions
+                if inspect.isclass(permission)
+                and issubclass(permission, PermissionObjectBase)
+            ]
+            func_permissions = [
+                permission
+                for permission in permissions
+                if permission not in object_permissions
+            ]
+            endpoint = func
+            if object_permissions:
+                endpoint = permission_object_required(
+                    generic_model,
+                    object_permissions,
+                    id_kwarg='object_id',
+                )(func)
+            plans[generic_model] = (
+                lambda generic_model=generic_model: generic_model,
+                func_permissions,
+                bool(object_permissions),
+                endpoint,
+            )
+
         @wraps(func)
         def inner(request, *args, **kwargs):
-            object_name = get_attribute_from_endpoint(kwargs, 'object_model')
+            object_name = get_object_model(kwargs)
             if object_name is None:
                 raise ConfigError(
                     'could not find the generic object_model attribute.'
                 )
 
-            object_name = object_name.lower()
-            if object_name not in valid_models:
+            generic_model = valid_models.get(object_name.lower())
+            if generic_model is None:
                 raise HttpError(
                     message='invalid generic model.', status_code=400
                 )
 
-            generic_model = valid_models[object_name]
-            setattr(request, 'get_generic_model', lambda: generic_model)
-
-            permissions = models_permissions.get(generic_model)
-            if permissions:
-                object_permissions = [
-                    permission
-                    for permission in permissions
-                    if inspect.isclass(permission)
-                    and issubclass(permission, PermissionObjectBase)
-                ]
+            (
+                get_generic_model,
+                func_permissions,
+                check_object,
+                endpoint,
+            ) = plans[generic_model]
+            setattr(request, 'get_generic_model', get_generic_model)
 
-                func_permissions = set(permissions) - set(object_permissions)
-                for permission in func_permissions:
-                    permission(request, *args, **kwargs, endpoint=func)
+            for permission in func_permissions:
+                permission(request, *args, **kwargs, endpoint=func)
 
-                if object_permissions:
-                    object_id = get_attribute_from_endpoint(
-                        kwargs, 'object_id'
-                    )
-                    if object_id is None:
-                        raise ConfigError(
-                            'could not find the generic object_id attribute.'
-                        )
-                    return permission_object_required(
-                        generic_model,
-                        object_permissions,
-                        id_kwarg='object_id',
-                    )(func)(request, *args, **kwargs)
-
-            return func(request, *args, **kwargs)
+            if check_object and get_object_id(kwargs) is None:
+                raise ConfigError(
+                    'could not find the generic object_id attribute.'
+                )
+            return endpoint(request, *args, **kwargs)
 
         return inner
 
@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class AnswerCounterBase(models.Model):
+    """
+    Este modelo armazena a quantidade de respostas do objeto, mantida pelos
+    endpoints de resposta para evitar uma contagem por objeto nas listagens.
+    """
+
+    answer_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        abstract = True
+
+
+class ActionCounterBase(models.Model):
+    """
+    Este modelo armazena a quantidade de cada ação feita sobre o objeto,
+    mantida pelos endpoints de ação.
+    """
+
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    dislike_count = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        abstract = True
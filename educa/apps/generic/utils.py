@@ -0,0 +1,18 @@
+from django.contrib.contenttypes.models import ContentType
+
+
+def get_content_type(content_type_id: int) -> ContentType:
+    """
+    Retorna o ContentType pelo id a partir do cache de tipos do Django, após
+    a primeira busca nenhuma consulta é feita.
+    """
+    return ContentType.objects.get_for_id(content_type_id)
+
+
+def get_object_url(content_type_id: int, object_id: int) -> str:
+    """
+    Monta a url do objeto genérico sem buscá-lo no banco, os modelos
+    genéricos utilizam apenas o id em get_absolute_url.
+    """
+    model = get_content_type(content_type_id).model_class()
+    return model(id=object_id).get_absolute_url()
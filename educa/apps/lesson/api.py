@@ -1,11 +1,15 @@
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     is_course_instructor,
     is_enrolled,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
@@ -46,7 +50,7 @@ lesson_router.add_router('/note/', note_router)
         404: NotFound,
     },
 )
-@permission_object_required(Module, [is_course_instructor])
+@permission_object_required(Module, [is_course_instructor], only=[])
 def create_lesson(request, data: LessonIn):
     module = request.get_module()
     return Lesson.objects.create(**data.dict(), course_id=module.course_id)
@@ -76,10 +80,14 @@ def get_lesson(request, lesson_id: int):
     description='Endpoint que retorna todos as aulas de um módulo, curso. Os filtros de module_id e course_id devem ser passados separados por virgulas caso haja mais de um valor.',
     response={
         200: list[LessonOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
-@permission_object_required(Lesson, [is_enrolled], many=True)
+@paginate(CursorPagination)
+@permission_object_required(
+    Lesson, [is_enrolled], many=True, strategy=MEMBERSHIP
+)
 def list_lessons(request, filters: LessonFilter = Query(...)):
     query = request.get_lesson_query()
     return filters.filter(query)
@@ -1,14 +1,25 @@
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from ninja import Query, Router
+from ninja import Body, Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import is_enrolled, permission_object_required
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
 )
+from educa.apps.course.progress import (
+    rebuild_course_progress,
+    update_course_progress,
+)
 from educa.apps.lesson.models import Lesson, LessonRelation
 from educa.apps.lesson.schema import (
+    LessonRelationBulkList,
     LessonRelationFilter,
     LessonRelationOut,
     LessonRelationUpdate,
@@ -22,7 +33,7 @@ lesson_relation_router = Router(auth=AuthBearer())
     '{int:lesson_id}',
     tags=['Relacionamento Aula'],
     summary='Retornar um relaciomento aula',
-    description='Endpoint para retornar um relacionamento com uma aula específico do usuário.',
+    description='Endpoint para retornar um relacionamento com uma aula específico do usuário. Caso o usuário ainda não tenha um relacionamento com a aula é retornado um relacionamento não concluído sem id, que só é criado pelos endpoints de escrita.',
     response={
         200: LessonRelationOut,
         401: NotAuthenticated,
@@ -32,9 +43,13 @@ lesson_relation_router = Router(auth=AuthBearer())
 )
 @permission_object_required(Lesson, [is_enrolled])
 def get_lesson_relation(request, lesson_id: int):
-    relation, _ = LessonRelation.objects.get_or_create(
+    relation = LessonRelation.objects.filter(
         lesson_id=lesson_id, creator=request.user
-    )
+    ).first()
+    if relation is None:
+        return LessonRelation(
+            lesson_id=lesson_id, creator=request.user, done=False
+        )
     return relation
 
 
@@ -45,9 +60,11 @@ def get_lesson_relation(request, lesson_id: int):
     description='Endpoint para listar todos os relacionamentos do usuários com aulas.',
     response={
         200: list[LessonRelationOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
+@paginate(CursorPagination)
 def list_lesson_relations(request, filters: LessonRelationFilter = Query(...)):
     return filters.filter(LessonRelation.objects.filter(creator=request.user))
 
@@ -64,10 +81,19 @@ def list_lesson_relations(request, filters: LessonRelationFilter = Query(...)):
     },
 )
 def delete_lesson_relation(request, lesson_id: int):
-    relation = get_object_or_404(
-        LessonRelation, lesson_id=lesson_id, creator=request.user
-    )
-    relation.delete()
+    with transaction.atomic():
+        relation = get_object_or_404(
+            LessonRelation.objects.select_for_update(
+                of=('self',)
+            ).select_related('lesson'),
+            lesson_id=lesson_id,
+            creator=request.user,
+        )
+        relation.delete()
+        if relation.done:
+            update_course_progress(
+                request.user.id, relation.lesson.course_id, lessons_done=-1
+            )
     return 204, None
 
 
@@ -85,9 +111,66 @@ def delete_lesson_relation(request, lesson_id: int):
 def update_lesson_relation(
     request, lesson_id: int, data: LessonRelationUpdate
 ):
-    relation, _ = LessonRelation.objects.get_or_create(
-        lesson_id=lesson_id, creator=request.user
-    )
-    relation.done = data.done
-    relation.save()
+    with transaction.atomic():
+        relation, _ = (
+            LessonRelation.objects.select_for_update(of=('self',))
+            .select_related('lesson')
+            .get_or_create(lesson_id=lesson_id, creator=request.user)
+        )
+        delta = int(data.done) - int(relation.done)
+        relation.done = data.done
+        relation.save()
+        if delta:
+            update_course_progress(
+                request.user.id, relation.lesson.course_id, lessons_done=delta
+            )
     return relation
+
+
+@lesson_relation_router.put(
+    '',
+    tags=['Relacionamento Aula'],
+    summary='Atualizar vários relacionamentos',
+    description='Endpoint para criar ou atualizar em lote os relacionamentos do usuário com aulas, utilizado para sincronizar o progresso feito offline. Caso a mesma aula seja enviada mais de uma vez prevalece o último valor. São aceitos no máximo 500 relacionamentos por requisição.',
+    response={
+        200: list[LessonRelationOut],
+        401: NotAuthenticated,
+        403: PermissionDeniedEnrolled,
+        404: NotFound,
+    },
+)
+@permission_object_required(Lesson, [is_enrolled], many=True)
+def bulk_update_lesson_relations(
+    request, data: LessonRelationBulkList = Body(...)
+):
+    done = {relation.lesson_id: relation.done for relation in data}
+    courses = dict(
+        request.get_lesson_query()
+        .filter(id__in=done)
+        .values_list('id', 'course_id')
+    )
+    if len(courses) != len(done):
+        missing = done.keys() - courses.keys()
+        if Lesson.objects.filter(id__in=missing).count() != len(missing):
+            raise Http404('No lesson matches the given query.')
+        raise PermissionDenied
+
+    with transaction.atomic():
+        LessonRelation.objects.bulk_create(
+            [
+                LessonRelation(
+                    creator=request.user, lesson_id=lesson_id, done=value
+                )
+                for lesson_id, value in done.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['creator', 'lesson'],
+            update_fields=['done', 'modified'],
+        )
+        rebuild_course_progress(
+            [(request.user.id, course_id) for course_id in courses.values()]
+        )
+
+    return LessonRelation.objects.filter(
+        creator=request.user, lesson_id__in=done
+    ).order_by('lesson_id')
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from educa.apps.lesson.models import Lesson
+from educa.apps.lesson.tasks import resolve_video_duration
+
+
+class Command(BaseCommand):
+    help = 'Resolve a duração dos vídeos das aulas que ainda estão pendentes.'
+
+    def handle(self, *args, **options):
+        pending = Lesson.objects.filter(
+            video_duration_in_seconds=None
+        ).values_list('id', 'video')
+
+        resolved = 0
+        for lesson_id, video in pending.iterator():
+            if resolve_video_duration(lesson_id, video) is not None:
+                resolved += 1
+
+        self.stdout.write(f'{resolved} video durations resolved.')
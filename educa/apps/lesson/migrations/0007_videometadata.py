@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lesson', '0006_remove_lessonrelation_course'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoMetadata',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('video_id', models.CharField(max_length=64, unique=True)),
+                ('duration_in_seconds', models.IntegerField()),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -1,18 +1,39 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from ordered_model.models import OrderedModel
 
 from educa.apps.core.models import ContentBase, CreatorBase, TimeStampedBase
-from educa.apps.core.video import get_video_length
+from educa.apps.core.video import get_video_id
 from educa.apps.course.models import Course
 from educa.apps.module.models import Module
 
 
+class VideoMetadata(models.Model):
+    """
+    Este modelo armazena os metadados de um vídeo do YouTube, compartilhados
+    entre todas as aulas que utilizam o mesmo vídeo.
+
+    Fields:
+        video_id: id do vídeo extraído da url, independente do formato da url.
+        fetched_at: data e hora em que a duração foi obtida.
+    """
+
+    video_id = models.CharField(max_length=64, unique=True)
+    duration_in_seconds = models.IntegerField()
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'VideoMetadata({self.video_id})'
+
+
 class Lesson(ContentBase, TimeStampedBase, OrderedModel):
     """
     Este modelo representa uma aula de um módulo de um curso.
 
     Fields:
         order: representa a sua ordem crescente dentro do módulo, a qual é definida automáticamente.
+        video_duration_in_seconds: duração do vídeo, nula enquanto a duração é resolvida em segundo plano.
     """
 
     video = models.URLField()
@@ -27,16 +48,37 @@ class Lesson(ContentBase, TimeStampedBase, OrderedModel):
         related_name='lessons',
         on_delete=models.CASCADE,
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     order_with_respect_to = 'course'
 
     def save(self, *args, **kwargs):
+        from educa.apps.lesson.tasks import schedule_video_duration
+
         if self.video_duration_in_seconds is None:
-            self.video_duration_in_seconds = get_video_length(self.video)
+            self.video_duration_in_seconds = (
+                VideoMetadata.objects.filter(video_id=get_video_id(self.video))
+                .values_list('duration_in_seconds', flat=True)
+                .first()
+            )
         super().save(*args, **kwargs)
+        if self.video_duration_in_seconds is None:
+            schedule_video_duration(self)
+
+    save.alters_data = True
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            GinIndex(
+                fields=['search_vector'], name='lesson_search_vector_idx'
+            ),
+            GinIndex(
+                fields=['title'],
+                opclasses=['gin_trgm_ops'],
+                name='lesson_title_trgm_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'Lesson({self.title}) - Course({self.course_id})'
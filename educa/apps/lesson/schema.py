@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from ninja import FilterSchema, Schema
-from pydantic import Field, validator
+from pydantic import Field, conlist, validator
 
 
 class LessonIn(Schema):
@@ -17,7 +17,7 @@ class LessonOut(Schema):
     title: str
     description: str
     video: str
-    video_duration_in_seconds: int
+    video_duration_in_seconds: int | None
     order: int
     module_id: int
     course_id: int
@@ -33,7 +33,7 @@ class LessonOut(Schema):
 class LessonFilter(FilterSchema):
     course_id: str | None = Field(q='course_id')
     module_id: str | None = Field(q='module_id__in')
-    title: str | None = Field(q='title__icontains')
+    title: str | None = Field(q='title__trigram_icontains')
 
     @validator('module_id', allow_reuse=True)
     def split_string(cls, value):
@@ -49,16 +49,16 @@ class LessonUpdate(Schema):
 
 
 class LessonRelationOut(Schema):
-    id: int
+    id: int | None
     creator_id: int
     lesson_id: int
     done: bool
-    created: datetime
-    modified: datetime
+    created: datetime | None
+    modified: datetime | None
 
     @validator('created', 'modified', allow_reuse=True)
-    def convert_datetime(cls, value: datetime):
-        return value.isoformat()
+    def convert_datetime(cls, value: datetime | None):
+        return value.isoformat() if value is not None else None
 
 
 class LessonRelationFilter(FilterSchema):
@@ -68,3 +68,15 @@ class LessonRelationFilter(FilterSchema):
 
 class LessonRelationUpdate(Schema):
     done: bool
+
+
+class LessonRelationBulkIn(Schema):
+    lesson_id: int
+    done: bool
+
+
+LESSON_RELATION_BULK_LIMIT = 500
+
+LessonRelationBulkList = conlist(
+    LessonRelationBulkIn, max_items=LESSON_RELATION_BULK_LIMIT
+)
@@ -1,13 +1,17 @@
 from ninja import File, Query, Router
 from ninja.errors import HttpError
 from ninja.files import UploadedFile
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     is_course_instructor,
     is_enrolled,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
@@ -47,7 +51,7 @@ content_router = Router()
         404: NotFound,
     },
 )
-@permission_object_required(Lesson, [is_course_instructor])
+@permission_object_required(Lesson, [is_course_instructor], only=[])
 def create_content(
     request,
     data: ContentIn,
@@ -112,10 +116,14 @@ def get_content(request, content_id: int):
     description='Endpoint para retornar todos os conteúdo de uma aula, módulo ou curso.',
     response={
         200: list[ContentOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
-@permission_object_required(Content, [is_enrolled], many=True)
+@paginate(CursorPagination)
+@permission_object_required(
+    Content, [is_enrolled], many=True, strategy=MEMBERSHIP
+)
 def list_contents(request, filters: ContentFilter = Query(...)):
     return filters.filter(request.get_content_query())
 
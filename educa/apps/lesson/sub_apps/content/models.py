@@ -1,5 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from ordered_model.models import OrderedModel
 
@@ -34,11 +36,17 @@ class Content(ContentBase, TimeStampedBase, OrderedModel):
     )
     object_id = models.PositiveIntegerField()
     item = GenericForeignKey()
+    search_vector = SearchVectorField(null=True, editable=False)
 
     order_with_respect_to = 'lesson'
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            GinIndex(
+                fields=['search_vector'], name='content_search_vector_idx'
+            )
+        ]
 
     def __str__(self):
         return f'Cotent({self.title}) - Course({self.course_id})'
@@ -1,8 +1,11 @@
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import is_enrolled, permission_object_required
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
@@ -31,7 +34,7 @@ note_router = Router()
         404: NotFound,
     },
 )
-@permission_object_required(Lesson, [is_enrolled])
+@permission_object_required(Lesson, [is_enrolled], only=[])
 def create_note(request, data: NoteIn):
     lesson = request.get_lesson()
     return Note.objects.create(**data.dict(), course_id=lesson.course_id)
@@ -59,9 +62,11 @@ def get_note(request, note_id: int):
     description='Endpoint que retorna todos as anotação do usuário de uma aula ou modulo.',
     response={
         200: list[NoteOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
+@paginate(CursorPagination)
 def list_notes(request, filters: NoteFilter = Query(...)):
     query = Note.objects.filter(creator=request.user)
     return filters.filter(query)
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:03
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_trigram_extension'),
+        ('note', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['note'],
+                name='note_note_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
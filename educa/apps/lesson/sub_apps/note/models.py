@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from educa.apps.core.models import CreatorBase, TimeStampedBase
@@ -26,5 +27,14 @@ class Note(CreatorBase, TimeStampedBase):
     time = models.TimeField()
     note = models.TextField()
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=['note'],
+                opclasses=['gin_trgm_ops'],
+                name='note_note_trgm_idx',
+            ),
+        ]
+
     def __str__(self):
         return f'Note({self.creator_id}) - Course({self.course_id})'
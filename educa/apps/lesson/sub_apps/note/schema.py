@@ -35,7 +35,7 @@ class NoteOut(Schema):
 
 class NoteFilter(FilterSchema):
     lesson_id: str | None = Field(q='lesson_id')
-    note: str | None = Field(q='note__icontains')
+    note: str | None = Field(q='note__trigram_icontains')
 
 
 class NoteUpdate(Schema):
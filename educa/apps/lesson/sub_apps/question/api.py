@@ -1,11 +1,15 @@
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     is_creator_object,
     is_enrolled,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
@@ -36,7 +40,7 @@ question_router = Router()
         404: NotFound,
     },
 )
-@permission_object_required(Lesson, [is_enrolled])
+@permission_object_required(Lesson, [is_enrolled], only=[])
 def create_question(request, data: QuestionIn):
     lesson = request.get_lesson()
     return Question.objects.create(**data.dict(), course_id=lesson.course_id)
@@ -66,10 +70,14 @@ def get_question(request, question_id: int):
     description='Endpoint que retorna todos as perguntas de um aula ou modulo.',
     response={
         200: list[QuestionOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
-@permission_object_required(Question, [is_enrolled], many=True)
+@paginate(CursorPagination)
+@permission_object_required(
+    Question, [is_enrolled], many=True, strategy=MEMBERSHIP
+)
 def list_questions(request, filters: QuestionFilter = Query(...)):
     query = request.get_question_query()
     return filters.filter(query)
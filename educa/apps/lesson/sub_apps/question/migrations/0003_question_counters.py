@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:50
+
+from django.db import migrations, models
+
+from educa.apps.generic.backfill import fill_counters
+
+
+def fill_question_counters(apps, schema_editor):
+    fill_counters(apps, apps.get_model('question', 'Question'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('question', '0002_initial'),
+        ('action', '0004_action_action_content_object_idx_and_more'),
+        (
+            'answer',
+            '0006_answer_level_answer_lft_answer_parent_answer_rght_and_more',
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='answer_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            fill_question_counters, migrations.RunPython.noop
+        ),
+    ]
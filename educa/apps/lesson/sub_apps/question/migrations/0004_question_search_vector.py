@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def fill_search_vector(apps, schema_editor):
+    """
+    Preenche o vetor de busca das perguntas já existentes, com os mesmos
+    pesos de educa.apps.search.vectors.
+    """
+    Question = apps.get_model('question', 'Question')
+    Question.objects.update(
+        search_vector=SearchVector(
+            'title', weight='A', config=settings.SEARCH_CONFIG
+        )
+        + SearchVector('content', weight='B', config=settings.SEARCH_CONFIG)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('question', '0003_question_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(fill_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='question',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['search_vector'], name='question_search_vector_idx'
+            ),
+        ),
+    ]
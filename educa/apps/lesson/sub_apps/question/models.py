@@ -1,4 +1,6 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxLengthValidator
 from django.db import models
 from django.urls import reverse
@@ -7,10 +9,13 @@ from educa.apps.core.models import CreatorBase, TimeStampedBase
 from educa.apps.course.models import Course
 from educa.apps.generic.action.models import Action
 from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.models import ActionCounterBase, AnswerCounterBase
 from educa.apps.lesson.models import Lesson
 
 
-class Question(CreatorBase, TimeStampedBase):
+class Question(
+    CreatorBase, TimeStampedBase, AnswerCounterBase, ActionCounterBase
+):
     """
     Este modelo representa uma pergunta que pode ser feita pelos alunos sobre uma determinada aula.
     """
@@ -29,6 +34,19 @@ class Question(CreatorBase, TimeStampedBase):
     content = models.TextField(validators=[MaxLengthValidator(1000)])
     actions = GenericRelation(Action)
     answers = GenericRelation(Answer)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=['search_vector'], name='question_search_vector_idx'
+            ),
+            GinIndex(
+                fields=['title'],
+                opclasses=['gin_trgm_ops'],
+                name='question_title_trgm_idx',
+            ),
+        ]
 
     def get_absolute_url(self):
         return reverse(
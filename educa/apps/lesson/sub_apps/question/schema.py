@@ -17,6 +17,9 @@ class QuestionOut(Schema):
     creator_id: int
     title: str
     content: str
+    answer_count: int
+    like_count: int
+    dislike_count: int
     created: datetime
     modified: datetime
 
@@ -33,7 +36,7 @@ class QuestionUpdate(Schema):
 class QuestionFilter(FilterSchema):
     course_id: int | None = Field(q='course_id')
     lesson_id: str | None = Field(q='lesson_id__in')
-    title: str | None = Field(q='title__icontains')
+    title: str | None = Field(q='title__trigram_icontains')
 
     @validator('lesson_id', allow_reuse=True)
     def split_string(cls, value):
@@ -0,0 +1,103 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+from educa.apps.core.video import get_video_id
+from educa.apps.course.stats import update_course_stats
+from educa.apps.lesson.models import Lesson, VideoMetadata
+
+logger = logging.getLogger(__name__)
+
+executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='video-duration'
+)
+_video_locks = [Lock() for _ in range(32)]
+
+
+def get_video_duration(video: str) -> int:
+    """
+    Retorna a duração do vídeo a partir da tabela VideoMetadata e apenas
+    chama o resolvedor quando o vídeo ainda não é conhecido. Resoluções
+    simultâneas do mesmo vídeo no processo aguardam a primeira terminar.
+    """
+    video_id = get_video_id(video)
+    with _video_locks[hash(video_id) % len(_video_locks)]:
+        duration = (
+            VideoMetadata.objects.filter(video_id=video_id)
+            .values_list('duration_in_seconds', flat=True)
+            .first()
+        )
+        if duration is None:
+            resolver = import_string(settings.VIDEO_DURATION_RESOLVER)
+            duration = resolver(video)
+            VideoMetadata.objects.update_or_create(
+                video_id=video_id,
+                defaults={'duration_in_seconds': duration},
+            )
+        return duration
+
+
+def resolve_video_duration(lesson_id: int, video: str) -> int | None:
+    """
+    Resolve a duração do vídeo, tentando novamente em caso de falha, e salva
+    a duração na aula caso o vídeo não tenha sido alterado nesse meio tempo.
+    """
+    for attempt in range(settings.VIDEO_DURATION_RETRIES):
+        try:
+            duration = get_video_duration(video)
+        except ValidationError:
+            logger.warning('invalid video %s for lesson %s', video, lesson_id)
+            return None
+        except Exception:
+            logger.exception(
+                'could not resolve video %s duration (attempt %s)',
+                video,
+                attempt + 1,
+            )
+            if attempt + 1 < settings.VIDEO_DURATION_RETRIES:
+                sleep(settings.VIDEO_DURATION_RETRY_DELAY * 2**attempt)
+        else:
+            updated = Lesson.objects.filter(
+                id=lesson_id, video=video, video_duration_in_seconds=None
+            ).update(video_duration_in_seconds=duration)
+            if updated:
+                course_id = (
+                    Lesson.objects.filter(id=lesson_id)
+                    .values_list('course_id', flat=True)
+                    .first()
+                )
+                update_course_stats(course_id, total_video_duration=duration)
+            return duration
+
+    return None
+
+
+def _resolve_in_background(lesson_id: int, video: str):
+    try:
+        resolve_video_duration(lesson_id, video)
+    finally:
+        connection.close()
+
+
+def schedule_video_duration(lesson: Lesson):
+    """
+    Agenda a resolução da duração do vídeo da aula para depois do commit da
+    transação atual, ou resolve imediatamente caso VIDEO_DURATION_ASYNC seja
+    falso.
+    """
+    if not settings.VIDEO_DURATION_ASYNC:
+        lesson.video_duration_in_seconds = resolve_video_duration(
+            lesson.id, lesson.video
+        )
+        return
+
+    lesson_id, video = lesson.id, lesson.video
+    transaction.on_commit(
+        lambda: executor.submit(_resolve_in_background, lesson_id, video)
+    )
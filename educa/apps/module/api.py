@@ -1,11 +1,14 @@
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
+from ninja.pagination import paginate
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
     is_course_instructor,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedInstructor,
@@ -62,8 +65,12 @@ def get_module(request, module_id: int):
     tags=['Módulo'],
     summary='Listar todos módulos',
     description='Endpoint que retorna todos dos módulos ou apenas os módulos de um curso.',
-    response=list[ModuleOut],
+    response={
+        200: list[ModuleOut],
+        400: InvalidCursor,
+    },
 )
+@paginate(CursorPagination)
 def list_modules(request, filters: ModuleFilter = Query(...)):
     return filters.filter(Module.objects.all())
 
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from ordered_model.models import OrderedModel
 
@@ -23,6 +24,13 @@ class Module(ContentBase, TimeStampedBase, OrderedModel):
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            GinIndex(
+                fields=['title'],
+                opclasses=['gin_trgm_ops'],
+                name='module_title_trgm_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'Module({self.title}) Course({self.id})'
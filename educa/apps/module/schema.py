@@ -34,4 +34,4 @@ class ModuleUpdate(Schema):
 
 class ModuleFilter(FilterSchema):
     course_id: int | None
-    title: str | None = Field(q='title__icontains')
+    title: str | None = Field(q='title__trigram_icontains')
@@ -1,21 +1,26 @@
-from django.db.models import Count
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
 from ninja.errors import HttpError
+from ninja.pagination import paginate
 from ninja.responses import Response
 
+from educa.apps.core.pagination import CursorPagination
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     is_course_instructor,
     is_enrolled,
     permission_object_required,
 )
 from educa.apps.core.schema import (
+    InvalidCursor,
     NotAuthenticated,
     NotFound,
     PermissionDeniedEnrolled,
     PermissionDeniedInstructor,
 )
 from educa.apps.course.models import Course
+from educa.apps.course.progress import update_course_progress
 from educa.apps.module.models import Module
 from educa.apps.module.sub_apps.quiz.api_relation import quiz_relation_router
 from educa.apps.module.sub_apps.quiz.models import (
@@ -36,6 +41,11 @@ from educa.apps.module.sub_apps.quiz.schema import (
     QuizOut,
     QuizUpdate,
 )
+from educa.apps.module.sub_apps.quiz.scoring import (
+    get_answer_key,
+    invalidate_answer_key,
+    score_quiz,
+)
 from educa.apps.user.auth.token import AuthBearer
 
 quiz_router = Router(auth=AuthBearer())
@@ -54,7 +64,7 @@ quiz_router.add_router('/relation/', quiz_relation_router)
         404: NotFound,
     },
 )
-@permission_object_required(Module, [is_course_instructor])
+@permission_object_required(Module, [is_course_instructor], only=[])
 def create_quiz(request, data: QuizIn):
     module = request.get_module()
     return Quiz.objects.create(**data.dict(), course_id=module.course_id)
@@ -72,10 +82,14 @@ def create_quiz(request, data: QuizIn):
         404: NotFound,
     },
 )
-@permission_object_required(Quiz, [is_course_instructor])
+@permission_object_required(Quiz, [is_course_instructor], only=[])
 def create_quiz_question(request, data: QuestionIn):
     quiz = request.get_quiz()
-    return QuizQuestion.objects.create(**data.dict(), course_id=quiz.course_id)
+    question = QuizQuestion.objects.create(
+        **data.dict(), course_id=quiz.course_id
+    )
+    invalidate_answer_key(quiz.id)
+    return question
 
 
 @quiz_router.get(
@@ -85,14 +99,17 @@ def create_quiz_question(request, data: QuestionIn):
     description='Endpoint para retornar todos os questionários.',
     response={
         200: list[QuizOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
+@paginate(CursorPagination)
 @permission_object_required(
     model=Quiz,
     permissions=[is_enrolled],
     extra_query=lambda query: query.prefetch_related('questions'),
     many=True,
+    strategy=MEMBERSHIP,
 )
 def list_quiz(request, filters: QuizFilter = Query(...)):
     return filters.filter(request.get_quiz_query())
@@ -135,6 +152,7 @@ def get_quiz(request, quiz_id: int):
 def delete_quiz(request, quiz_id: int):
     quiz = request.get_quiz()
     quiz.delete()
+    invalidate_answer_key(quiz_id)
     return 204, None
 
 
@@ -154,6 +172,7 @@ def delete_quiz(request, quiz_id: int):
 def delete_quiz_question(request, quiz_id: int, question_id: int):
     question = get_object_or_404(QuizQuestion, id=question_id, quiz_id=quiz_id)
     question.delete()
+    invalidate_answer_key(quiz_id)
     return 204, None
 
 
@@ -176,6 +195,7 @@ def update_quiz(request, quiz_id: int, data: QuizUpdate):
     for key, value in data.dict(exclude_unset=True).items():
         setattr(quiz, key, value)
     quiz.save()
+    invalidate_answer_key(quiz.id)
 
     return quiz
 
@@ -201,6 +221,7 @@ def update_quiz_question(
     for key, value in data.dict(exclude_unset=True).items():
         setattr(question, key, value)
     question.save()
+    invalidate_answer_key(quiz_id)
 
     return question
 
@@ -219,47 +240,32 @@ def update_quiz_question(
         409: AlreadyCompletedQuiz,
     },
 )
-@permission_object_required(
-    model=Quiz,
-    permissions=[is_enrolled],
-    extra_query=lambda query: query.prefetch_related('questions').annotate(
-        questions_count=Count('questions', distinct=True)
-    ),
-)
+@permission_object_required(Quiz, [is_enrolled], only=['pass_percent'])
 def check_quiz(request, quiz_id: int, data: QuizCheckIn):
     quiz = request.get_quiz()
-    relation, _ = QuizRelation.objects.get_or_create(
-        creator=request.user, quiz=quiz
-    )
+    answer_key = get_answer_key(quiz)
 
-    if relation.done:
-        raise HttpError(
-            message='you already completed this quiz.', status_code=409
+    with transaction.atomic():
+        relation, _ = QuizRelation.objects.select_for_update().get_or_create(
+            creator=request.user, quiz=quiz
         )
 
-    invalid_data = HttpError(
-        message='the question data is invalid.', status_code=400
-    )
-    if len(data.response) != quiz.questions_count:
-        raise invalid_data
-
-    total = 0
-    wrong_questions = []
-    for question_id, response_index in data.response.items():
-        question = quiz.questions.filter(id=question_id).first()
-        if question is None:
-            raise invalid_data
-        if question.correct_response == int(response_index):
-            total += 1
-        else:
-            wrong_questions.append(question.id)
+        if relation.done:
+            raise HttpError(
+                message='you already completed this quiz.', status_code=409
+            )
 
-    correct_percent = (total * 100) / quiz.questions_count
-    correct = correct_percent >= quiz.pass_percent
+        correct_percent, wrong_questions = score_quiz(
+            answer_key['answers'], data.response
+        )
+        correct = correct_percent >= answer_key['pass_percent']
 
-    if correct:
-        relation.done = True
-        relation.save()
+        if correct:
+            relation.done = True
+            relation.save()
+            update_course_progress(
+                request.user.id, quiz.course_id, quizzes_done=1
+            )
 
     return Response(
         {
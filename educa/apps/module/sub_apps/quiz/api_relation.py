@@ -1,7 +1,11 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
+from ninja.pagination import paginate
 
-from educa.apps.core.schema import NotAuthenticated, NotFound
+from educa.apps.core.pagination import CursorPagination
+from educa.apps.core.schema import InvalidCursor, NotAuthenticated, NotFound
+from educa.apps.course.progress import update_course_progress
 from educa.apps.module.sub_apps.quiz.models import QuizRelation
 from educa.apps.module.sub_apps.quiz.schema import (
     QuizRelationFilter,
@@ -19,9 +23,11 @@ quiz_relation_router = Router(auth=AuthBearer())
     description='Endpoint para listar todos os relacionamentos do usuários com aulas.',
     response={
         200: list[QuizRelationOut],
+        400: InvalidCursor,
         401: NotAuthenticated,
     },
 )
+@paginate(CursorPagination)
 def list_quiz_relations(request, filters: QuizRelationFilter = Query(...)):
     return filters.filter(QuizRelation.objects.filter(creator=request.user))
 
@@ -38,8 +44,17 @@ def list_quiz_relations(request, filters: QuizRelationFilter = Query(...)):
     },
 )
 def delete_quiz_relation(request, quiz_id: int):
-    relation = get_object_or_404(
-        QuizRelation, quiz_id=quiz_id, creator=request.user
-    )
-    relation.delete()
+    with transaction.atomic():
+        relation = get_object_or_404(
+            QuizRelation.objects.select_for_update(
+                of=('self',)
+            ).select_related('quiz'),
+            quiz_id=quiz_id,
+            creator=request.user,
+        )
+        relation.delete()
+        if relation.done:
+            update_course_progress(
+                request.user.id, relation.quiz.course_id, quizzes_done=-1
+            )
     return 204, None
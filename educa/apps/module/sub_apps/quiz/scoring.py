@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from ninja.errors import HttpError
+
+from educa.apps.module.sub_apps.quiz.models import Quiz, QuizQuestion
+
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 10
+
+
+def _answer_key_cache_key(quiz_id: int) -> str:
+    return f'quiz:{quiz_id}:answer_key'
+
+
+def get_answer_key(quiz: Quiz) -> dict:
+    """
+    Retorna o gabarito do questionário a partir do cache, buscando no banco
+    com uma única consulta apenas os ids e as respostas corretas.
+
+    Returns:
+        answers (dict[int, int]): {id da questão: índice da resposta correta}.
+        pass_percent (int): porcentagem mínima para concluir o questionário.
+        questions_count (int): quantidade de questões do questionário.
+    """
+    key = _answer_key_cache_key(quiz.id)
+    answer_key = cache.get(key)
+    if answer_key is None:
+        answers = dict(
+            QuizQuestion.objects.filter(quiz_id=quiz.id).values_list(
+                'id', 'correct_response'
+            )
+        )
+        answer_key = {
+            'answers': answers,
+            'pass_percent': quiz.pass_percent,
+            'questions_count': len(answers),
+        }
+        cache.set(key, answer_key, ANSWER_KEY_CACHE_TIMEOUT)
+    return answer_key
+
+
+def invalidate_answer_key(quiz_id: int):
+    cache.delete(_answer_key_cache_key(quiz_id))
+
+
+def score_quiz(
+    answers: dict[int, int], response: dict[str, str]
+) -> tuple[float, list[int]]:
+    """
+    Corrige em memória as respostas enviadas, retornando a porcentagem de
+    acerto e as questões erradas na ordem em que foram enviadas.
+    """
+    invalid_data = HttpError(
+        message='the question data is invalid.', status_code=400
+    )
+    if not answers or len(response) != len(answers):
+        raise invalid_data
+
+    try:
+        submitted = {
+            int(question_id): int(response_index)
+            for question_id, response_index in response.items()
+        }
+    except ValueError:
+        raise invalid_data
+
+    if submitted.keys() != answers.keys():
+        raise invalid_data
+
+    wrong_questions = [
+        question_id
+        for question_id, response_index in submitted.items()
+        if answers[question_id] != response_index
+    ]
+    total = len(answers) - len(wrong_questions)
+    return (total * 100) / len(answers), wrong_questions
@@ -0,0 +1,30 @@
+from ninja import Query, Router
+
+from educa.apps.core.permissions import get_course_membership
+from educa.apps.core.schema import NotAuthenticated
+from educa.apps.search.query import search_objects
+from educa.apps.search.schema import SearchResultOut
+from educa.apps.user.auth.token import AuthBearer
+
+search_router = Router(auth=AuthBearer())
+
+
+@search_router.get(
+    '',
+    tags=['Busca'],
+    summary='Buscar',
+    description='Endpoint para buscar cursos, aulas, perguntas e conteúdos ordenados pela relevância. Aulas, perguntas e conteúdos são retornados apenas dos cursos em que o usuário está matriculado ou é instrutor.',
+    response={
+        200: list[SearchResultOut],
+        401: NotAuthenticated,
+    },
+)
+def search(
+    request,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+):
+    membership = get_course_membership(request)
+    return search_objects(
+        q, membership['instructor'] | membership['student'], limit
+    )
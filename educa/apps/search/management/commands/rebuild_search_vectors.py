@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from educa.apps.search.vectors import SEARCH_FIELDS, update_search_vectors
+
+
+class Command(BaseCommand):
+    help = 'Recalcula os vetores de busca de cursos, aulas, perguntas e conteúdos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        for model in SEARCH_FIELDS:
+            object_ids = model.objects.order_by('id').values_list(
+                'id', flat=True
+            )
+            rebuilt, last_id = 0, 0
+            while batch := list(
+                object_ids.filter(id__gt=last_id)[:batch_size]
+            ):
+                update_search_vectors(model, batch)
+                rebuilt += len(batch)
+                last_id = batch[-1]
+
+            self.stdout.write(
+                f'{rebuilt} {model._meta.verbose_name_plural} rebuilt.'
+            )
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Value
+
+from educa.apps.course.models import Course
+from educa.apps.lesson.models import Lesson
+from educa.apps.lesson.sub_apps.content.models import Content
+from educa.apps.lesson.sub_apps.question.models import Question
+
+SEARCH_MODELS = {
+    'course': Course,
+    'lesson': Lesson,
+    'question': Question,
+    'content': Content,
+}
+
+RESULT_FIELDS = ['type', 'id', 'course_id', 'title', 'rank']
+
+
+def search_objects(text: str, course_ids: set[int], limit: int) -> list[dict]:
+    """
+    Busca o texto nos cursos, aulas, perguntas e conteúdos com uma única
+    consulta, unindo os resultados de cada tabela ordenados pela relevância.
+    Aulas, perguntas e conteúdos são buscados apenas nos cursos informados.
+
+    Returns:
+        lista de {type, id, course_id, title, rank}, da maior para a menor
+        relevância.
+    """
+    query = SearchQuery(
+        text, search_type='websearch', config=settings.SEARCH_CONFIG
+    )
+
+    querysets = []
+    for name, model in SEARCH_MODELS.items():
+        queryset = model.objects.filter(search_vector=query)
+        if model is not Course:
+            if not course_ids:
+                continue
+            queryset = queryset.filter(course_id__in=course_ids)
+        # Todas as colunas são anotações na mesma ordem para que o UNION
+        # combine as mesmas colunas de cada tabela.
+        queryset = (
+            queryset.annotate(
+                result_type=Value(name),
+                result_id=F('id'),
+                result_course_id=F('id' if model is Course else 'course_id'),
+                result_title=F('title'),
+                result_rank=SearchRank(F('search_vector'), query),
+            )
+            .values(*(f'result_{field}' for field in RESULT_FIELDS))
+            .order_by('-result_rank', 'result_id')[:limit]
+        )
+        querysets.append(queryset)
+
+    results = querysets[0]
+    if len(querysets) > 1:
+        results = results.union(*querysets[1:], all=True).order_by(
+            '-result_rank', 'result_type', 'result_id'
+        )[:limit]
+    return [
+        {field: row[f'result_{field}'] for field in RESULT_FIELDS}
+        for row in results
+    ]
@@ -0,0 +1,9 @@
+from ninja import Schema
+
+
+class SearchResultOut(Schema):
+    type: str
+    id: int
+    course_id: int
+    title: str
+    rank: float
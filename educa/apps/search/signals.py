@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save
+
+from educa.apps.search.vectors import SEARCH_FIELDS, update_search_vectors
+
+
+def update_instance_search_vector(sender, instance, update_fields, **kwargs):
+    """
+    Atualiza o vetor de busca após salvar o objeto, ignorando os saves que
+    não alteram os campos utilizados na busca.
+    """
+    if update_fields is not None and not (
+        set(update_fields) & set(SEARCH_FIELDS[sender])
+    ):
+        return
+    update_search_vectors(sender, [instance.id])
+
+
+for model in SEARCH_FIELDS:
+    post_save.connect(update_instance_search_vector, sender=model)
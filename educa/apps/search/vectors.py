@@ -0,0 +1,38 @@
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Model
+
+from educa.apps.course.models import Course
+from educa.apps.lesson.models import Lesson
+from educa.apps.lesson.sub_apps.content.models import Content
+from educa.apps.lesson.sub_apps.question.models import Question
+
+SEARCH_FIELDS = {
+    Course: {'title': 'A', 'description': 'B'},
+    Lesson: {'title': 'A', 'description': 'B'},
+    Question: {'title': 'A', 'content': 'B'},
+    Content: {'title': 'A', 'description': 'B'},
+}
+
+
+def get_search_vector(model: type[Model]) -> SearchVector:
+    """
+    Monta o vetor de busca do modelo, o título tem peso maior que o texto.
+    """
+    vectors = [
+        SearchVector(field, weight=weight, config=settings.SEARCH_CONFIG)
+        for field, weight in SEARCH_FIELDS[model].items()
+    ]
+    return reduce(operator.add, vectors)
+
+
+def update_search_vectors(model: type[Model], object_ids: list[int]):
+    """
+    Recalcula no banco o vetor de busca dos objetos em uma única consulta.
+    """
+    model.objects.filter(id__in=object_ids).update(
+        search_vector=get_search_vector(model)
+    )
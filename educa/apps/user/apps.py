@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'educa.apps.user'
+
+    def ready(self):
+        from educa.apps.user import signals  # noqa: F401
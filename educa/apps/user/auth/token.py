@@ -1,20 +1,36 @@
+from copy import copy
 from datetime import datetime, timedelta
+from hashlib import sha256
+from time import time
+from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from jose import JWTError, jwt
 from ninja.security import HttpBearer
 
+from educa.apps.core.cache import LRUCache
 from educa.apps.user.auth.expection import InvalidToken
 from educa.apps.user.models import User
 
 TOKEN_EXPIRATION_DELTA = timedelta(days=30)
 ALGORITHM = 'HS256'
 
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 4096
+USER_STAMP_TIMEOUT = 24 * 60 * 60
+
+user_cache = LRUCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+token_cache = LRUCache(maxsize=TOKEN_CACHE_SIZE)
+
 
 def create_jwt_access_token(user: User) -> str:
     data = {
         'sub': user.email,
+        'uid': user.id,
+        'ver': user.token_version,
         'name': user.name,
         'iat': datetime.utcnow(),
         'exp': timezone.now() + TOKEN_EXPIRATION_DELTA,
@@ -23,20 +39,101 @@ def create_jwt_access_token(user: User) -> str:
     return jwt.encode(data, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+def decode_jwt_access_token(token: str) -> dict:
+    """
+    Decodifica e verifica o token apenas na primeira vez em que ele é visto,
+    as próximas requisições com o mesmo token utilizam o payload do cache até
+    a expiração do token.
+    """
+    key = sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        if payload.get('exp') is None or payload['exp'] > time():
+            return dict(payload)
+        token_cache.delete(key)
+
+    payload = jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=[ALGORITHM],
+        options={'require_sub': True},
+    )
+
+    exp = payload.get('exp')
+    if exp is None:
+        token_cache.set(key, payload)
+    elif exp > time():
+        token_cache.set(key, payload, ttl=exp - time())
+    return dict(payload)
+
+
+def get_user_stamp_key(user_id: int) -> str:
+    return f'auth-user-stamp:{user_id}'
+
+
+def touch_user_stamp(user_id: int):
+    """
+    Troca o carimbo do usuário no cache compartilhado, invalidando o usuário
+    guardado no cache de todos os processos.
+    """
+    cache.set(get_user_stamp_key(user_id), uuid4().hex, USER_STAMP_TIMEOUT)
+
+
+def get_user_stamp(user_id: int) -> str:
+    key = get_user_stamp_key(user_id)
+    stamp = cache.get(key)
+    if stamp is None:
+        stamp = uuid4().hex
+        if not cache.add(key, stamp, USER_STAMP_TIMEOUT):
+            stamp = cache.get(key, stamp)
+    return stamp
+
+
+def get_token_user(user_id: int, version: int) -> User | None:
+    """
+    Retorna o usuário do token utilizando o cache do processo, o usuário só é
+    buscado no banco quando não está no cache ou foi alterado.
+
+    O usuário do cache do processo só é utilizado enquanto o carimbo do
+    usuário no cache compartilhado do Django for o mesmo de quando ele foi
+    guardado. Toda alteração do usuário troca o carimbo, assim desativar o
+    usuário ou trocar a senha revoga os tokens em todos os processos na
+    próxima requisição. Isso depende de CACHES apontar para um cache
+    compartilhado entre os processos (Redis, Memcached), com o LocMemCache
+    a revogação só alcança o processo que alterou o usuário e os demais
+    continuam aceitando os tokens antigos por até USER_CACHE_TTL segundos.
+    """
+    stamp = get_user_stamp(user_id)
+    cached = user_cache.get(user_id)
+    if cached is not None and cached[0] == stamp:
+        user = cached[1]
+    else:
+        user = User.objects.filter(id=user_id, is_active=True).first()
+        if user is None:
+            return None
+        user_cache.set(user_id, (stamp, user))
+
+    if user.token_version == version:
+        return copy(user)
+
+
 class AuthBearer(HttpBearer):
     def authenticate(self, request, token):
         try:
-            payload = jwt.decode(
-                token,
-                settings.SECRET_KEY,
-                algorithms=[ALGORITHM],
-                options={'require_sub': True},
-            )
+            payload = decode_jwt_access_token(token)
             email: str = payload.get('sub')
+            user_id: int | None = payload.get('uid')
+            version: int | None = payload.get('ver')
         except JWTError:
             raise InvalidToken
 
-        user = User.objects.filter(email=email).first()
+        if user_id is not None and version is not None:
+            user = get_token_user(user_id, version)
+        elif settings.ACCEPT_UNVERSIONED_TOKENS:
+            user = User.objects.filter(email=email, is_active=True).first()
+        else:
+            user = None
+
         if user is None:
             raise InvalidToken
 
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0002_alter_user_bio_alter_user_job_title_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(
+                default=0, verbose_name='Token Version'
+            ),
+        ),
+    ]
@@ -35,6 +35,9 @@ class UserManager(BaseUserManager):
 class User(AbstractUser):
     """
     Esse modelo representa um usuário que seja estudante ou um instrutor de um curso.
+
+    Fields:
+        token_version: versão dos tokens do usuário, incrementada a cada troca de senha.
     """
 
     email = models.EmailField(_('E-mail'), unique=True)
@@ -43,9 +46,21 @@ class User(AbstractUser):
     job_title = models.CharField(max_length=255, null=True)
     locale = models.CharField(max_length=255, null=True)
     bio = models.TextField(null=True)
+    token_version = models.PositiveIntegerField(_('Token Version'), default=0)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name', 'username']
 
     def __str__(self):
         return f'User({self.username})'
+
+    def save(self, *args, **kwargs):
+        # a troca de senha invalida todos os tokens emitidos anteriormente.
+        if self._password is not None and self.pk is not None:
+            self.token_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+        super().save(*args, **kwargs)
+
+    save.alters_data = True
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from educa.apps.user.auth.token import touch_user_stamp, user_cache
+from educa.apps.user.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    O carimbo é trocado na alteração e novamente após o commit, assim um
+    processo que buscou o usuário antes do commit não mantém a versão
+    anterior no cache.
+    """
+    user_id = instance.pk
+    user_cache.delete(user_id)
+    touch_user_stamp(user_id)
+    transaction.on_commit(lambda: touch_user_stamp(user_id))
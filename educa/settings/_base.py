@@ -38,7 +38,9 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # application apps
+    'educa.apps.core',
     'educa.apps.generic.action',
     'educa.apps.generic.answer',
     'educa.apps.course',
@@ -51,6 +53,7 @@ INSTALLED_APPS = [
     'educa.apps.lesson.sub_apps.question',
     'educa.apps.module',
     'educa.apps.module.sub_apps.quiz',
+    'educa.apps.search',
     'educa.apps.user',
 ]
 
@@ -99,6 +102,35 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Auth
+# tokens sem as claims uid e ver, emitidos antes da versão dos tokens, não
+# podem ser revogados, desativar após TOKEN_EXPIRATION_DELTA (30 dias) da
+# implantação para rejeitá-los
+
+ACCEPT_UNVERSIONED_TOKENS = True
+
+# Video duration
+# resolvido em segundo plano após o commit da aula
+
+VIDEO_DURATION_RESOLVER = 'educa.apps.core.video.get_video_length'
+VIDEO_DURATION_ASYNC = True
+VIDEO_DURATION_RETRIES = 3
+VIDEO_DURATION_RETRY_DELAY = 1
+
+# Search
+# configuração do Postgres utilizada nos vetores e consultas de busca
+
+SEARCH_CONFIG = 'portuguese'
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -9,3 +9,6 @@ DEBUG = False
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
+
+VIDEO_DURATION_RESOLVER = 'educa.apps.core.video.get_stub_video_length'
+VIDEO_DURATION_ASYNC = False
@@ -1,4 +1,6 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 
 from tests.client import Client
@@ -12,3 +14,22 @@ def client():
 @pytest.fixture
 def django_test():
     return TestCase()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def explain():
+    """
+    Retorna o plano da consulta com a leitura sequencial desabilitada, com
+    poucas linhas o planejador sempre a prefere, assim o plano mostra se
+    existe um índice que atende a consulta. A ordenação padrão é removida
+    para que o índice da ordenação não seja escolhido no lugar do filtro.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    return lambda queryset: queryset.order_by().explain()
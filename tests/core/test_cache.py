@@ -0,0 +1,53 @@
+from unittest import mock
+
+from educa.apps.core.cache import LRUCache
+
+
+def test_lru_cache_get_and_set():
+    cache = LRUCache(maxsize=2)
+
+    cache.set('foo', 1)
+
+    assert cache.get('foo') == 1
+    assert cache.get('bar') is None
+    assert cache.get('bar', 2) == 2
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set('foo', 1)
+    cache.set('bar', 2)
+    cache.get('foo')
+
+    cache.set('baz', 3)
+
+    assert len(cache) == 2
+    assert cache.get('bar') is None
+    assert cache.get('foo') == 1
+    assert cache.get('baz') == 3
+
+
+def test_lru_cache_entry_expires():
+    cache = LRUCache(maxsize=2, ttl=10)
+
+    with mock.patch('educa.apps.core.cache.monotonic', return_value=100):
+        cache.set('foo', 1)
+        cache.set('bar', 2, ttl=30)
+
+    with mock.patch('educa.apps.core.cache.monotonic', return_value=115):
+        assert cache.get('foo') is None
+        assert cache.get('bar') == 2
+        assert len(cache) == 1
+
+
+def test_lru_cache_delete_and_clear():
+    cache = LRUCache(maxsize=2)
+    cache.set('foo', 1)
+    cache.set('bar', 2)
+
+    cache.delete('foo')
+    cache.delete('not_found')
+    assert cache.get('foo') is None
+
+    cache.clear()
+    assert len(cache) == 0
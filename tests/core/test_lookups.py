@@ -0,0 +1,71 @@
+import pytest
+
+from educa.apps.course.sub_apps.message.models import Message
+from educa.apps.lesson.models import Lesson
+from educa.apps.lesson.sub_apps.note.models import Note
+from educa.apps.lesson.sub_apps.question.models import Question
+from educa.apps.module.models import Module
+from tests.client import api_v1_url
+from tests.lesson.factories.lesson import LessonFactory
+from tests.lesson.factories.note import NoteFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_trigram_icontains_is_case_insensitive():
+    lesson = LessonFactory(title='Introdução ao Django')
+    LessonFactory(title='Introdução ao Flask')
+
+    assert list(Lesson.objects.filter(title__trigram_icontains='DJANGO')) == [
+        lesson
+    ]
+
+
+def test_trigram_icontains_escapes_wildcards():
+    lesson = LessonFactory(title='100% python_3')
+    LessonFactory(title='1000 pythons')
+
+    assert list(
+        Lesson.objects.filter(title__trigram_icontains='0% python_')
+    ) == [lesson]
+
+
+def test_trigram_icontains_does_not_wrap_column():
+    sql = str(Lesson.objects.filter(title__trigram_icontains='django').query)
+
+    assert '"lesson_lesson"."title" ILIKE' in sql
+    assert 'UPPER' not in sql
+
+
+@pytest.mark.parametrize(
+    'queryset, index',
+    [
+        (Lesson.objects.filter(title__trigram_icontains='django'), 'lesson'),
+        (
+            Question.objects.filter(title__trigram_icontains='django'),
+            'question',
+        ),
+        (
+            Message.objects.filter(title__trigram_icontains='django'),
+            'message',
+        ),
+        (Module.objects.filter(title__trigram_icontains='django'), 'module'),
+        (Note.objects.filter(note__trigram_icontains='django'), 'note'),
+    ],
+)
+def test_trigram_index(explain, queryset, index):
+    field = 'note' if index == 'note' else 'title'
+
+    assert f'{index}_{field}_trgm_idx' in explain(queryset)
+
+
+def test_list_notes_filter_uses_trigram_lookup(client):
+    note = NoteFactory(note='Revisar o Django ORM')
+    NoteFactory(note='Revisar o Flask', creator=note.creator)
+
+    client.login(note.creator)
+    response = client.get(
+        api_v1_url('list_notes', query_params={'note': 'django orm'})
+    )
+
+    assert [item['id'] for item in response.json()['items']] == [note.id]
@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db.models import Q
+from ninja.errors import HttpError
+
+from educa.apps.core.pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    get_keyset_ordering,
+    keyset_filter,
+)
+from educa.apps.course.models import Course, CourseRelation
+from educa.apps.course.schema import CourseOut
+from educa.apps.course.sub_apps.rating.models import Rating
+from educa.apps.lesson.models import Lesson
+from tests.client import api_v1_url
+from tests.course.factories.course import CourseFactory
+from tests.course.factories.rating import RatingFactory
+
+
+def test_encode_and_decode_cursor():
+    values = [datetime(2023, 5, 1, 10, 30, 15, 123456, timezone.utc), 5]
+
+    cursor = encode_cursor(values)
+
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == [values[0].isoformat(), 5]
+
+
+@pytest.mark.parametrize('cursor', ['invalid', 'e30', '!!!'])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(HttpError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    'queryset, ordering',
+    [
+        (Course.objects.all(), ['id']),
+        (Rating.objects.all(), ['created', 'pk']),
+        (Lesson.objects.all(), ['order', 'pk']),
+        (CourseRelation.objects.all(), ['pk']),
+        (Course.objects.order_by('-title'), ['-title', 'pk']),
+    ],
+)
+def test_get_keyset_ordering(queryset, ordering):
+    assert get_keyset_ordering(queryset) == ordering
+
+
+def test_keyset_filter():
+    query = keyset_filter(['order', '-pk'], [3, 10])
+
+    assert query == Q(order__gt=3) | Q(order=3, pk__lt=10)
+
+
+@pytest.mark.django_db
+def test_paginate_courses(client):
+    courses = CourseFactory.create_batch(7)
+
+    items, cursor = [], None
+    for _ in range(3):
+        query_params = {'limit': 3}
+        if cursor is not None:
+            query_params['cursor'] = cursor
+        response = client.get(api_v1_url('list_courses', query_params))
+        assert response.status_code == 200
+        items.extend(response.json()['items'])
+        cursor = response.json()['next']
+
+    assert cursor is None
+    assert items == [CourseOut.from_orm(course) for course in courses]
+
+
+@pytest.mark.django_db
+def test_paginate_ratings_with_same_created(client):
+    course = CourseFactory()
+    ratings = RatingFactory.create_batch(4, course=course)
+    Rating.objects.update(created=ratings[0].created)
+
+    first = client.get(
+        api_v1_url('list_ratings', {'course_id': course.id, 'limit': 2})
+    )
+    second = client.get(
+        api_v1_url(
+            'list_ratings',
+            {
+                'course_id': course.id,
+                'limit': 2,
+                'cursor': first.json()['next'],
+            },
+        )
+    )
+
+    ids = [item['id'] for item in first.json()['items']]
+    ids += [item['id'] for item in second.json()['items']]
+    assert ids == [rating.id for rating in ratings]
+    assert second.json()['next'] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'cursor', ['invalid', encode_cursor([1, 2]), encode_cursor(['a'])]
+)
+def test_paginate_invalid_cursor(client, cursor):
+    response = client.get(api_v1_url('list_courses', {'cursor': cursor}))
+
+    assert response.status_code == 400
+    assert response.json() == {'detail': 'invalid cursor.'}
+
+
+@pytest.mark.django_db
+def test_paginate_cursor_id_out_of_range(client):
+    CourseFactory()
+
+    response = client.get(
+        api_v1_url('list_courses', {'cursor': encode_cursor([2**63])})
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {'detail': 'invalid cursor.'}
+
+
+@pytest.mark.django_db
+def test_paginate_cursor_invalid_datetime(client):
+    rating = RatingFactory()
+
+    response = client.get(
+        api_v1_url(
+            'list_ratings',
+            {'cursor': encode_cursor(['2023-13-45T99:00:00', rating.id])},
+        )
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {'detail': 'invalid cursor.'}
+
+
+@pytest.mark.django_db
+def test_paginate_limit_is_bounded(client):
+    response = client.get(
+        api_v1_url('list_courses', {'limit': MAX_PAGE_SIZE + 1})
+    )
+
+    assert response.status_code == 422
@@ -1,11 +1,17 @@
 import pytest
 from django.core.exceptions import PermissionDenied
+from django.db import connection
 from django.db.models import Value
 from django.http import HttpRequest
+from django.test.utils import CaptureQueriesContext
 from ninja import Schema
 
 from educa.apps.core.permissions import (
+    MEMBERSHIP,
     PermissionObjectBase,
+    get_cached_course_roles,
+    get_course_membership,
+    has_course_role,
     is_course_instructor,
     is_creator_object,
     is_enrolled,
@@ -14,9 +20,11 @@ from educa.apps.core.permissions import (
 from educa.apps.course.models import Course
 from educa.apps.course.sub_apps.message.models import Message
 from educa.apps.module.models import Module
+from educa.apps.module.sub_apps.quiz.models import Quiz
 from tests.course.factories.course import CourseFactory
 from tests.course.factories.message import MessageFactory
 from tests.module.factories.module import ModuleFactory
+from tests.module.factories.quiz import QuizFactory
 from tests.user.factories.user import UserFactory
 
 pytestmark = pytest.mark.django_db
@@ -342,3 +350,233 @@ def test_permission_is_creator_object_denied(django_test):
     result = is_creator_object_many_view(request)
 
     django_test.assertQuerySetEqual(Message.objects.none(), result)
+
+
+def test_get_course_membership(django_assert_num_queries):
+    request = HttpRequest()
+    user = UserFactory()
+    courses = CourseFactory.create_batch(3)
+    courses[0].instructors.add(user)
+    user.enrolled_courses.add(courses[1])
+    setattr(request, 'user', user)
+
+    with django_assert_num_queries(1):
+        membership = get_course_membership(request)
+        get_course_membership(request)
+
+    assert membership == {
+        'instructor': {courses[0].id},
+        'student': {courses[1].id},
+    }
+
+
+@permission_object_required(
+    model=Course, permissions=[is_enrolled], strategy=MEMBERSHIP
+)
+def is_enrolled_membership_view(request, course_id: int):
+    return {'success': True}
+
+
+@pytest.mark.parametrize('role', ['instructor', 'student'])
+def test_permission_is_enrolled_membership(role):
+    request = HttpRequest()
+    user = UserFactory()
+    course = CourseFactory()
+    if role == 'instructor':
+        course.instructors.add(user)
+    else:
+        user.enrolled_courses.add(course)
+    setattr(request, 'user', user)
+
+    result = is_enrolled_membership_view(request, course_id=course.id)
+
+    assert result == {'success': True}
+
+
+def test_permission_is_enrolled_membership_denied():
+    request = HttpRequest()
+    user = UserFactory()
+    course = CourseFactory()
+    setattr(request, 'user', user)
+
+    with pytest.raises(PermissionDenied):
+        is_enrolled_membership_view(request, course_id=course.id)
+
+
+@permission_object_required(
+    model=Module, permissions=[is_enrolled], many=True, strategy=MEMBERSHIP
+)
+def is_enrolled_membership_view_many(request):
+    return request.get_module_query()
+
+
+def test_permission_is_enrolled_membership_many(django_test):
+    request = HttpRequest()
+    user = UserFactory()
+    courses = CourseFactory.create_batch(3)
+    user.enrolled_courses.add(courses[0])
+    courses[1].instructors.add(user)
+    for course in courses:
+        ModuleFactory.create_batch(2, course=course)
+    setattr(request, 'user', user)
+
+    result = is_enrolled_membership_view_many(request)
+
+    django_test.assertQuerySetEqual(
+        Module.objects.filter(course__in=courses[:2]), result, ordered=False
+    )
+
+
+@permission_object_required(
+    model=Module,
+    permissions=[is_course_instructor],
+    many=True,
+    strategy=MEMBERSHIP,
+)
+def is_instructor_membership_view_many(request):
+    return request.get_module_query()
+
+
+def test_permission_is_course_instructor_membership_many(django_test):
+    request = HttpRequest()
+    user = UserFactory()
+    courses = CourseFactory.create_batch(2)
+    user.enrolled_courses.add(courses[0])
+    courses[1].instructors.add(user)
+    for course in courses:
+        ModuleFactory.create_batch(2, course=course)
+    setattr(request, 'user', user)
+
+    result = is_instructor_membership_view_many(request)
+
+    django_test.assertQuerySetEqual(
+        Module.objects.filter(course=courses[1]), result, ordered=False
+    )
+
+
+@permission_object_required(model=Course, permissions=[is_enrolled])
+@permission_object_required(model=Module, permissions=[is_course_instructor])
+def stacked_view(request, course_id: int, module_id: int):
+    return {'success': True}
+
+
+def test_permission_roles_are_cached_in_the_request():
+    request = HttpRequest()
+    user = UserFactory()
+    module = ModuleFactory()
+    module.course.instructors.add(user)
+    setattr(request, 'user', user)
+
+    with CaptureQueriesContext(connection) as context:
+        result = stacked_view(
+            request, course_id=module.course_id, module_id=module.id
+        )
+
+    assert result == {'success': True}
+    assert len(context) == 2
+    assert 'EXISTS' in context.captured_queries[0]['sql']
+    assert 'EXISTS' not in context.captured_queries[1]['sql']
+    assert get_cached_course_roles(request) == {
+        module.course_id: {'instructor': True, 'student': False}
+    }
+
+
+def test_permission_roles_cache_miss_queries_the_course_once():
+    request = HttpRequest()
+    user = UserFactory()
+    course = CourseFactory()
+    module = ModuleFactory()
+    user.enrolled_courses.add(course)
+    setattr(request, 'user', user)
+
+    with CaptureQueriesContext(connection) as context:
+        with pytest.raises(PermissionDenied):
+            stacked_view(request, course_id=course.id, module_id=module.id)
+
+    assert len(context) == 3
+    assert get_cached_course_roles(request) == {
+        course.id: {'instructor': False, 'student': True},
+        module.course_id: {'instructor': False, 'student': False},
+    }
+
+
+def test_has_course_role_uses_membership():
+    request = HttpRequest()
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    setattr(request, 'user', user)
+    get_course_membership(request)
+
+    with CaptureQueriesContext(connection) as context:
+        assert has_course_role(request, course.id, 'student')
+        assert not has_course_role(request, course.id, 'instructor')
+
+    assert len(context) == 0
+
+
+@permission_object_required(
+    model=Module, permissions=[is_course_instructor], only=[]
+)
+def only_view(request, module_id: int):
+    return request.get_module()
+
+
+def test_permission_object_required_only():
+    request = HttpRequest()
+    user = UserFactory()
+    module = ModuleFactory()
+    module.course.instructors.add(user)
+    setattr(request, 'user', user)
+
+    with CaptureQueriesContext(connection) as context:
+        result = only_view(request, module_id=module.id)
+
+    assert len(context) == 1
+    assert 'description' not in context.captured_queries[0]['sql']
+    assert result.get_deferred_fields() >= {'title', 'description'}
+    assert result.course_id == module.course_id
+
+
+@permission_object_required(
+    model=Quiz, permissions=[is_course_instructor], only=['pass_percent']
+)
+def only_ordered_view(request, quiz_id: int):
+    return request.get_quiz()
+
+
+def test_permission_object_required_only_loads_ordered_model_fields():
+    request = HttpRequest()
+    user = UserFactory()
+    quiz = QuizFactory()
+    quiz.course.instructors.add(user)
+    setattr(request, 'user', user)
+
+    with CaptureQueriesContext(connection) as context:
+        result = only_ordered_view(request, quiz_id=quiz.id)
+
+    assert len(context) == 1
+    assert result.pass_percent == quiz.pass_percent
+    assert result.module_id == quiz.module_id
+    assert 'description' in result.get_deferred_fields()
+
+
+@permission_object_required(
+    model=Message, permissions=[is_creator_object], only=['title']
+)
+def only_creator_view(request, message_id: int):
+    return request.get_message()
+
+
+def test_permission_object_required_only_loads_permission_fields():
+    request = HttpRequest()
+    message = MessageFactory()
+    setattr(request, 'user', message.creator)
+
+    result = only_creator_view(request, message_id=message.id)
+
+    assert result.get_deferred_fields() == {
+        field.attname
+        for field in Message._meta.concrete_fields
+        if field.attname not in {'id', 'title', 'creator_id'}
+    }
@@ -1,6 +1,7 @@
 from ninja import FilterSchema, Schema
 
 from educa.apps.core.utils import (
+    compile_attribute_getter,
     get_attribute_from_endpoint,
     get_data_from_endpoint,
 )
@@ -55,3 +56,41 @@ def test_get_attribute_from_endpoint_attribute_in_data():
     attribute = get_attribute_from_endpoint(kwargs, 'test_id')
 
     assert attribute == attribute_value
+
+
+class BarSchema(Schema):
+    bar_id: int
+
+
+def test_compile_attribute_getter_attribute_in_kwargs():
+    def endpoint(request, bar_id: int):
+        pass
+
+    getter = compile_attribute_getter(endpoint, 'bar_id')
+
+    assert getter({'bar_id': 5}) == 5
+    assert getter({}) is None
+
+
+def test_compile_attribute_getter_attribute_in_data():
+    def endpoint(
+        request, filters: FooFilterSchema, data: BarSchema, bar_id: int = None
+    ):
+        pass
+
+    getter = compile_attribute_getter(endpoint, 'bar_id')
+
+    assert (
+        getter({'filters': FooFilterSchema(), 'data': BarSchema(bar_id=3)})
+        == 3
+    )
+    assert getter({'data': BarSchema(bar_id=3), 'bar_id': 7}) == 7
+
+
+def test_compile_attribute_getter_without_annotations():
+    def endpoint(request, **kwargs):
+        pass
+
+    getter = compile_attribute_getter(endpoint, 'bar_id')
+
+    assert getter({'data': BarSchema(bar_id=3)}) == 3
@@ -1,7 +1,12 @@
 import pytest
 from django.core.exceptions import ValidationError
 
-from educa.apps.core.video import get_video_length
+from educa.apps.core.video import (
+    STUB_VIDEO_LENGTH,
+    get_stub_video_length,
+    get_video_id,
+    get_video_length,
+)
 
 
 @pytest.mark.parametrize(
@@ -21,3 +26,27 @@ def test_video_length(video_url, seconds):
 def test_video_length_with_invalid_url():
     with pytest.raises(ValidationError):
         get_video_length('https://www.youtube.com/watch?v=zz00z0z0z0z0')
+
+
+@pytest.mark.parametrize(
+    'video_url',
+    [
+        'https://www.youtube.com/watch?v=OZgQnRcGZXs',
+        'https://youtu.be/OZgQnRcGZXs',
+        'https://www.youtube.com/embed/OZgQnRcGZXs',
+    ],
+)
+def test_get_video_id(video_url):
+    assert get_video_id(video_url) == 'OZgQnRcGZXs'
+
+
+@pytest.mark.parametrize('video_url', ['https://www.google.com', None])
+def test_get_video_id_with_invalid_url(video_url):
+    with pytest.raises(ValidationError):
+        get_video_id(video_url)
+
+
+def test_stub_video_length():
+    video_url = 'https://www.youtube.com/watch?v=OZgQnRcGZXs'
+
+    assert get_stub_video_length(video_url) == STUB_VIDEO_LENGTH
@@ -89,7 +89,7 @@ def test_list_category(client):
     response = client.get(api_v1_url('list_categories'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         CategoryOut.from_orm(category) for category in categories
     ]
 
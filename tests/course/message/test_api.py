@@ -144,7 +144,7 @@ def test_list_messages(client):
     response = client.get(api_v1_url('list_messages'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         MessageOut.from_orm(message) for message in messages
     ]
 
@@ -157,7 +157,7 @@ def test_list_messages_user_is_not_enrolled(client):
     response = client.get(api_v1_url('list_messages'))
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_message_filter_course(client):
@@ -173,7 +173,7 @@ def test_list_message_filter_course(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         MessageOut.from_orm(message) for message in messages
     ]
 
@@ -193,7 +193,7 @@ def test_list_message_filter_title(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         MessageOut.from_orm(message) for message in messages
     ]
 
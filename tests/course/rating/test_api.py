@@ -1,7 +1,11 @@
 import pytest
+from django.core.cache import cache
 
 from educa.apps.course.sub_apps.rating.models import Rating
 from educa.apps.course.sub_apps.rating.schema import RatingOut
+from educa.apps.course.sub_apps.rating.summary import (
+    _rating_summary_cache_key,
+)
 from tests.client import api_v1_url
 from tests.course.factories.course import CourseFactory
 from tests.course.factories.rating import RatingFactory
@@ -126,7 +130,7 @@ def test_list_rating(client):
     response = client.get(api_v1_url('list_ratings'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         RatingOut.from_orm(rating) for rating in ratings
     ]
 
@@ -142,7 +146,7 @@ def test_list_rating_course_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         RatingOut.from_orm(rating) for rating in ratings
     ]
 
@@ -159,7 +163,7 @@ def test_list_rating_comment(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         RatingOut.from_orm(rating) for rating in ratings
     ]
 
@@ -174,7 +178,7 @@ def test_list_rating_rating(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         RatingOut.from_orm(rating) for rating in ratings
     ]
 
@@ -190,7 +194,7 @@ def test_list_rating_rating_range(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         RatingOut.from_orm(rating) for rating in ratings
     ]
 
@@ -202,3 +206,74 @@ def test_list_rating_invalid_rating(param, client):
     )
 
     assert response.status_code == 400
+
+
+def test_get_rating_summary(client):
+    course = CourseFactory()
+    for value in (5, 4.5, 4, 1):
+        RatingFactory(course=course, rating=value)
+    RatingFactory(rating=3)
+
+    response = client.get(
+        api_v1_url('get_rating_summary', course_id=course.id)
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        'course_id': course.id,
+        'count': 4,
+        'mean': 3.62,
+        'histogram': {'1': 1, '2': 0, '3': 0, '4': 2, '5': 1},
+    }
+
+
+def test_get_rating_summary_is_cached(client, django_assert_num_queries):
+    course = CourseFactory()
+    RatingFactory(course=course, rating=5)
+    client.get(api_v1_url('get_rating_summary', course_id=course.id))
+
+    with django_assert_num_queries(0):
+        response = client.get(
+            api_v1_url('get_rating_summary', course_id=course.id)
+        )
+
+    assert response.json()['count'] == 1
+
+
+def test_get_rating_summary_is_invalidated_on_rating_write(client):
+    course = CourseFactory()
+    rating = RatingFactory(course=course, rating=5)
+    client.get(api_v1_url('get_rating_summary', course_id=course.id))
+
+    RatingFactory(course=course, rating=1)
+    response = client.get(
+        api_v1_url('get_rating_summary', course_id=course.id)
+    )
+    assert response.json()['count'] == 2
+    assert response.json()['mean'] == 3
+
+    rating.delete()
+    response = client.get(
+        api_v1_url('get_rating_summary', course_id=course.id)
+    )
+    assert response.json()['count'] == 1
+    assert response.json()['histogram']['5'] == 0
+
+
+def test_get_rating_summary_course_without_ratings(client):
+    course = CourseFactory()
+
+    response = client.get(
+        api_v1_url('get_rating_summary', course_id=course.id)
+    )
+
+    assert response.status_code == 200
+    assert response.json()['count'] == 0
+    assert response.json()['mean'] is None
+
+
+def test_get_rating_summary_course_does_not_exists(client):
+    response = client.get(api_v1_url('get_rating_summary', course_id=54058))
+
+    assert response.status_code == 404
+    assert cache.get(_rating_summary_cache_key(54058)) is None
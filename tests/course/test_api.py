@@ -145,11 +145,66 @@ def test_list_course(client):
     response = client.get(api_v1_url('list_courses'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         CourseOut.from_orm(course) for course in courses
     ]
 
 
+@pytest.mark.parametrize('size', [2, 10])
+def test_list_course_number_of_queries_is_constant(
+    size, client, django_assert_num_queries
+):
+    categories = CategoryFactory.create_batch(2)
+    instructors = UserFactory.create_batch(2)
+    courses = CourseFactory.create_batch(size)
+    for course in courses:
+        course.categories.add(*categories)
+        course.instructors.add(*instructors)
+
+    with django_assert_num_queries(3) as context:
+        response = client.get(
+            api_v1_url('list_courses', query_params={'limit': size})
+        )
+
+    assert response.status_code == 200
+    assert response.json()['items'] == [
+        CourseOut.from_orm(course) for course in courses
+    ]
+    assert not any(
+        '"category_category"' in query['sql'] or '"user_user"' in query['sql']
+        for query in context.captured_queries
+    )
+
+
+def test_get_course_relation_ids_are_ordered(client):
+    course = CourseFactory()
+    categories = CategoryFactory.create_batch(3)
+    instructors = UserFactory.create_batch(3)
+    course.categories.add(*reversed(categories))
+    course.instructors.add(*reversed(instructors))
+
+    response = client.get(api_v1_url('get_course', course_id=course.id))
+
+    assert response.json()['categories'] == [
+        category.id for category in categories
+    ]
+    assert response.json()['instructors'] == [
+        instructor.id for instructor in instructors
+    ]
+
+
+def test_get_course_number_of_queries(client, django_assert_num_queries):
+    course = CourseFactory()
+    course.categories.add(*CategoryFactory.create_batch(3))
+    course.instructors.add(*UserFactory.create_batch(3))
+
+    with django_assert_num_queries(3):
+        response = client.get(api_v1_url('get_course', course_id=course.id))
+
+    assert response.status_code == 200
+    assert response.json() == CourseOut.from_orm(course)
+
+
 @pytest.mark.parametrize(
     'name, value, extra_kwargs',
     [
@@ -167,7 +222,7 @@ def test_list_course_filter(name, value, extra_kwargs, client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         CourseOut.from_orm(course) for course in courses
     ]
 
@@ -189,7 +244,7 @@ def test_list_course_filter_categories(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         CourseOut.from_orm(course).dict() for course in courses
     ]
 
@@ -0,0 +1,407 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from educa.apps.course.models import (
+    CourseProgress,
+    CourseRelation,
+    CourseStats,
+)
+from educa.apps.course.progress import update_course_progress
+from tests.client import api_v1_url
+from tests.course.factories.course import CourseFactory
+from tests.lesson.factories.lesson import LessonFactory, LessonRelationFactory
+from tests.module.factories.module import ModuleFactory
+from tests.module.factories.quiz import (
+    QuizFactory,
+    QuizQuestionFactory,
+    QuizRelationFactory,
+)
+from tests.user.factories.user import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def course_with_progress():
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    modules = ModuleFactory.create_batch(2, course=course)
+
+    lessons = LessonFactory.create_batch(3, course=course, module=modules[0])
+    LessonFactory(course=course, module=modules[1])
+    quiz = QuizFactory(course=course, module=modules[1])
+
+    LessonRelationFactory(creator=user, lesson=lessons[0], done=True)
+    LessonRelationFactory(creator=user, lesson=lessons[1], done=False)
+    LessonRelationFactory(lesson=lessons[2], done=True)
+    QuizRelationFactory(creator=user, quiz=quiz, done=True)
+    return user, course, modules
+
+
+def test_get_course_progress(client, course_with_progress):
+    user, course, modules = course_with_progress
+
+    client.login(user)
+    response = client.get(
+        api_v1_url('get_course_progress', course_id=course.id)
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        'course_id': course.id,
+        'lessons_total': 4,
+        'lessons_done': 1,
+        'quizzes_total': 1,
+        'quizzes_done': 1,
+        'percent': 40,
+        'modules': [
+            {
+                'module_id': modules[0].id,
+                'lessons_total': 3,
+                'lessons_done': 1,
+                'quizzes_total': 0,
+                'quizzes_done': 0,
+                'percent': 33.33,
+            },
+            {
+                'module_id': modules[1].id,
+                'lessons_total': 1,
+                'lessons_done': 0,
+                'quizzes_total': 1,
+                'quizzes_done': 1,
+                'percent': 50,
+            },
+        ],
+    }
+
+
+def test_get_course_progress_num_queries(
+    client, course_with_progress, django_assert_num_queries
+):
+    user, course, _ = course_with_progress
+
+    client.login(user)
+    client.get(api_v1_url('get_course_progress', course_id=course.id))
+    with django_assert_num_queries(2):
+        client.get(api_v1_url('get_course_progress', course_id=course.id))
+
+
+def test_get_course_progress_user_is_not_enrolled(client):
+    course = CourseFactory()
+
+    client.login()
+    response = client.get(
+        api_v1_url('get_course_progress', course_id=course.id)
+    )
+
+    assert response.status_code == 403
+
+
+def test_get_course_progress_user_is_not_authenticated(client):
+    course = CourseFactory()
+
+    response = client.get(
+        api_v1_url('get_course_progress', course_id=course.id)
+    )
+
+    assert response.status_code == 401
+
+
+def test_get_course_progress_course_does_not_exists(client):
+    client.login()
+    response = client.get(api_v1_url('get_course_progress', course_id=54058))
+
+    assert response.status_code == 404
+
+
+def test_list_course_progress(
+    client, course_with_progress, django_assert_num_queries
+):
+    user, course, _ = course_with_progress
+    empty_course = CourseFactory()
+    user.enrolled_courses.add(empty_course)
+    CourseFactory()
+
+    client.login(user)
+    client.get(api_v1_url('list_course_progress'))
+    with django_assert_num_queries(2):
+        response = client.get(api_v1_url('list_course_progress'))
+
+    assert response.status_code == 200
+    assert [item['course_id'] for item in response.json()] == [
+        course.id,
+        empty_course.id,
+    ]
+    assert response.json()[0]['percent'] == 40
+    assert response.json()[1] == {
+        'course_id': empty_course.id,
+        'lessons_total': 0,
+        'lessons_done': 0,
+        'quizzes_total': 0,
+        'quizzes_done': 0,
+        'percent': 0,
+        'modules': [],
+    }
+
+
+def get_progress(user, course):
+    return CourseProgress.objects.get(user=user, course=course)
+
+
+def test_update_lesson_relation_updates_course_progress(client):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(2, course=course)
+
+    client.login(user)
+    for lesson in lessons:
+        client.patch(
+            api_v1_url('update_lesson_relation', lesson_id=lesson.id),
+            {'done': True},
+            content_type='application/json',
+        )
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 2
+    assert progress.percent == 100
+    assert CourseRelation.objects.get(creator=user, course=course).done
+
+    client.patch(
+        api_v1_url('update_lesson_relation', lesson_id=lessons[0].id),
+        {'done': False},
+        content_type='application/json',
+    )
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 1
+    assert progress.percent == 50
+
+    client.delete(
+        api_v1_url('delete_lesson_relation', lesson_id=lessons[1].id)
+    )
+    assert get_progress(user, course).lessons_done == 0
+
+
+def test_check_quiz_updates_course_progress(client):
+    user = UserFactory()
+    quiz = QuizFactory()
+    question = QuizQuestionFactory(quiz=quiz, course=quiz.course)
+    LessonFactory(course=quiz.course)
+    user.enrolled_courses.add(quiz.course)
+
+    client.login(user)
+    client.post(
+        api_v1_url('check_quiz', quiz_id=quiz.id),
+        {'response': {question.id: question.correct_response}},
+        content_type='application/json',
+    )
+    progress = get_progress(user, quiz.course)
+    assert progress.quizzes_done == 1
+    assert progress.percent == 50
+
+    client.delete(api_v1_url('delete_quiz_relation', quiz_id=quiz.id))
+    progress = get_progress(user, quiz.course)
+    assert progress.quizzes_done == 0
+    assert progress.percent == 0
+
+
+def test_course_progress_is_built_from_existing_relations(client):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(4, course=course)
+    LessonRelationFactory(creator=user, lesson=lessons[0], done=True)
+
+    client.login(user)
+    client.patch(
+        api_v1_url('update_lesson_relation', lesson_id=lessons[1].id),
+        {'done': True},
+        content_type='application/json',
+    )
+
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 2
+    assert progress.percent == 50
+    assert not CourseRelation.objects.get(creator=user, course=course).done
+
+
+def test_list_course_progress_summary(client, course_with_progress):
+    user, course, _ = course_with_progress
+    call_command('reconcile_course_progress')
+
+    client.login(user)
+    response = client.get(api_v1_url('list_course_progress_summary'))
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            'course_id': course.id,
+            'lessons_done': 1,
+            'quizzes_done': 1,
+            'percent': 40,
+        }
+    ]
+
+
+def test_reconcile_course_progress_command(course_with_progress):
+    user, course, _ = course_with_progress
+    other_user = UserFactory()
+    other_user.enrolled_courses.add(course)
+    CourseProgress.objects.create(
+        user=user, course=course, lessons_done=10, percent=100
+    )
+
+    call_command('reconcile_course_progress', batch_size=1)
+
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 1
+    assert progress.quizzes_done == 1
+    assert progress.percent == 40
+    assert get_progress(other_user, course).percent == 0
+
+
+def test_course_progress_percent_is_capped(client):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(2, course=course)
+    CourseProgress.objects.create(
+        user=user, course=course, lessons_done=2, percent=100
+    )
+
+    client.login(user)
+    client.patch(
+        api_v1_url('update_lesson_relation', lesson_id=lessons[0].id),
+        {'done': True},
+        content_type='application/json',
+    )
+
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 2
+    assert progress.percent == 100
+
+
+def test_delete_lesson_rebuilds_course_progress(
+    client, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    with django_capture_on_commit_callbacks(execute=True):
+        lessons = LessonFactory.create_batch(4, course=course)
+
+    client.login(user)
+    for lesson in lessons[:2]:
+        client.patch(
+            api_v1_url('update_lesson_relation', lesson_id=lesson.id),
+            {'done': True},
+            content_type='application/json',
+        )
+    assert get_progress(user, course).percent == 50
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lessons[0].delete()
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 1
+    assert progress.percent == 33.33
+
+    with django_capture_on_commit_callbacks(execute=True):
+        lessons[2].delete()
+        lessons[3].delete()
+    assert get_progress(user, course).percent == 100
+    assert CourseRelation.objects.get(creator=user, course=course).done
+
+
+def test_delete_lesson_relation_does_not_fetch_lesson(client):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(2, course=course)
+    LessonRelationFactory(creator=user, lesson=lessons[0], done=True)
+    LessonRelationFactory(creator=user, lesson=lessons[1], done=True)
+
+    client.login(user)
+    client.delete(
+        api_v1_url('delete_lesson_relation', lesson_id=lessons[0].id)
+    )
+    with CaptureQueriesContext(connection) as context:
+        client.delete(
+            api_v1_url('delete_lesson_relation', lesson_id=lessons[1].id)
+        )
+
+    assert not any(
+        query['sql'].startswith('SELECT "lesson_lesson"')
+        for query in context.captured_queries
+    )
+    assert get_progress(user, course).lessons_done == 0
+
+
+def test_update_course_progress_without_course_stats():
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    LessonFactory.create_batch(2, course=course)
+    CourseProgress.objects.create(user=user, course=course)
+    CourseStats.objects.filter(course=course).delete()
+
+    update_course_progress(user.id, course.id, lessons_done=1)
+    update_course_progress(user.id, course.id, lessons_done=1)
+
+    progress = get_progress(user, course)
+    assert progress.lessons_done == 2
+    assert progress.percent == 100
+    assert CourseStats.objects.get(course=course).lesson_count == 2
+
+
+def test_create_lesson_clears_course_done(
+    client, django_capture_on_commit_callbacks
+):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    with django_capture_on_commit_callbacks(execute=True):
+        lesson = LessonFactory(course=course)
+
+    client.login(user)
+    client.patch(
+        api_v1_url('update_lesson_relation', lesson_id=lesson.id),
+        {'done': True},
+        content_type='application/json',
+    )
+    assert CourseRelation.objects.get(creator=user, course=course).done
+
+    with django_capture_on_commit_callbacks(execute=True):
+        LessonFactory(course=course)
+
+    assert get_progress(user, course).percent == 50
+    assert not CourseRelation.objects.get(creator=user, course=course).done
+
+
+def test_progress_rebuild_runs_once_per_course(
+    django_capture_on_commit_callbacks,
+):
+    course = CourseFactory()
+    module = ModuleFactory(course=course)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        lessons = LessonFactory.create_batch(3, course=course, module=module)
+        QuizFactory(course=course, module=module)
+        lessons[0].delete()
+
+    assert len(callbacks) == 1
+    assert callbacks[0].course_ids == {course.id}
+
+
+def test_delete_course_does_not_rebuild_progress(
+    django_capture_on_commit_callbacks,
+):
+    course = CourseFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        LessonFactory.create_batch(2, course=course)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        course.delete()
+
+    assert callbacks == []
@@ -118,7 +118,7 @@ def test_list_course_relation(client):
     response = client.get(api_v1_url('list_course_relations'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         CourseRelationOut.from_orm(relation) for relation in relations
     ]
 
@@ -0,0 +1,182 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from educa.apps.course.models import CourseStats
+from educa.apps.lesson.tasks import resolve_video_duration
+from tests.client import api_v1_url
+from tests.course.factories.course import CourseFactory, CourseRelationFactory
+from tests.course.factories.rating import RatingFactory
+from tests.lesson.factories.lesson import LessonFactory
+from tests.user.factories.user import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def get_stats(course):
+    return CourseStats.objects.get(course=course)
+
+
+def test_course_stats_is_created_with_course():
+    course = CourseFactory()
+
+    stats = get_stats(course)
+
+    assert stats.rating_count == 0
+    assert stats.rating_average is None
+    assert stats.student_count == 0
+    assert stats.lesson_count == 0
+    assert stats.total_video_duration == 0
+
+
+def test_course_stats_ratings():
+    course = CourseFactory()
+    ratings = [RatingFactory(course=course, rating=value) for value in (5, 3)]
+
+    assert get_stats(course).rating_count == 2
+    assert get_stats(course).rating_average == 4
+
+    ratings[1].rating = 4
+    ratings[1].save()
+    assert get_stats(course).rating_average == 4.5
+
+    ratings[0].delete()
+    stats = get_stats(course)
+    assert stats.rating_count == 1
+    assert stats.rating_average == 4
+
+
+def test_course_stats_students():
+    course = CourseFactory()
+    relations = CourseRelationFactory.create_batch(3, course=course)
+
+    relations[0].done = True
+    relations[0].save()
+    relations[1].delete()
+
+    assert get_stats(course).student_count == 2
+
+
+def test_course_stats_students_added_through_course():
+    course = CourseFactory()
+    users = UserFactory.create_batch(2)
+
+    course.students.add(*users)
+    users[0].enrolled_courses.add(CourseFactory(), course)
+    assert get_stats(course).student_count == 2
+
+    course.students.remove(users[0])
+    assert get_stats(course).student_count == 1
+
+
+def test_course_stats_lessons():
+    course = CourseFactory()
+    lesson = LessonFactory(course=course, video_duration_in_seconds=100)
+    LessonFactory(course=course, video_duration_in_seconds=50)
+
+    lesson.video_duration_in_seconds = 70
+    lesson.save()
+    stats = get_stats(course)
+    assert stats.lesson_count == 2
+    assert stats.total_video_duration == 120
+
+    lesson.delete()
+    stats = get_stats(course)
+    assert stats.lesson_count == 1
+    assert stats.total_video_duration == 50
+
+
+def test_course_stats_previous_contribution_query():
+    lesson = LessonFactory(video_duration_in_seconds=100)
+
+    lesson.video_duration_in_seconds = 70
+    with CaptureQueriesContext(connection) as context:
+        lesson.save()
+
+    select = context.captured_queries[0]['sql']
+    assert select.startswith('SELECT')
+    assert '"lesson_lesson"."video_duration_in_seconds"' in select
+    assert '"lesson_lesson"."description"' not in select
+    assert 'ORDER BY' not in select
+    assert get_stats(lesson.course).total_video_duration == 70
+
+
+def test_course_stats_resolved_video_duration(settings):
+    course = CourseFactory()
+    lesson = LessonFactory(course=course, video_duration_in_seconds=100)
+    lesson.video_duration_in_seconds = None
+    settings.VIDEO_DURATION_ASYNC = True
+    lesson.save()
+    assert get_stats(course).total_video_duration == 0
+
+    duration = resolve_video_duration(lesson.id, lesson.video)
+
+    assert get_stats(course).total_video_duration == duration
+
+
+def test_course_stats_is_created_when_missing():
+    course = CourseFactory()
+    RatingFactory(course=course, rating=2)
+    CourseStats.objects.all().delete()
+
+    RatingFactory(course=course, rating=4)
+
+    stats = get_stats(course)
+    assert stats.rating_count == 2
+    assert stats.rating_average == 3
+
+
+def test_rebuild_course_stats_command():
+    courses = CourseFactory.create_batch(3)
+    for course in courses:
+        RatingFactory(course=course, rating=4)
+        CourseRelationFactory(course=course)
+        LessonFactory(course=course, video_duration_in_seconds=30)
+    expected = [
+        (stats.rating_count, stats.rating_sum, stats.student_count)
+        for stats in CourseStats.objects.order_by('course_id')
+    ]
+    CourseStats.objects.all().delete()
+
+    call_command('rebuild_course_stats', batch_size=2)
+
+    assert [
+        (stats.rating_count, stats.rating_sum, stats.student_count)
+        for stats in CourseStats.objects.order_by('course_id')
+    ] == expected
+    assert all(
+        stats.lesson_count == 1 and stats.total_video_duration == 30
+        for stats in CourseStats.objects.all()
+    )
+
+
+def test_get_course_stats(client):
+    course = CourseFactory()
+    RatingFactory(course=course, rating=5)
+    CourseRelationFactory(course=course)
+    LessonFactory(course=course, video_duration_in_seconds=60)
+
+    response = client.get(api_v1_url('get_course', course_id=course.id))
+
+    assert response.json()['stats'] == {
+        'rating_average': 5,
+        'rating_count': 1,
+        'student_count': 1,
+        'lesson_count': 1,
+        'quiz_count': 0,
+        'total_video_duration': 60,
+    }
+
+
+def test_create_course_relation_updates_stats(client):
+    course = CourseFactory()
+
+    client.login(UserFactory())
+    client.post(
+        api_v1_url('create_course_relation'),
+        {'course_id': course.id},
+        content_type='application/json',
+    )
+
+    assert get_stats(course).student_count == 1
@@ -1,6 +1,9 @@
 import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from educa.apps.generic.action.models import Action
+from educa.apps.generic.action.models import Action, ActionName
 from educa.apps.generic.action.schema import ActionOut
 from tests.client import api_v1_url
 from tests.course.factories.course import CourseFactory
@@ -343,3 +346,60 @@ def test_delete_action_obj_does_not_exists(generic, client):
     )
 
     assert response.status_code == 404
+
+
+def test_create_action_is_a_single_upsert(client):
+    course = CourseFactory()
+    user = UserFactory()
+    user.enrolled_courses.add(course)
+    question = QuestionFactory(course=course)
+    payload = {
+        'object_id': question.id,
+        'object_model': 'question',
+        'course_id': course.id,
+        'action': 2,
+    }
+
+    client.login(user)
+    client.post(
+        api_v1_url('create_action'), payload, content_type='application/json'
+    )
+    payload['action'] = 1
+    with CaptureQueriesContext(connection) as context:
+        response = client.post(
+            api_v1_url('create_action'),
+            payload,
+            content_type='application/json',
+        )
+
+    assert response.status_code == 200
+    assert response.json()['action'] == '1'
+    action_queries = [
+        query['sql']
+        for query in context.captured_queries
+        if 'action_action' in query['sql']
+    ]
+    assert len(action_queries) == 1
+    assert 'ON CONFLICT' in action_queries[0]
+    assert Action.objects.get().action == '1'
+
+
+def test_action_upsert_returns_previous_action():
+    question = QuestionFactory()
+    fields = {
+        'creator_id': question.creator_id,
+        'course_id': question.course_id,
+        'content_type_id': ContentType.objects.get_for_model(question).id,
+        'object_id': question.id,
+    }
+
+    created = Action.objects.upsert(**fields, action=ActionName.LIKE)
+    updated = Action.objects.upsert(**fields, action=ActionName.DISLIKE)
+    repeated = Action.objects.upsert(**fields, action=ActionName.DISLIKE)
+
+    assert created.previous_action is None
+    assert updated.previous_action == '1'
+    assert updated.id == created.id
+    assert repeated.previous_action == '2'
+    assert repeated.modified == updated.modified
+    assert Action.objects.get().action == '2'
@@ -281,7 +281,9 @@ def test_list_answer_children(model, client):
     response = client.get(api_v1_url('list_answer_children', answer_id=obj.id))
 
     assert response.status_code == 200
-    assert response.json() == [AnswerOut.from_orm(child) for child in children]
+    assert response.json()['items'] == [
+        AnswerOut.from_orm(child) for child in children
+    ]
 
 
 def test_list_answer_children_answer_does_not_exists(client):
@@ -309,7 +311,7 @@ def test_list_answer(model, answer_factory, client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         AnswerOut.from_orm(answer) for answer in answers
     ]
 
@@ -430,3 +432,157 @@ def test_update_answer_does_not_exists(client):
     )
 
     assert response.status_code == 404
+
+
+def test_list_answer_num_queries(client, django_assert_num_queries):
+    obj = MessageFactory()
+    AnswerMessageFactory.create_batch(10, content_object=obj)
+    url = api_v1_url(
+        'list_answer', object_model=obj._meta.object_name, object_id=obj.id
+    )
+
+    client.get(url)
+    with django_assert_num_queries(1):
+        response = client.get(url)
+
+    assert len(response.json()['items']) == 10
+
+
+def test_list_answer_children_num_queries(client, django_assert_num_queries):
+    obj = AnswerQuestionFactory()
+    AnswerQuestionFactory.create_batch(10, parent_id=obj.id)
+    url = api_v1_url('list_answer_children', answer_id=obj.id)
+
+    client.get(url)
+    with django_assert_num_queries(2):
+        response = client.get(url)
+
+    assert len(response.json()['items']) == 10
+
+
+def reply(parent, **kwargs):
+    return AnswerQuestionFactory(
+        content_object=parent.content_object, parent_id=parent.id, **kwargs
+    )
+
+
+def thread_ids(item):
+    return [item['id'], [thread_ids(reply) for reply in item['replies']]]
+
+
+@pytest.fixture
+def answer_thread():
+    question = QuestionFactory()
+    roots = AnswerQuestionFactory.create_batch(2, content_object=question)
+    first = reply(roots[0])
+    second = reply(roots[0])
+    nested = reply(first)
+    deep = reply(nested)
+    other = reply(roots[1])
+    tree = [
+        [
+            roots[0].id,
+            [
+                [first.id, [[nested.id, [[deep.id, []]]]]],
+                [second.id, []],
+            ],
+        ],
+        [roots[1].id, [[other.id, []]]],
+    ]
+    return question, roots, tree
+
+
+def test_list_answer_thread(client, answer_thread, django_assert_num_queries):
+    question, _, tree = answer_thread
+    url = api_v1_url(
+        'list_answer_thread', object_model='question', object_id=question.id
+    )
+
+    client.get(url)
+    with django_assert_num_queries(2):
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert [thread_ids(item) for item in response.json()['items']] == tree
+
+
+def test_list_answer_thread_paginates_roots(client, answer_thread):
+    question, roots, tree = answer_thread
+    url = api_v1_url(
+        'list_answer_thread', object_model='question', object_id=question.id
+    )
+
+    response = client.get(url, {'limit': 1})
+    next_page = client.get(
+        url, {'limit': 1, 'cursor': response.json()['next']}
+    )
+
+    assert [thread_ids(item) for item in response.json()['items']] == tree[:1]
+    assert [thread_ids(item) for item in next_page.json()['items']] == tree[1:]
+    assert next_page.json()['next'] is None
+
+
+def test_list_answer_thread_depth(client, answer_thread):
+    question, roots, _ = answer_thread
+
+    response = client.get(
+        api_v1_url(
+            'list_answer_thread',
+            object_model='question',
+            object_id=question.id,
+        ),
+        {'depth': 1},
+    )
+
+    items = response.json()['items']
+    assert [len(item['replies']) for item in items] == [2, 1]
+    assert all(
+        reply['replies'] == [] for item in items for reply in item['replies']
+    )
+
+
+def test_list_answer_thread_invalid_depth(client, answer_thread):
+    question, _, _ = answer_thread
+
+    response = client.get(
+        api_v1_url(
+            'list_answer_thread',
+            object_model='question',
+            object_id=question.id,
+        ),
+        {'depth': -1},
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_answer_thread(client, answer_thread, django_assert_num_queries):
+    _, roots, tree = answer_thread
+    subtree = tree[0][1][0]
+
+    with django_assert_num_queries(2):
+        response = client.get(
+            api_v1_url('get_answer_thread', answer_id=subtree[0])
+        )
+
+    assert response.status_code == 200
+    assert thread_ids(response.json()) == subtree
+
+
+def test_get_answer_thread_depth(client, answer_thread):
+    _, roots, _ = answer_thread
+    roots[0].refresh_from_db()
+
+    response = client.get(
+        api_v1_url('get_answer_thread', answer_id=roots[0].id), {'depth': 0}
+    )
+
+    assert response.json() == AnswerOut.from_orm(roots[0]).dict() | {
+        'replies': []
+    }
+
+
+def test_get_answer_thread_answer_does_not_exists(client):
+    response = client.get(api_v1_url('get_answer_thread', answer_id=150))
+
+    assert response.status_code == 404
@@ -3,6 +3,7 @@ from django.contrib.contenttypes.models import ContentType
 from factory import fuzzy
 
 from educa.apps.generic.action.models import Action
+from educa.apps.generic.counters import update_action_counters
 from tests.course.factories.rating import RatingFactory
 from tests.generic.factories.answer import (
     AnswerMessageFactory,
@@ -25,6 +26,16 @@ class ActionFactory(factory.django.DjangoModelFactory):
         lambda o: ContentType.objects.get_for_model(o.content_object)
     )
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        action = super()._create(model_class, *args, **kwargs)
+        update_action_counters(
+            action.content_type_id,
+            action.object_id,
+            current=str(action.action),
+        )
+        return action
+
 
 class ActionQuestionFactory(ActionFactory):
     content_object = factory.SubFactory(QuestionFactory)
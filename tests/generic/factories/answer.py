@@ -2,6 +2,7 @@ import factory
 from django.contrib.contenttypes.models import ContentType
 
 from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.counters import add_answer_counters
 from tests.course.factories.message import MessageFactory
 from tests.course.factories.rating import RatingFactory
 from tests.lesson.factories.question import QuestionFactory
@@ -21,6 +22,12 @@ class AnswerFactory(factory.django.DjangoModelFactory):
     )
     parent_id = None
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        answer = super()._create(model_class, *args, **kwargs)
+        add_answer_counters(answer)
+        return answer
+
 
 class AnswerRatingFactory(AnswerFactory):
     content_object = factory.SubFactory(RatingFactory)
@@ -0,0 +1,222 @@
+from threading import Event, Thread
+
+import pytest
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection, transaction
+
+from educa.apps.course.sub_apps.message.models import Message
+from educa.apps.generic.action.models import Action, ActionName
+from educa.apps.generic.answer.models import Answer
+from educa.apps.generic.backfill import fill_counters
+from educa.apps.generic.counters import update_action_counters
+from educa.apps.lesson.sub_apps.question.models import Question
+from tests.client import api_v1_url
+from tests.course.factories.message import MessageFactory
+from tests.generic.factories.action import (
+    ActionAnswerQuestionFactory,
+    ActionQuestionFactory,
+)
+from tests.generic.factories.answer import (
+    AnswerMessageFactory,
+    AnswerQuestionFactory,
+)
+from tests.lesson.factories.question import QuestionFactory
+from tests.user.factories.user import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def create_answer(client, obj, parent_id=None):
+    return client.post(
+        api_v1_url('create_answer'),
+        {
+            'object_id': obj.id,
+            'object_model': obj._meta.object_name,
+            'course_id': obj.course_id,
+            'parent_id': parent_id,
+            'content': 'answer',
+        },
+        content_type='application/json',
+    ).json()
+
+
+def create_action(client, obj, action):
+    return client.post(
+        api_v1_url('create_action'),
+        {
+            'object_id': obj.id,
+            'object_model': obj._meta.object_name,
+            'course_id': obj.course_id,
+            'action': action,
+        },
+        content_type='application/json',
+    )
+
+
+def counters(obj):
+    obj.refresh_from_db()
+    return obj.answer_count, obj.like_count, obj.dislike_count
+
+
+def test_answer_counters(client):
+    user = UserFactory()
+    question = QuestionFactory()
+    user.enrolled_courses.add(question.course)
+
+    client.login(user)
+    parent = create_answer(client, question)
+    reply = create_answer(client, question, parent_id=parent['id'])
+    create_answer(client, question, parent_id=reply['id'])
+
+    assert counters(question) == (3, 0, 0)
+    response = client.get(api_v1_url('get_answer', answer_id=parent['id']))
+    assert response.json()['answer_count'] == 1
+
+    client.delete(api_v1_url('delete_answer', answer_id=reply['id']))
+
+    assert counters(question) == (1, 0, 0)
+    response = client.get(api_v1_url('get_answer', answer_id=parent['id']))
+    assert response.json()['answer_count'] == 0
+
+
+def test_action_counters(client):
+    user = UserFactory()
+    question = QuestionFactory()
+    user.enrolled_courses.add(question.course)
+
+    client.login(user)
+    create_action(client, question, ActionName.LIKE)
+    assert counters(question) == (0, 1, 0)
+
+    create_action(client, question, ActionName.LIKE)
+    assert counters(question) == (0, 1, 0)
+
+    create_action(client, question, ActionName.DISLIKE)
+    assert counters(question) == (0, 0, 1)
+
+    client.delete(
+        api_v1_url(
+            'delete_action', object_model='question', object_id=question.id
+        )
+    )
+    assert counters(question) == (0, 0, 0)
+
+
+def test_question_out_counters(client):
+    user = UserFactory()
+    question = QuestionFactory()
+    user.enrolled_courses.add(question.course)
+
+    client.login(user)
+    create_answer(client, question)
+    create_action(client, question, ActionName.DISLIKE)
+    response = client.get(api_v1_url('get_question', question_id=question.id))
+
+    assert response.json()['answer_count'] == 1
+    assert response.json()['like_count'] == 0
+    assert response.json()['dislike_count'] == 1
+
+
+def test_fill_counters_backfills_existing_objects():
+    question = QuestionFactory()
+    message = MessageFactory()
+    answer = AnswerQuestionFactory(content_object=question)
+    AnswerQuestionFactory(content_object=question, parent_id=answer.id)
+    AnswerMessageFactory(content_object=message)
+    ActionQuestionFactory(content_object=question, action=ActionName.LIKE)
+    ActionAnswerQuestionFactory(
+        content_object=answer, action=ActionName.DISLIKE
+    )
+
+    fill_counters(apps, Question)
+    fill_counters(apps, Message, actions=False)
+    fill_counters(apps, Answer)
+
+    assert counters(question) == (2, 1, 0)
+    assert Message.objects.get(id=message.id).answer_count == 1
+    assert counters(answer) == (1, 0, 1)
+
+
+def test_reconcile_counters_command():
+    question = QuestionFactory()
+    message = MessageFactory()
+    answer = AnswerQuestionFactory(content_object=question)
+    AnswerQuestionFactory.create_batch(
+        2, content_object=question, parent_id=answer.id
+    )
+    AnswerMessageFactory(content_object=message)
+    ActionQuestionFactory(content_object=question, action=ActionName.LIKE)
+    for user in UserFactory.create_batch(2):
+        ActionQuestionFactory(
+            content_object=question, creator=user, action=ActionName.DISLIKE
+        )
+    ActionAnswerQuestionFactory(content_object=answer, action=ActionName.LIKE)
+
+    call_command('reconcile_counters', batch_size=1)
+
+    assert counters(question) == (3, 1, 2)
+    assert counters(answer) == (2, 1, 0)
+    message.refresh_from_db()
+    assert message.answer_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    'first, second',
+    [
+        (ActionName.LIKE, ActionName.LIKE),
+        (ActionName.LIKE, ActionName.DISLIKE),
+        (ActionName.DISLIKE, ActionName.LIKE),
+    ],
+)
+def test_concurrent_action_upserts_count_once(first, second):
+    question = QuestionFactory()
+    fields = {
+        'creator_id': question.creator_id,
+        'course_id': question.course_id,
+        'content_type_id': ContentType.objects.get_for_model(question).id,
+        'object_id': question.id,
+    }
+    upserted = Event()
+
+    def upsert(action, wait=None):
+        try:
+            with transaction.atomic():
+                if wait is not None:
+                    wait.wait(5)
+                saved = Action.objects.upsert(**fields, action=action)
+                update_action_counters(
+                    saved.content_type_id,
+                    saved.object_id,
+                    saved.previous_action,
+                    saved.action,
+                )
+                if wait is None:
+                    # Mantém a transação aberta enquanto o segundo clique
+                    # procura pela ação anterior.
+                    upserted.set()
+                    Event().wait(0.5)
+        finally:
+            connection.close()
+
+    threads = [
+        Thread(target=upsert, args=(first,)),
+        Thread(target=upsert, args=(second, upserted)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    question = Question.objects.get(id=question.id)
+    assert Action.objects.count() == 1
+    assert (
+        question.like_count
+        == Action.objects.filter(action=ActionName.LIKE).count()
+    )
+    assert (
+        question.dislike_count
+        == Action.objects.filter(action=ActionName.DISLIKE).count()
+    )
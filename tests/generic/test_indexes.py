@@ -0,0 +1,74 @@
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from educa.apps.generic.action.models import Action
+from educa.apps.generic.answer.models import Answer
+from educa.apps.lesson.sub_apps.question.models import Question
+from tests.client import api_v1_url
+from tests.generic.factories.action import ActionQuestionFactory
+from tests.generic.factories.answer import AnswerQuestionFactory
+from tests.user.factories.user import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def content_type():
+    return ContentType.objects.get_for_model(Question)
+
+
+def test_answer_content_object_index(explain, content_type):
+    answer = AnswerQuestionFactory()
+
+    plan = explain(
+        Answer.objects.filter(
+            content_type=content_type, object_id=answer.object_id
+        )
+    )
+
+    assert 'answer_content_object_idx' in plan
+
+
+def test_action_content_object_index(explain, content_type):
+    action = ActionQuestionFactory()
+
+    plan = explain(
+        Action.objects.filter(
+            content_type=content_type, object_id=action.object_id
+        )
+    )
+
+    assert 'action_content_object_idx' in plan
+
+
+def test_action_unique_constraint_index(explain, content_type):
+    action = ActionQuestionFactory(creator=UserFactory())
+
+    plan = explain(
+        Action.objects.filter(
+            creator=action.creator,
+            content_type=content_type,
+            object_id=action.object_id,
+        )
+    )
+
+    assert '"unique action"' in plan
+
+
+def test_list_answer_does_not_join_content_type(client):
+    answer = AnswerQuestionFactory()
+    url = api_v1_url(
+        'list_answer', object_model='question', object_id=answer.object_id
+    )
+
+    client.get(url)
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert len(response.json()['items']) == 1
+    assert all(
+        'django_content_type' not in query['sql']
+        for query in context.captured_queries
+    )
@@ -0,0 +1,24 @@
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from educa.apps.generic.utils import get_object_url
+from tests.course.factories.message import MessageFactory
+from tests.course.factories.rating import RatingFactory
+from tests.generic.factories.answer import AnswerMessageFactory
+from tests.lesson.factories.question import QuestionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    'model',
+    [MessageFactory, RatingFactory, QuestionFactory, AnswerMessageFactory],
+)
+def test_get_object_url(model, django_assert_num_queries):
+    obj = model()
+    content_type = ContentType.objects.get_for_model(obj)
+
+    with django_assert_num_queries(0):
+        url = get_object_url(content_type.id, obj.id)
+
+    assert url == obj.get_absolute_url()
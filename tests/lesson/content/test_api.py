@@ -235,7 +235,7 @@ def test_list_contents(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ContentOut.from_orm(content) for content in contents
     ]
 
@@ -256,7 +256,7 @@ def test_list_contents_filter_module_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ContentOut.from_orm(content) for content in contents
     ]
 
@@ -277,7 +277,7 @@ def test_list_contents_filter_lesson_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ContentOut.from_orm(content) for content in contents
     ]
 
@@ -297,7 +297,7 @@ def test_list_contents_filter_title(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ContentOut.from_orm(content) for content in contents
     ]
 
@@ -310,7 +310,7 @@ def test_list_contents_user_is_not_enrolled(client):
     response = client.get(api_v1_url('list_contents'))
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_contents_user_is_not_authenticated(client):
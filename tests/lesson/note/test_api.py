@@ -131,7 +131,9 @@ def test_list_notes(client):
     response = client.get(api_v1_url('list_notes'))
 
     assert response.status_code == 200
-    assert response.json() == [NoteOut.from_orm(note) for note in notes]
+    assert response.json()['items'] == [
+        NoteOut.from_orm(note) for note in notes
+    ]
 
 
 def test_list_note_filter_lesson(client):
@@ -148,7 +150,9 @@ def test_list_note_filter_lesson(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [NoteOut.from_orm(notes) for notes in notes]
+    assert response.json()['items'] == [
+        NoteOut.from_orm(notes) for notes in notes
+    ]
 
 
 def test_list_note_filter_note(client):
@@ -165,7 +169,9 @@ def test_list_note_filter_note(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [NoteOut.from_orm(note) for note in notes]
+    assert response.json()['items'] == [
+        NoteOut.from_orm(note) for note in notes
+    ]
 
 
 def test_list_notes_user_is_not_authenticated(client):
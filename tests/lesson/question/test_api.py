@@ -146,7 +146,7 @@ def test_list_questions(client):
     response = client.get(api_v1_url('list_questions'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuestionOut.from_orm(message) for message in questions
     ]
 
@@ -159,7 +159,7 @@ def test_list_questions_user_is_not_enrolled(client):
     response = client.get(api_v1_url('list_questions'))
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_question_filter_course(client):
@@ -175,7 +175,7 @@ def test_list_question_filter_course(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuestionOut.from_orm(message) for message in messages
     ]
 
@@ -195,7 +195,7 @@ def test_list_question_filter_lesson(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuestionOut.from_orm(message) for message in questions
     ]
 
@@ -215,7 +215,7 @@ def test_list_question_filter_title(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuestionOut.from_orm(message) for message in messages
     ]
 
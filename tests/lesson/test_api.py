@@ -1,5 +1,6 @@
 import pytest
 
+from educa.apps.core.video import STUB_VIDEO_LENGTH
 from educa.apps.lesson.models import Lesson
 from educa.apps.lesson.schema import LessonOut
 from tests.client import api_v1_url
@@ -141,7 +142,7 @@ def test_list_lessons(client):
     response = client.get(api_v1_url('list_lessons'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         LessonOut.from_orm(lesson) for lesson in lessons
     ]
 
@@ -153,7 +154,7 @@ def test_list_lessons_user_is_not_enrolled(client):
     response = client.get(api_v1_url('list_lessons'))
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_lessons_filter_course_id(client):
@@ -169,7 +170,7 @@ def test_list_lessons_filter_course_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         LessonOut.from_orm(lesson) for lesson in lessons
     ]
 
@@ -188,7 +189,7 @@ def test_list_lessons_filter_module_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         LessonOut.from_orm(lesson) for lesson in lessons
     ]
 
@@ -207,7 +208,7 @@ def test_list_lessons_filter_title(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         LessonOut.from_orm(lesson) for lesson in lessons
     ]
 
@@ -347,4 +348,4 @@ def test_update_lesson_video(client):
 
     assert response.status_code == 200
     assert response.json()['video'] == payload['video']
-    assert response.json()['video_duration_in_seconds'] == 304
+    assert response.json()['video_duration_in_seconds'] == STUB_VIDEO_LENGTH
@@ -1,8 +1,15 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from educa.apps.course.models import CourseProgress
 from educa.apps.lesson.models import LessonRelation
-from educa.apps.lesson.schema import LessonRelationOut
+from educa.apps.lesson.schema import (
+    LESSON_RELATION_BULK_LIMIT,
+    LessonRelationOut,
+)
 from tests.client import api_v1_url
+from tests.course.factories.course import CourseFactory
 from tests.lesson.factories.lesson import LessonFactory, LessonRelationFactory
 from tests.user.factories.user import UserFactory
 
@@ -20,9 +27,50 @@ def test_get_lesson_relation(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == LessonRelationOut.from_orm(
-        LessonRelation.objects.get(id=response.json()['id'])
+    assert response.json() == {
+        'id': None,
+        'creator_id': user.id,
+        'lesson_id': lesson.id,
+        'done': False,
+        'created': None,
+        'modified': None,
+    }
+    assert not LessonRelation.objects.exists()
+
+
+def test_get_lesson_relation_existing_relation(client):
+    relation = LessonRelationFactory(done=True)
+    relation.creator.enrolled_courses.add(relation.lesson.course)
+
+    client.login(relation.creator)
+    response = client.get(
+        api_v1_url('get_lesson_relation', lesson_id=relation.lesson_id),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == LessonRelationOut.from_orm(relation)
+
+
+def test_get_lesson_relation_does_not_write(client):
+    lessons = LessonFactory.create_batch(20)
+    user = UserFactory()
+    for lesson in lessons:
+        user.enrolled_courses.add(lesson.course)
+    LessonRelationFactory(creator=user, lesson=lessons[0])
+
+    client.login(user)
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(5):
+            for lesson in lessons:
+                response = client.get(
+                    api_v1_url('get_lesson_relation', lesson_id=lesson.id),
+                )
+                assert response.status_code == 200
+
+    assert all(
+        query['sql'].startswith('SELECT') for query in context.captured_queries
     )
+    assert LessonRelation.objects.count() == 1
 
 
 def test_get_lesson_relation_user_is_not_authenticated(client):
@@ -69,7 +117,7 @@ def test_list_lesson_relation(client):
     response = client.get(api_v1_url('list_lesson_relations'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         LessonRelationOut.from_orm(relation) for relation in relations
     ]
 
@@ -81,7 +129,7 @@ def test_list_lesson_relatio_user_has_no_relations(client):
     response = client.get(api_v1_url('list_lesson_relations'))
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_lesson_relation_user_is_not_authenticated(client):
@@ -181,3 +229,130 @@ def test_update_lesson_relation_user_is_not_authenticated(client):
     )
 
     assert response.status_code == 401
+
+
+def test_bulk_update_lesson_relations(client):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(3, course=course)
+    existing = LessonRelationFactory(
+        creator=user, lesson=lessons[0], done=True
+    )
+    payload = [
+        {'lesson_id': lessons[0].id, 'done': False},
+        {'lesson_id': lessons[1].id, 'done': True},
+        {'lesson_id': lessons[2].id, 'done': False},
+        {'lesson_id': lessons[2].id, 'done': True},
+    ]
+
+    client.login(user)
+    response = client.put(
+        api_v1_url('bulk_update_lesson_relations'),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 200
+    relations = LessonRelation.objects.filter(creator=user).order_by(
+        'lesson_id'
+    )
+    assert response.json() == [
+        LessonRelationOut.from_orm(relation) for relation in relations
+    ]
+    assert [relation.done for relation in relations] == [False, True, True]
+    assert relations[0].id == existing.id
+    progress = CourseProgress.objects.get(user=user, course=course)
+    assert progress.lessons_done == 2
+
+
+def test_bulk_update_lesson_relations_num_queries(
+    client, django_assert_num_queries
+):
+    user = UserFactory()
+    course = CourseFactory()
+    user.enrolled_courses.add(course)
+    lessons = LessonFactory.create_batch(10, course=course)
+    payload = [{'lesson_id': lesson.id, 'done': True} for lesson in lessons]
+
+    client.login(user)
+    client.get(api_v1_url('list_lesson_relations'))
+    with django_assert_num_queries(10):
+        response = client.put(
+            api_v1_url('bulk_update_lesson_relations'),
+            payload,
+            content_type='application/json',
+        )
+
+    assert response.status_code == 200
+    assert LessonRelation.objects.filter(creator=user, done=True).count() == 10
+
+
+def test_bulk_update_lesson_relations_user_is_not_enrolled(client):
+    user = UserFactory()
+    lesson = LessonFactory()
+    other_lesson = LessonFactory()
+    user.enrolled_courses.add(lesson.course)
+    payload = [
+        {'lesson_id': lesson.id, 'done': True},
+        {'lesson_id': other_lesson.id, 'done': True},
+    ]
+
+    client.login(user)
+    response = client.put(
+        api_v1_url('bulk_update_lesson_relations'),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 403
+    assert not LessonRelation.objects.exists()
+
+
+def test_bulk_update_lesson_relations_user_is_not_authenticated(client):
+    response = client.put(
+        api_v1_url('bulk_update_lesson_relations'),
+        [],
+        content_type='application/json',
+    )
+
+    assert response.status_code == 401
+
+
+def test_bulk_update_lesson_relations_lesson_does_not_exists(client):
+    user = UserFactory()
+    lesson = LessonFactory()
+    user.enrolled_courses.add(lesson.course)
+    payload = [
+        {'lesson_id': lesson.id, 'done': True},
+        {'lesson_id': 54058, 'done': True},
+    ]
+
+    client.login(user)
+    response = client.put(
+        api_v1_url('bulk_update_lesson_relations'),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 404
+    assert not LessonRelation.objects.exists()
+
+
+def test_bulk_update_lesson_relations_size_is_limited(client):
+    user = UserFactory()
+    lesson = LessonFactory()
+    user.enrolled_courses.add(lesson.course)
+    payload = [{'lesson_id': lesson.id, 'done': True}] * (
+        LESSON_RELATION_BULK_LIMIT + 1
+    )
+
+    client.login(user)
+    response = client.put(
+        api_v1_url('bulk_update_lesson_relations'),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 422
+    assert not LessonRelation.objects.exists()
@@ -1,5 +1,7 @@
 import pytest
+from django.core.exceptions import ValidationError
 
+from educa.apps.core.video import STUB_VIDEO_LENGTH
 from tests.lesson.factories.lesson import LessonFactory
 
 pytestmark = pytest.mark.django_db
@@ -20,4 +22,15 @@ def test_model_lesson_get_lesson_video_duration():
     lesson.video_duration_in_seconds = None
     lesson.save()
 
-    assert lesson.video_duration_in_seconds == 1170
+    assert lesson.video_duration_in_seconds == STUB_VIDEO_LENGTH
+    lesson.refresh_from_db()
+    assert lesson.video_duration_in_seconds == STUB_VIDEO_LENGTH
+
+
+def test_model_lesson_invalid_video():
+    lesson = LessonFactory()
+    lesson.video = 'https://www.google.com'
+    lesson.video_duration_in_seconds = None
+
+    with pytest.raises(ValidationError):
+        lesson.save()
@@ -0,0 +1,143 @@
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from educa.apps.core.video import STUB_VIDEO_LENGTH
+from educa.apps.lesson.models import Lesson, VideoMetadata
+from educa.apps.lesson.tasks import (
+    _resolve_in_background,
+    get_video_duration,
+    resolve_video_duration,
+)
+from tests.lesson.factories.lesson import LessonFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def resolver():
+    resolver = mock.Mock(return_value=120)
+    with mock.patch(
+        'educa.apps.lesson.tasks.import_string', return_value=resolver
+    ):
+        yield resolver
+
+
+def test_resolve_video_duration(resolver):
+    lesson = LessonFactory(video_duration_in_seconds=None)
+    Lesson.objects.filter(id=lesson.id).update(video_duration_in_seconds=None)
+
+    duration = resolve_video_duration(lesson.id, lesson.video)
+
+    assert duration == 120
+    lesson.refresh_from_db()
+    assert lesson.video_duration_in_seconds == 120
+
+
+def test_resolve_video_duration_stores_video_metadata(resolver):
+    lesson = LessonFactory()
+    Lesson.objects.filter(id=lesson.id).update(video_duration_in_seconds=None)
+
+    resolve_video_duration(lesson.id, lesson.video)
+
+    metadata = VideoMetadata.objects.get()
+    assert metadata.video_id == '0b_dELYuf_I'
+    assert metadata.duration_in_seconds == 120
+    assert metadata.fetched_at is not None
+
+
+def test_get_video_duration_resolves_each_video_once(resolver):
+    videos = [
+        'https://www.youtube.com/watch?v=0b_dELYuf_I',
+        'https://youtu.be/0b_dELYuf_I',
+        'https://www.youtube.com/embed/0b_dELYuf_I',
+    ]
+
+    durations = [get_video_duration(video) for video in videos]
+
+    assert durations == [120, 120, 120]
+    assert resolver.call_count == 1
+    assert VideoMetadata.objects.count() == 1
+
+
+@mock.patch('educa.apps.lesson.tasks.sleep')
+def test_resolve_video_duration_retries(sleep, resolver):
+    lesson = LessonFactory()
+    Lesson.objects.filter(id=lesson.id).update(video_duration_in_seconds=None)
+    resolver.side_effect = [OSError, OSError, 90]
+
+    duration = resolve_video_duration(lesson.id, lesson.video)
+
+    assert duration == 90
+    assert resolver.call_count == 3
+    assert sleep.call_count == 2
+
+
+@mock.patch('educa.apps.lesson.tasks.sleep')
+def test_resolve_video_duration_gives_up(sleep, resolver):
+    lesson = LessonFactory()
+    Lesson.objects.filter(id=lesson.id).update(video_duration_in_seconds=None)
+    resolver.side_effect = OSError
+
+    assert resolve_video_duration(lesson.id, lesson.video) is None
+    lesson.refresh_from_db()
+    assert lesson.video_duration_in_seconds is None
+
+
+def test_resolve_video_duration_invalid_video_is_not_retried(resolver):
+    lesson = LessonFactory()
+    resolver.side_effect = ValidationError('invalid youtube video')
+
+    assert resolve_video_duration(lesson.id, lesson.video) is None
+    assert resolver.call_count == 1
+
+
+def test_resolve_video_duration_video_changed(resolver):
+    lesson = LessonFactory()
+    Lesson.objects.filter(id=lesson.id).update(video_duration_in_seconds=None)
+
+    resolve_video_duration(lesson.id, 'https://youtu.be/OZgQnRcGZXs')
+
+    lesson.refresh_from_db()
+    assert lesson.video_duration_in_seconds is None
+
+
+def test_lesson_save_schedules_video_duration(
+    settings, django_capture_on_commit_callbacks
+):
+    settings.VIDEO_DURATION_ASYNC = True
+    lesson = LessonFactory()
+    lesson.video_duration_in_seconds = None
+
+    with mock.patch('educa.apps.lesson.tasks.executor') as executor:
+        with django_capture_on_commit_callbacks(execute=True):
+            lesson.save()
+            assert lesson.video_duration_in_seconds is None
+            assert not executor.submit.called
+
+    executor.submit.assert_called_once()
+    func, *args = executor.submit.call_args.args
+    assert func is _resolve_in_background
+    assert args == [lesson.id, lesson.video]
+    resolve_video_duration(*args)
+    lesson.refresh_from_db()
+    assert lesson.video_duration_in_seconds == STUB_VIDEO_LENGTH
+
+
+def test_lesson_save_uses_video_metadata(
+    settings, django_capture_on_commit_callbacks
+):
+    settings.VIDEO_DURATION_ASYNC = True
+    VideoMetadata.objects.create(
+        video_id='0b_dELYuf_I', duration_in_seconds=42
+    )
+
+    with mock.patch('educa.apps.lesson.tasks.executor') as executor:
+        with django_capture_on_commit_callbacks(execute=True):
+            lessons = LessonFactory.create_batch(
+                3, video_duration_in_seconds=None
+            )
+
+    assert not executor.submit.called
+    assert [lesson.video_duration_in_seconds for lesson in lessons] == [42] * 3
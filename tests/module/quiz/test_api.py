@@ -6,6 +6,7 @@ from educa.apps.module.sub_apps.quiz.models import (
     QuizRelation,
 )
 from educa.apps.module.sub_apps.quiz.schema import QuestionOut, QuizOut
+from educa.apps.module.sub_apps.quiz.scoring import get_answer_key
 from tests.client import api_v1_url
 from tests.course.factories.course import CourseFactory
 from tests.module.factories.module import ModuleFactory
@@ -193,7 +194,9 @@ def test_list_quiz(client):
     response = client.get(api_v1_url('list_quiz'))
 
     assert response.status_code == 200
-    assert response.json() == [QuizOut.from_orm(quiz) for quiz in quizzes]
+    assert response.json()['items'] == [
+        QuizOut.from_orm(quiz) for quiz in quizzes
+    ]
 
 
 def test_list_quiz_filter_course_id(client):
@@ -211,7 +214,9 @@ def test_list_quiz_filter_course_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [QuizOut.from_orm(quiz) for quiz in quizzes]
+    assert response.json()['items'] == [
+        QuizOut.from_orm(quiz) for quiz in quizzes
+    ]
 
 
 def test_list_quiz_user_is_not_enrolled(client):
@@ -223,7 +228,7 @@ def test_list_quiz_user_is_not_enrolled(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json()['items'] == []
 
 
 def test_list_quiz_user_is_not_authenticated(client):
@@ -584,6 +589,104 @@ def test_quiz_check(client):
     }
 
 
+@pytest.mark.parametrize('size', [2, 20])
+def test_quiz_check_number_of_queries_is_constant(
+    size, client, django_assert_num_queries
+):
+    quiz = QuizFactory()
+    questions = QuizQuestionFactory.create_batch(size, quiz=quiz)
+    user = UserFactory()
+    user.enrolled_courses.add(quiz.course)
+    payload = {
+        'response': {
+            question.id: question.correct_response for question in questions
+        }
+    }
+
+    client.login(user)
+    client.get(api_v1_url('get_quiz', quiz_id=quiz.id))
+    with django_assert_num_queries(17):
+        response = client.post(
+            api_v1_url('check_quiz', quiz_id=quiz.id),
+            payload,
+            content_type='application/json',
+        )
+
+    assert response.status_code == 200
+    assert QuizRelation.objects.get(creator=user, quiz=quiz).done
+
+
+@pytest.mark.parametrize(
+    'endpoint, method, kwargs, payload',
+    [
+        ('update_quiz', 'patch', {}, {'pass_percent': 100}),
+        (
+            'update_quiz_question',
+            'patch',
+            {'question_id': None},
+            {'correct_response': 4},
+        ),
+        (
+            'delete_quiz_question',
+            'delete',
+            {'question_id': None},
+            None,
+        ),
+    ],
+)
+def test_quiz_write_invalidates_answer_key(
+    endpoint, method, kwargs, payload, client
+):
+    quiz = QuizFactory(pass_percent=50)
+    question = QuizQuestionFactory(quiz=quiz, correct_response=0)
+    QuizQuestionFactory(quiz=quiz, correct_response=0)
+    user = UserFactory()
+    quiz.course.instructors.add(user)
+    get_answer_key(quiz)
+    if 'question_id' in kwargs:
+        kwargs['question_id'] = question.id
+
+    client.login(user)
+    response = getattr(client, method)(
+        api_v1_url(endpoint, quiz_id=quiz.id, **kwargs),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code in (200, 204)
+    quiz.refresh_from_db()
+    assert get_answer_key(quiz) == {
+        'answers': dict(quiz.questions.values_list('id', 'correct_response')),
+        'pass_percent': quiz.pass_percent,
+        'questions_count': quiz.questions.count(),
+    }
+
+
+def test_create_quiz_question_invalidates_answer_key(client):
+    quiz = QuizFactory()
+    user = UserFactory()
+    quiz.course.instructors.add(user)
+    get_answer_key(quiz)
+    payload = {
+        'question': 'str',
+        'feedback': 'str',
+        'answers': ['str', 'str'],
+        'time_in_minutes': 1,
+        'correct_response': 1,
+        'quiz_id': quiz.id,
+    }
+
+    client.login(user)
+    response = client.post(
+        api_v1_url('create_quiz_question'),
+        payload,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 200
+    assert get_answer_key(quiz)['answers'] == {response.json()['id']: 1}
+
+
 def test_quiz_check_wrong_response(client):
     quiz = QuizFactory()
     questions = QuizQuestionFactory.create_batch(5, quiz=quiz)
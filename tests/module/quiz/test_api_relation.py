@@ -19,7 +19,7 @@ def test_list_quiz_relation(client):
     response = client.get(api_v1_url('list_quiz_relations'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuizRelationOut.from_orm(relation) for relation in relations
     ]
 
@@ -41,7 +41,7 @@ def test_list_quiz_relation_filter_course_id(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         QuizRelationOut.from_orm(relation) for relation in relations
     ]
 
@@ -0,0 +1,73 @@
+import pytest
+from ninja.errors import HttpError
+
+from educa.apps.module.sub_apps.quiz.scoring import (
+    get_answer_key,
+    invalidate_answer_key,
+    score_quiz,
+)
+from tests.module.factories.quiz import QuizFactory, QuizQuestionFactory
+
+
+@pytest.mark.django_db
+def test_get_answer_key(django_assert_num_queries):
+    quiz = QuizFactory()
+    questions = QuizQuestionFactory.create_batch(5, quiz=quiz)
+    QuizQuestionFactory.create_batch(2)
+
+    with django_assert_num_queries(1):
+        answer_key = get_answer_key(quiz)
+
+    assert answer_key == {
+        'answers': {
+            question.id: question.correct_response for question in questions
+        },
+        'pass_percent': quiz.pass_percent,
+        'questions_count': 5,
+    }
+
+
+@pytest.mark.django_db
+def test_get_answer_key_is_cached(django_assert_num_queries):
+    quiz = QuizFactory()
+    QuizQuestionFactory.create_batch(3, quiz=quiz)
+    answer_key = get_answer_key(quiz)
+
+    with django_assert_num_queries(0):
+        assert get_answer_key(quiz) == answer_key
+
+    invalidate_answer_key(quiz.id)
+    with django_assert_num_queries(1):
+        assert get_answer_key(quiz) == answer_key
+
+
+def test_score_quiz():
+    answer_key = {1: 0, 2: 3, 3: 1, 4: 2}
+
+    correct_percent, wrong_questions = score_quiz(
+        answer_key, {'4': '1', '1': '0', '3': '2', '2': '3'}
+    )
+
+    assert correct_percent == 50
+    assert wrong_questions == [4, 3]
+
+
+@pytest.mark.parametrize(
+    'response',
+    [
+        {},
+        {'1': '0'},
+        {'1': '0', '2': '3', '5': '1'},
+        {'1': '0', '01': '0', '2': '3'},
+        {'1': '0', '2': 'a', '3': '1'},
+        {'foo': '0', '2': '3', '3': '1'},
+    ],
+)
+def test_score_quiz_invalid_data(response):
+    with pytest.raises(HttpError):
+        score_quiz({1: 0, 2: 3, 3: 1}, response)
+
+
+def test_score_quiz_without_questions():
+    with pytest.raises(HttpError):
+        score_quiz({}, {})
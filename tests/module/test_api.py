@@ -111,7 +111,7 @@ def test_list_module(client):
     response = client.get(api_v1_url('list_modules'))
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ModuleOut.from_orm(module) for module in modules
     ]
 
@@ -126,7 +126,7 @@ def test_module_list_course_filter(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ModuleOut.from_orm(module) for module in modules
     ]
 
@@ -140,7 +140,7 @@ def test_module_list_title_filter(client):
     )
 
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()['items'] == [
         ModuleOut.from_orm(module) for module in modules
     ]
 
@@ -0,0 +1,125 @@
+import pytest
+from django.core.management import call_command
+
+from educa.apps.course.models import Course
+from tests.client import api_v1_url
+from tests.course.factories.course import CourseFactory
+from tests.lesson.factories.content import ContentFactory
+from tests.lesson.factories.lesson import LessonFactory
+from tests.lesson.factories.question import QuestionFactory
+from tests.user.factories.user import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def search(client, q, **params):
+    response = client.get(api_v1_url('search'), {'q': q, **params})
+    assert response.status_code == 200
+    return [(item['type'], item['id']) for item in response.json()]
+
+
+def test_search(client):
+    user = UserFactory()
+    course = CourseFactory(title='Curso de programação', description='x')
+    lesson = LessonFactory(course=course, title='Programação funcional')
+    question = QuestionFactory(
+        course=course,
+        lesson=lesson,
+        title='Dúvida',
+        content='como funciona a programação?',
+    )
+    content = ContentFactory(
+        course=course, lesson=lesson, title='Slides de programação'
+    )
+    LessonFactory(course=course, title='Banco de dados')
+    user.enrolled_courses.add(course)
+
+    client.login(user)
+    results = search(client, 'programação')
+
+    assert set(results) == {
+        ('course', course.id),
+        ('lesson', lesson.id),
+        ('question', question.id),
+        ('content', content.id),
+    }
+
+
+def test_search_ranks_title_above_text(client):
+    user = UserFactory()
+    in_text = CourseFactory(title='Culinária', description='receitas de bolo')
+    in_title = CourseFactory(title='Bolo de cenoura', description='receitas')
+
+    client.login(user)
+    results = search(client, 'bolo')
+
+    assert results == [('course', in_title.id), ('course', in_text.id)]
+
+
+def test_search_respects_enrollment(client):
+    user = UserFactory()
+    enrolled = CourseFactory()
+    instructor = CourseFactory()
+    other = CourseFactory()
+    user.enrolled_courses.add(enrolled)
+    instructor.instructors.add(user)
+    lessons = [
+        LessonFactory(course=course, title='Geometria analítica')
+        for course in (enrolled, instructor, other)
+    ]
+
+    client.login(user)
+    results = search(client, 'geometria')
+
+    assert set(results) == {
+        ('lesson', lessons[0].id),
+        ('lesson', lessons[1].id),
+    }
+
+
+def test_search_limit(client):
+    CourseFactory.create_batch(3, title='Álgebra linear')
+
+    client.login()
+    results = search(client, 'álgebra', limit=2)
+
+    assert len(results) == 2
+
+
+def test_search_is_updated_on_save(client):
+    course = CourseFactory(title='Física')
+
+    client.login()
+    assert search(client, 'química') == []
+
+    course.title = 'Química'
+    course.save()
+    assert search(client, 'química') == [('course', course.id)]
+
+
+def test_search_num_queries(client, django_assert_num_queries):
+    user = UserFactory()
+    course = CourseFactory(title='Estatística')
+    LessonFactory(course=course, title='Estatística descritiva')
+    user.enrolled_courses.add(course)
+
+    client.login(user)
+    client.get(api_v1_url('search'), {'q': 'estatística'})
+    with django_assert_num_queries(2):
+        client.get(api_v1_url('search'), {'q': 'estatística'})
+
+
+def test_search_user_is_not_authenticated(client):
+    response = client.get(api_v1_url('search'), {'q': 'python'})
+
+    assert response.status_code == 401
+
+
+def test_rebuild_search_vectors_command(client):
+    course = CourseFactory(title='Astronomia')
+    Course.objects.update(search_vector=None)
+
+    call_command('rebuild_search_vectors', batch_size=1)
+
+    client.login()
+    assert search(client, 'astronomia') == [('course', course.id)]
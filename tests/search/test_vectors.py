@@ -0,0 +1,33 @@
+import pytest
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from educa.apps.lesson.models import Lesson
+from tests.lesson.factories.lesson import LessonFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_search_vector_uses_gin_index(explain):
+    LessonFactory(title='Cálculo')
+
+    plan = explain(
+        Lesson.objects.filter(
+            search_vector=SearchQuery('cálculo', config=settings.SEARCH_CONFIG)
+        )
+    )
+
+    assert 'lesson_search_vector_idx' in plan
+
+
+def test_search_vector_is_not_updated_without_search_fields():
+    lesson = LessonFactory(title='Cálculo')
+
+    with CaptureQueriesContext(connection) as context:
+        lesson.save(update_fields=['video_duration_in_seconds'])
+
+    assert not any(
+        'to_tsvector' in query['sql'] for query in context.captured_queries
+    )
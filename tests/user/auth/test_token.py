@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from hashlib import sha256
+from unittest import mock
 
 from django.conf import settings
 from django.http import HttpRequest
 from django.utils import timezone
-from jose import jwt
+from jose import JWTError, jwt
 from pytest import mark, raises
 
 from educa.apps.user.auth.expection import InvalidToken
@@ -12,6 +14,10 @@ from educa.apps.user.auth.token import (
     TOKEN_EXPIRATION_DELTA,
     AuthBearer,
     create_jwt_access_token,
+    decode_jwt_access_token,
+    get_user_stamp,
+    token_cache,
+    user_cache,
 )
 from tests.user.factories.user import UserFactory
 
@@ -31,6 +37,8 @@ def test_create_jwt_token_access():
     )
 
     assert decoded_token.get('sub') == user.email
+    assert decoded_token.get('uid') == user.id
+    assert decoded_token.get('ver') == user.token_version
     assert decoded_token.get('name') == user.name
 
 
@@ -69,3 +77,155 @@ def test_auth_bearer_token_authentication_with_invalid_user():
 
     with raises(InvalidToken):
         auth.authenticate(request, token)
+
+
+def test_auth_bearer_caches_token_user(django_assert_num_queries):
+    auth = AuthBearer()
+    user = UserFactory()
+    token = create_jwt_access_token(user)
+    auth.authenticate(HttpRequest(), token)
+
+    request = HttpRequest()
+    with django_assert_num_queries(0):
+        auth.authenticate(request, token)
+
+    assert request.user == user
+    assert request.user is not user_cache.get(user.id)[1]
+
+
+def test_auth_bearer_legacy_token_without_user_id():
+    auth = AuthBearer()
+    request = HttpRequest()
+    user = UserFactory()
+
+    data = {
+        'sub': user.email,
+        'name': user.name,
+        'iat': datetime.utcnow(),
+        'exp': timezone.now() + TOKEN_EXPIRATION_DELTA,
+    }
+    token = jwt.encode(data, settings.SECRET_KEY, algorithm=ALGORITHM)
+    auth.authenticate(request, token)
+
+    assert request.user == user
+
+
+def test_auth_bearer_rejects_legacy_token_after_transition(settings):
+    settings.ACCEPT_UNVERSIONED_TOKENS = False
+    user = UserFactory()
+    data = {
+        'sub': user.email,
+        'name': user.name,
+        'iat': datetime.utcnow(),
+        'exp': timezone.now() + TOKEN_EXPIRATION_DELTA,
+    }
+    token = jwt.encode(data, settings.SECRET_KEY, algorithm=ALGORITHM)
+
+    with raises(InvalidToken):
+        AuthBearer().authenticate(HttpRequest(), token)
+
+
+def test_auth_bearer_change_from_another_process_invalidates_cache():
+    auth = AuthBearer()
+    user = UserFactory()
+    token = create_jwt_access_token(user)
+    auth.authenticate(HttpRequest(), token)
+    stale = user_cache.get(user.id)
+
+    user.is_active = False
+    user.save()
+    # Outro processo ainda guarda o usuário anterior no seu cache, apenas o
+    # carimbo do cache compartilhado foi trocado pela alteração.
+    user_cache.set(user.id, stale)
+
+    assert get_user_stamp(user.id) != stale[0]
+    with raises(InvalidToken):
+        auth.authenticate(HttpRequest(), token)
+
+
+def test_auth_bearer_profile_update_invalidates_cache():
+    auth = AuthBearer()
+    user = UserFactory()
+    token = create_jwt_access_token(user)
+    auth.authenticate(HttpRequest(), token)
+
+    user.bio = 'new bio'
+    user.save()
+
+    request = HttpRequest()
+    auth.authenticate(request, token)
+
+    assert user_cache.get(user.id)[1].bio == 'new bio'
+    assert request.user.bio == 'new bio'
+
+
+def test_auth_bearer_password_change_invalidates_token():
+    auth = AuthBearer()
+    user = UserFactory()
+    token = create_jwt_access_token(user)
+    auth.authenticate(HttpRequest(), token)
+
+    user.set_password('new password')
+    user.save()
+
+    with raises(InvalidToken):
+        auth.authenticate(HttpRequest(), token)
+
+    request = HttpRequest()
+    auth.authenticate(request, create_jwt_access_token(user))
+    assert request.user == user
+
+
+def test_auth_bearer_deactivated_user():
+    auth = AuthBearer()
+    user = UserFactory()
+    token = create_jwt_access_token(user)
+    auth.authenticate(HttpRequest(), token)
+
+    user.is_active = False
+    user.save()
+
+    with raises(InvalidToken):
+        auth.authenticate(HttpRequest(), token)
+
+
+def test_decode_jwt_access_token_verifies_token_once():
+    token = create_jwt_access_token(UserFactory())
+
+    with mock.patch(
+        'educa.apps.user.auth.token.jwt.decode', wraps=jwt.decode
+    ) as decode:
+        first = decode_jwt_access_token(token)
+        second = decode_jwt_access_token(token)
+
+    assert decode.call_count == 1
+    assert first == second
+
+
+def test_decode_jwt_access_token_does_not_serve_expired_token():
+    user = UserFactory()
+    data = {
+        'sub': user.email,
+        'exp': timezone.now() + timedelta(seconds=30),
+    }
+    token = jwt.encode(data, settings.SECRET_KEY, algorithm=ALGORITHM)
+    decode_jwt_access_token(token)
+
+    with mock.patch('educa.apps.user.auth.token.time', return_value=2**40):
+        with mock.patch(
+            'educa.apps.user.auth.token.jwt.decode',
+            side_effect=JWTError('expired'),
+        ):
+            with raises(JWTError):
+                decode_jwt_access_token(token)
+
+    assert token_cache.get(sha256(token.encode()).digest()) is None
+
+
+def test_decode_jwt_access_token_invalid_token_is_not_cached():
+    size = len(token_cache)
+
+    with raises(JWTError):
+        decode_jwt_access_token('token')
+
+    assert len(token_cache) == size